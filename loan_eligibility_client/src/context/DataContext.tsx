@@ -114,6 +114,8 @@ interface DataContextType {
   myScores: Score[];
   scoresOnMe: Score[];
   users: User[];
+  hasMoreMyScores: boolean;
+  hasMoreScoresOnMe: boolean;
   
   // Loading states
   loading: LoadingState;
@@ -126,6 +128,8 @@ interface DataContextType {
   fetchDashboardStats: () => Promise<void>;
   fetchMyScores: () => Promise<void>;
   fetchScoresOnMe: () => Promise<void>;
+  fetchMoreMyScores: () => Promise<void>;
+  fetchMoreScoresOnMe: () => Promise<void>;
   fetchUsers: () => Promise<void>;
   
   // Mutator functions (write operations)
@@ -161,6 +165,9 @@ export const DataProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
   const [myScores, setMyScores] = useState<Score[]>([]);
   const [scoresOnMe, setScoresOnMe] = useState<Score[]>([]);
   const [users, setUsers] = useState<User[]>([]);
+  // Cursors of the next page of each score list, null once it is fully loaded
+  const [myScoresCursor, setMyScoresCursor] = useState<string | null>(null);
+  const [scoresOnMeCursor, setScoresOnMeCursor] = useState<string | null>(null);
   
   // Loading state
   const [loading, setLoading] = useState<LoadingState>({
@@ -228,7 +235,8 @@ export const DataProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     
     try {
       const response = await api.getMyScores();
-      setMyScores(response.data);
+      setMyScores(response.data.items);
+      setMyScoresCursor(response.data.nextCursor);
     } catch (err: any) {
       const errorMessage = err.response?.data?.detail || 'Failed to fetch my scores';
       setError(prev => ({ ...prev, myScores: errorMessage }));
@@ -246,7 +254,8 @@ export const DataProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     
     try {
       const response = await api.getScoresOnMe();
-      setScoresOnMe(response.data);
+      setScoresOnMe(response.data.items);
+      setScoresOnMeCursor(response.data.nextCursor);
     } catch (err: any) {
       const errorMessage = err.response?.data?.detail || 'Failed to fetch scores on me';
       setError(prev => ({ ...prev, scoresOnMe: errorMessage }));
@@ -256,6 +265,35 @@ export const DataProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     }
   }, [currentUser]);
 
+  // Append the next page of a score list
+  const fetchMoreMyScores = useCallback(async () => {
+    if (!currentUser || !myScoresCursor) return;
+
+    try {
+      const response = await api.getMyScores(myScoresCursor);
+      setMyScores(prev => [...prev, ...response.data.items]);
+      setMyScoresCursor(response.data.nextCursor);
+    } catch (err: any) {
+      const errorMessage = err.response?.data?.detail || 'Failed to fetch my scores';
+      setError(prev => ({ ...prev, myScores: errorMessage }));
+      console.error('Failed to fetch more of my scores:', err);
+    }
+  }, [currentUser, myScoresCursor]);
+
+  const fetchMoreScoresOnMe = useCallback(async () => {
+    if (!currentUser || !scoresOnMeCursor) return;
+
+    try {
+      const response = await api.getScoresOnMe(scoresOnMeCursor);
+      setScoresOnMe(prev => [...prev, ...response.data.items]);
+      setScoresOnMeCursor(response.data.nextCursor);
+    } catch (err: any) {
+      const errorMessage = err.response?.data?.detail || 'Failed to fetch scores on me';
+      setError(prev => ({ ...prev, scoresOnMe: errorMessage }));
+      console.error('Failed to fetch more scores on me:', err);
+    }
+  }, [currentUser, scoresOnMeCursor]);
+
   const fetchUsers = useCallback(async () => {
     if (!currentUser) return;
     
@@ -403,6 +441,8 @@ export const DataProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     setMyScores([]);
     setScoresOnMe([]);
     setUsers([]);
+    setMyScoresCursor(null);
+    setScoresOnMeCursor(null);
     setError({
       profile: null,
       dashboardStats: null,
@@ -442,6 +482,8 @@ export const DataProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     myScores,
     scoresOnMe,
     users,
+    hasMoreMyScores: myScoresCursor !== null,
+    hasMoreScoresOnMe: scoresOnMeCursor !== null,
     
     // Loading states
     loading,
@@ -454,6 +496,8 @@ export const DataProvider: React.FC<{ children: ReactNode }> = ({ children }) =>
     fetchDashboardStats,
     fetchMyScores,
     fetchScoresOnMe,
+    fetchMoreMyScores,
+    fetchMoreScoresOnMe,
     fetchUsers,
     
     // Mutator functions
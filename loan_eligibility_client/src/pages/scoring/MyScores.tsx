@@ -8,7 +8,10 @@ import { useToast } from '../../context/toastContext';
 const MyScores: React.FC = () => {
   const { user } = useAuth();
   const navigate = useNavigate();
-  const { myScores, scoresOnMe, loading, error, updateScoreStatus, getUserById } = useData();
+  const {
+    myScores, scoresOnMe, hasMoreMyScores, hasMoreScoresOnMe, fetchMoreMyScores, fetchMoreScoresOnMe,
+    loading, error, updateScoreStatus, getUserById
+  } = useData();
   const { showToast } = useToast();
 
   const [activeTab, setActiveTab] = useState<'performed' | 'received'>('performed');
@@ -30,8 +33,19 @@ const MyScores: React.FC = () => {
 
   const [loanModalLoading, setLoanModalLoading] = useState(false);
   const [repaymentModalLoading, setRepaymentModalLoading] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
 
   const isLoading = loading.myScores || loading.scoresOnMe;
+  const hasMore = activeTab === 'performed' ? hasMoreMyScores : hasMoreScoresOnMe;
+
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    try {
+      await (activeTab === 'performed' ? fetchMoreMyScores() : fetchMoreScoresOnMe());
+    } finally {
+      setLoadingMore(false);
+    }
+  };
   const errorMessage = error.myScores || error.scoresOnMe;
 
   useEffect(() => {
@@ -365,6 +379,19 @@ const MyScores: React.FC = () => {
               </tbody>
             </table>
           </div>
+
+          {/* Next page of the active list */}
+          {hasMore && (
+            <div className="px-6 py-4 flex justify-center border-t border-gray-200 dark:border-gray-600 transition-colors duration-300">
+              <button
+                onClick={handleLoadMore}
+                disabled={loadingMore}
+                className="text-sky-600 dark:text-sky-400 hover:text-sky-900 dark:hover:text-sky-300 text-sm px-4 py-2 border border-sky-300 dark:border-sky-600 rounded disabled:opacity-50 transition-colors duration-300"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </div>
       </div>
 
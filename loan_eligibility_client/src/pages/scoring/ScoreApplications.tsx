@@ -45,8 +45,9 @@ const ScoreApplications: React.FC = () => {
       
       try {
         setIsLoading(true);
+        // First page of pending applications, newest first
         const response = await getPendingLoanApplications();
-        setApplications(response.data);
+        setApplications(response.data.items);
       } catch (err: any) {
         setError(err.response?.data?.detail || 'Failed to load pending loan applications');
         console.error(err);
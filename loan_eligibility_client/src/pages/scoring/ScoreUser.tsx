@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { useNavigate } from 'react-router-dom';
-import { searchUsers, performCreditScore } from '../../services/api';
+import { searchUsers, performCreditScore, getScorerThreshold } from '../../services/api';
 import { useToast } from '../../context/toastContext';
 import { useData } from '../../context/DataContext';
 import { useAuth } from '../../context/AuthContext';
@@ -55,6 +55,8 @@ export interface LoanPredictionResult {
   maxEligibleAmount: number;
   requestedAmount: number;
   explanation: string;
+  threshold?: number;
+  thresholdName?: string;
 }
 
 // interface CurrencyPair { 
@@ -79,6 +81,14 @@ const ScoreUser: React.FC = () => {
   const { user } = useAuth()
   const [decisionSaving, setDecisionSaving] = useState(false)
   const [showResults, setShowResults] = useState(false)
+  // Threshold this scorer decides with, used for both the prediction shown and the saved decision
+  const [thresholdName, setThresholdName] = useState<string | undefined>(undefined)
+
+  useEffect(() => {
+    getScorerThreshold()
+      .then(response => setThresholdName(response.data.thresholdName))
+      .catch(error => console.error('Failed to fetch decision threshold:', error));
+  }, []);
 
   const [scoreData, setScoreData] = useState<ScoreData>({
     gender: '',
@@ -219,6 +229,8 @@ const ScoreUser: React.FC = () => {
       eligibilityPercentage,
       maxEligibleAmount,
       requestedAmount,
+      threshold: scoreResult.threshold,
+      thresholdName: scoreResult.thresholdName,
     }
   }
 
@@ -252,7 +264,7 @@ const ScoreUser: React.FC = () => {
 
     try {
       setIsScoring(true);
-      const response = await performCreditScore(currencyTransformedData);
+      const response = await performCreditScore(currencyTransformedData, thresholdName);
       console.log("here is the response of the scoring", response.data)
       // const { requestedAmount, maxEligibleAmount, eligibilityPercentage } = response.data
       const result: LoanPredictionResult = processScoreResult(response.data as LoanPredictionResult)
@@ -281,6 +293,7 @@ const ScoreUser: React.FC = () => {
         scorerId: user ? user.id : "",
         score: scoreResult.originalScore,
         eligible: scoreResult.eligible,
+        thresholdName: scoreResult.thresholdName,
         ...loanDecision,
         decisionStatus: loanDecision.awarded ? DecisionStatus.AWARDED : DecisionStatus.DECLINED,
         ...processedData,
@@ -73,20 +73,43 @@ export const getUserById = async (userId: string) => {
 };
 
 // Credit Scoring API calls
-export const performCreditScore = async (scoreData: any) => {
-  return api.post('/loans/predict', scoreData);
+// threshold: name of the decision threshold to decide with (see getScorerThreshold)
+export const performCreditScore = async (scoreData: any, threshold?: string) => {
+  return api.post('/loans/predict', scoreData, { params: { threshold } });
+};
+
+// Approval probability over a grid of amounts (and optionally terms) for one applicant
+export const getEligibilityCurve = async (curveData: any) => {
+  return api.post('/loans/predict/curve', curveData);
+};
+
+// Maximum eligible amount for each loan term
+export const getEligibilityFrontier = async (frontierData: any) => {
+  return api.post('/loans/predict/frontier', frontierData);
+};
+
+// Smallest changes that would make a declined applicant eligible
+export const getCounterfactuals = async (counterfactualData: any) => {
+  return api.post('/loans/predict/counterfactuals', counterfactualData);
+};
+
+// The decision threshold the current user scores with: their own if configured, else the default
+export const getScorerThreshold = async () => {
+  return api.get('/scoring/threshold');
 };
 
 export const saveScoreResult = async (scoreData: any) => {
   return api.post('/scoring/save', scoreData);
 };
 
-export const getMyScores = async () => {
-  return api.get('/scoring/my-scores');
+// Scoring lists are paginated newest first: each response is { items, nextCursor },
+// and passing nextCursor back fetches the following page (null on the last one)
+export const getMyScores = async (cursor?: string) => {
+  return api.get('/scoring/my-scores', { params: { cursor } });
 };
 
-export const getScoresOnMe = async () => {
-  return api.get('/scoring/scores-on-me');
+export const getScoresOnMe = async (cursor?: string) => {
+  return api.get('/scoring/scores-on-me', { params: { cursor } });
 };
 
 export const getScoreById = async (scoreId: string) => {
@@ -132,12 +155,12 @@ export const getUserLoanApplications = async () => {
   return getMyScores();
 };
 
-export const getPendingLoanApplications = async () => {
-  return api.get('/scoring/pending');
+export const getPendingLoanApplications = async (cursor?: string) => {
+  return api.get('/scoring/pending', { params: { cursor } });
 };
 
-export const getScoredLoanApplications = async () => {
-  return api.get('/scoring/completed');
+export const getScoredLoanApplications = async (cursor?: string) => {
+  return api.get('/scoring/completed', { params: { cursor } });
 };
 
 export const getLoanApplication = async (loanId: string) => {
@@ -0,0 +1,150 @@
+"""
+Opt-in micro-batching for single-applicant scoring.
+
+Concurrent /loans/predict calls hand their encoded rows to a MicroBatcher,
+which scores whatever has queued up within a short window in one matrix
+call and resolves each caller's future with its own result.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Upper bounds of the latency histogram buckets, in milliseconds
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, float("inf"))
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram, safe to update from several threads"""
+
+    def __init__(self, buckets_ms: Sequence[float] = LATENCY_BUCKETS_MS):
+        self.buckets_ms = tuple(buckets_ms)
+        self._counts = [0] * len(self.buckets_ms)
+        self._total_ms = 0.0
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def observe(self, seconds: float) -> None:
+        ms = seconds * 1000
+        with self._lock:
+            for i, bound in enumerate(self.buckets_ms):
+                if ms <= bound:
+                    self._counts[i] += 1
+                    break
+            self._total_ms += ms
+            self._count += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "count": self._count,
+                "mean_ms": self._total_ms / self._count if self._count else 0.0,
+                "buckets": {
+                    ("+Inf" if bound == float("inf") else f"{bound:g}"): count
+                    for bound, count in zip(self.buckets_ms, self._counts)
+                },
+            }
+
+
+class MicroBatcher:
+    """
+    Coalesces items submitted from many threads into batches of at most
+    `max_batch_size`, waiting no longer than `max_wait` seconds after the
+    first item of a batch arrived. `score_batch` receives the list of items
+    and must return one result per item, in order.
+    """
+
+    def __init__(
+        self,
+        score_batch: Callable[[List[Any]], Sequence[Any]],
+        max_batch_size: int = 32,
+        max_wait: float = 0.002,
+    ):
+        self.score_batch = score_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue: "queue.Queue[Optional[Tuple[Any, Future, float]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        # Time each item spent queued before its batch was scored
+        self.queue_latency = LatencyHistogram()
+        # Time spent in score_batch per batch
+        self.model_latency = LatencyHistogram()
+        self.batches = 0
+        self.items = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._thread = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        if not self.running:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def submit(self, item: Any) -> Future:
+        """Queue one item; the returned future resolves to its score_batch result"""
+        if not self.running:
+            raise RuntimeError("MicroBatcher is not running")
+        future: Future = Future()
+        self._queue.put((item, future, time.perf_counter()))
+        return future
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = first[2] + self.max_wait
+            stopping = False
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                try:
+                    entry = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is None:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            self._score(batch)
+            if stopping:
+                return
+
+    def _score(self, batch: List[Tuple[Any, Future, float]]) -> None:
+        started = time.perf_counter()
+        for _, _, submitted in batch:
+            self.queue_latency.observe(started - submitted)
+        try:
+            results = self.score_batch([item for item, _, _ in batch])
+        except Exception as e:
+            for _, future, _ in batch:
+                future.set_exception(e)
+            return
+        finally:
+            self.model_latency.observe(time.perf_counter() - started)
+            self.batches += 1
+            self.items += len(batch)
+        for (_, future, _), result in zip(batch, results):
+            future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "batches": self.batches,
+            "items": self.items,
+            "queue_latency": self.queue_latency.snapshot(),
+            "model_latency": self.model_latency.snapshot(),
+        }
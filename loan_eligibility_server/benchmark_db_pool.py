@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark /users/me with a shared Prisma client against connect-per-request.
+
+Starts the API under uvicorn once with DB_SHARED_CLIENT=0 (a new client and
+query engine per request) and once with the shared client, registers a
+throwaway user, then fires concurrent authenticated /users/me calls and
+reports throughput and latency percentiles. Needs DATABASE_URL pointing at
+a database with the schema applied.
+
+    python benchmark_db_pool.py --requests 500 --concurrency 16 --connection-limit 10
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import numpy as np
+
+
+def start_server(port: int, env: dict) -> subprocess.Popen:
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=os.path.dirname(os.path.abspath(__file__)), env=env,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/health").raise_for_status()
+            return server
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    server.kill()
+    raise SystemExit("API did not start within 60s")
+
+
+def access_token(base_url: str) -> str:
+    email, password = f"bench-{uuid.uuid4().hex[:12]}@example.com", uuid.uuid4().hex
+    httpx.post(f"{base_url}/auth/register", json={"email": email, "password": password}).raise_for_status()
+    response = httpx.post(f"{base_url}/auth/token", data={"username": email, "password": password})
+    response.raise_for_status()
+    return response.json()["accessToken"]
+
+
+def run(base_url: str, token: str, requests: int, concurrency: int):
+    latencies = []
+    errors = 0
+
+    with httpx.Client(base_url=base_url, headers={"Authorization": f"Bearer {token}"}, timeout=60) as client:
+        def one(_):
+            nonlocal errors
+            started = time.perf_counter()
+            if client.get("/users/me").status_code != 200:
+                errors += 1
+            latencies.append(time.perf_counter() - started)
+
+        one(None)  # warm-up
+        latencies.clear()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(one, range(requests)))
+        elapsed = time.perf_counter() - started
+
+    ms = np.array(latencies) * 1000
+    return requests / elapsed, np.percentile(ms, 50), np.percentile(ms, 99), errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--connection-limit", type=int, help="DB_CONNECTION_LIMIT for the shared client")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    print(f"requests: {args.requests}, concurrency: {args.concurrency}")
+    print(f"{'client':<12} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'errors':>8}")
+    # /users/me only needs the auth and profile routes; skip loading the model
+    env = dict(os.environ, API_ROUTERS="auth,profiles")
+    if args.connection_limit:
+        env["DB_CONNECTION_LIMIT"] = str(args.connection_limit)
+    for name, shared in (("per-request", "0"), ("shared", "1")):
+        server = start_server(args.port, dict(env, DB_SHARED_CLIENT=shared))
+        try:
+            base_url = f"http://127.0.0.1:{args.port}"
+            throughput, p50, p99, errors = run(base_url, access_token(base_url), args.requests, args.concurrency)
+            print(f"{name:<12} {throughput:>10.0f} {p50:>10.2f} {p99:>10.2f} {errors:>8}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Break down the import time of the API with `python -X importtime`.
+
+Imports the app in fresh interpreters and reports the total import time and
+the top-level packages (including the app's own modules) that take longest
+to import. With --budget-ms the exit status is non-zero when the median
+total exceeds the budget, so the check can run in CI to catch startup
+regressions.
+
+    python benchmark_import_time.py --runs 5 --top 15
+    python benchmark_import_time.py --routers auth,profiles --budget-ms 400
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+import numpy as np
+
+
+def import_times(module: str, env: dict):
+    """{top-level package: microseconds} and the total for one cold import"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        env=env, check=True, capture_output=True, text=True,
+    ).stderr
+    packages = defaultdict(int)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        # Self time charged to the top-level package, so nested imports are not counted twice
+        packages[name.strip().split(".")[0]] += int(self_us)
+    total = sum(packages.values())
+    return packages, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--routers", help="API_ROUTERS to mount, e.g. auth,profiles (default: all)")
+    parser.add_argument("--budget-ms", type=float, help="fail if the median total exceeds this")
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    if args.routers is not None:
+        env["API_ROUTERS"] = args.routers
+
+    runs = [import_times(args.module, env) for _ in range(args.runs)]
+    total_ms = np.median([total for _, total in runs]) / 1000
+    names = set().union(*(packages for packages, _ in runs))
+    medians = {name: np.median([packages.get(name, 0) for packages, _ in runs]) / 1000 for name in names}
+
+    print(f"import {args.module}: {total_ms:.1f} ms (median of {args.runs})")
+    print(f"{'package':<24} {'ms':>8} {'share':>7}")
+    for name, ms in sorted(medians.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"{name:<24} {ms:>8.1f} {ms / total_ms:>7.1%}")
+    for heavy in ("sklearn", "joblib", "pandas"):
+        if heavy in names:
+            print(f"warning: {heavy} is imported at startup")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        print(f"import time {total_ms:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
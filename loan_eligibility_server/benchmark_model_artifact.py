@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark cold start for the pickled and JSON model artifacts.
+
+Each format is loaded in fresh interpreters, as a new container would, and
+the benchmark reports the time from interpreter start-up to the first
+prediction, peak RSS, and whether sklearn ended up imported.
+
+    python benchmark_model_artifact.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import numpy as np
+
+from export_model import export
+
+MODEL_PATH = "./loan_elig_predictor_new"
+
+# Runs in a fresh interpreter; everything from `import scoring` on is cold start
+# Peak RSS comes from VmHWM: ru_maxrss survives exec and would report this
+# (sklearn-importing) parent's peak instead
+CHILD = """
+import json, sys, time
+started = time.perf_counter()
+from scoring import load_model, smoke_rows
+model = load_model(sys.argv[1])
+model.predict_proba(smoke_rows(1))
+seconds = time.perf_counter() - started
+with open("/proc/self/status") as f:
+    peak_kb = next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+print(json.dumps({
+    "seconds": seconds,
+    "rss_mb": peak_kb / 1024,
+    "sklearn": "sklearn" in sys.modules,
+}))
+"""
+
+
+def cold_start(path: str, runs: int):
+    here = os.path.dirname(os.path.abspath(__file__))
+    results = [
+        json.loads(subprocess.run(
+            [sys.executable, "-c", CHILD, path], cwd=here, check=True, capture_output=True, text=True
+        ).stdout)
+        for _ in range(runs)
+    ]
+    return (
+        np.median([r["seconds"] for r in results]) * 1000,
+        np.median([r["rss_mb"] for r in results]),
+        results[0]["sklearn"],
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--model", default=MODEL_PATH)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "loan_elig_predictor.json")
+        export(args.model, json_path)
+        model_path = os.path.abspath(args.model)
+
+        print(f"{'format':<8} {'bytes':>8} {'load ms':>10} {'RSS MB':>8} {'sklearn':>8}")
+        for name, path in (("pickle", model_path), ("json", json_path)):
+            ms, rss, sklearn = cold_start(path, args.runs)
+            print(f"{name:<8} {os.path.getsize(path):>8} {ms:>10.1f} {rss:>8.1f} {str(sklearn):>8}")
+
+
+if __name__ == "__main__":
+    main()
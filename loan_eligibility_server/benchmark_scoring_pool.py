@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark in-thread scoring against the process-pool backend.
+
+Fires concurrent single-applicant scoring calls (what /loans/predict does)
+from a thread pool and reports throughput and latency percentiles for both
+backends. The linear model is cheap enough that the pool mostly measures IPC
+overhead; pass --trees to benchmark a random forest fitted on synthetic data
+instead, which is the CPU-heavy case the pool is meant for.
+
+    python benchmark_scoring_pool.py --requests 2000 --concurrency 16
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import joblib
+import numpy as np
+
+from scoring import FEATURE_NAMES, N_FEATURES, load_model, score_matrix
+from scoring_pool import ProcessPoolScorer
+
+MODEL_PATH = "./loan_elig_predictor_new"
+
+
+def random_rows(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    X = rng.integers(0, 2, size=(n, N_FEATURES)).astype(np.float64)
+    X[:, 2] = rng.integers(0, 4, size=n)
+    X[:, 5:9] = np.log1p(rng.uniform(0, 10000, size=(n, 4)))
+    X[:, 10] = rng.integers(0, 3, size=n)
+    return X
+
+
+def tree_model_path(directory: str) -> str:
+    """Fit a random forest on synthetic rows and save it like the real artifact"""
+    import pandas as pd
+    from sklearn.ensemble import RandomForestClassifier
+
+    X = random_rows(5000, seed=1)
+    y = (X[:, 5] - X[:, 7] + X[:, 9] > 3).astype(int)
+    forest = RandomForestClassifier(n_estimators=200, random_state=0)
+    forest.fit(pd.DataFrame(X, columns=FEATURE_NAMES), y)
+    path = os.path.join(directory, "forest_predictor")
+    joblib.dump(forest, path)
+    return path
+
+
+def run(score, rows: np.ndarray, concurrency: int):
+    latencies = []
+
+    def one(i):
+        started = time.perf_counter()
+        score(rows[i:i + 1], [float(np.expm1(rows[i, 7]))])
+        latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(len(rows))))
+    elapsed = time.perf_counter() - started
+    ms = np.array(latencies) * 1000
+    return len(rows) / elapsed, np.percentile(ms, 50), np.percentile(ms, 99)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--trees", action="store_true", help="benchmark a random forest instead of the shipped model")
+    args = parser.parse_args()
+
+    rows = random_rows(args.requests)
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = tree_model_path(tmp) if args.trees else MODEL_PATH
+        model = load_model(model_path)
+        pool = ProcessPoolScorer(model_path, workers=args.workers, timeout=30)
+        pool.warm_up()
+
+        print(f"model: {type(model).__name__}, requests: {args.requests}, "
+              f"concurrency: {args.concurrency}, workers: {pool.workers}")
+        print(f"{'backend':<10} {'req/s':>10} {'p50 ms':>10} {'p99 ms':>10}")
+        for name, score in (
+            ("thread", lambda r, a: score_matrix(model, r, a)),
+            ("process", pool.score),
+        ):
+            throughput, p50, p99 = run(score, rows, args.concurrency)
+            print(f"{name:<10} {throughput:>10.0f} {p50:>10.2f} {p99:>10.2f}")
+        pool.shutdown()
+
+
+if __name__ == "__main__":
+    main()
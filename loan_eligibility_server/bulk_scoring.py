@@ -0,0 +1,188 @@
+"""
+Chunked scoring of large applicant files.
+
+Records (raw dicts from NDJSON lines or CSV rows) are validated as LoanDto,
+encoded into a reused (chunk_size, N_FEATURES) buffer and scored one chunk
+per model call, so memory stays bounded by the chunk size however many rows
+the input has. Used by the /loans/predict/stream endpoint and score_file.py.
+"""
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from pydantic import ValidationError
+
+from loanModel import LoanDto
+from scoring import N_FEATURES, FeatureEncoder
+
+DEFAULT_CHUNK_SIZE = 1000
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv"
+
+# A CSV record whose quotes are still open after this many lines is rejected
+MAX_CSV_RECORD_LINES = 100
+
+INVALID_UTF8 = "Invalid UTF-8"
+
+# Columns of every result row, in CSV order
+RESULT_FIELDS = (
+    "index", "eligible", "originalScore", "eligibilityPercentage", "maxEligibleAmount", "requestedAmount", "error"
+)
+
+# (scores, eligible, max_amounts) for an encoded chunk and its requested amounts
+ChunkScorer = Callable[[np.ndarray, List[float]], Tuple[np.ndarray, np.ndarray, np.ndarray]]
+
+
+class ChunkedLoanScorer:
+    """Validates, encodes and scores records `chunk_size` at a time with `score`"""
+
+    def __init__(self, encoder: FeatureEncoder, score: ChunkScorer, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.encoder = encoder
+        self.score = score
+        self.chunk_size = chunk_size
+        self._buffer = np.empty((chunk_size, N_FEATURES), dtype=np.float64)
+
+    def score_chunk(self, records: List[Tuple[int, Any]]) -> List[Dict[str, Any]]:
+        """
+        Score up to chunk_size (index, record) pairs. A record is a dict of
+        LoanDto fields, or an error message when it could not be parsed.
+        Returns one result per record, in order.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(records)
+        loans: List[LoanDto] = []
+        positions: List[int] = []
+        for position, (index, record) in enumerate(records):
+            if isinstance(record, str):
+                results[position] = error_result(index, record)
+                continue
+            try:
+                loans.append(LoanDto.model_validate(record))
+                positions.append(position)
+            except ValidationError as e:
+                results[position] = error_result(index, format_validation_error(e))
+
+        if loans:
+            loan_data = self.encoder.encode_many(loans, out=self._buffer[:len(loans)])
+            scores, eligible, max_amounts = self.score(loan_data, [loan.loanAmount for loan in loans])
+            for position, loan, score, loan_eligible, max_amount in zip(
+                    positions, loans, scores.tolist(), eligible.tolist(), max_amounts.tolist()):
+                results[position] = {
+                    "index": records[position][0],
+                    "eligible": bool(loan_eligible),
+                    "originalScore": score,
+                    "eligibilityPercentage": round(score * 100, 2),
+                    "maxEligibleAmount": round(max_amount, 2),
+                    "requestedAmount": loan.loanAmount,
+                    "error": None,
+                }
+        return results
+
+
+def error_result(index: int, message: str) -> Dict[str, Any]:
+    return {field: None for field in RESULT_FIELDS} | {"index": index, "error": message}
+
+
+def format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(part) for part in e['loc']) or 'record'}: {e['msg']}"
+        for e in error.errors(include_url=False, include_context=False)
+    )
+
+
+def decode_line(line: bytes) -> Tuple[str, bool]:
+    """(text, valid): bytes that are not UTF-8 are replaced rather than failing the whole body"""
+    line = line.rstrip(b"\r")
+    try:
+        return line.decode("utf-8-sig"), True
+    except UnicodeDecodeError:
+        return line.decode("utf-8-sig", errors="replace"), False
+
+
+async def aiter_lines(body: AsyncIterator[bytes]) -> AsyncIterator[Tuple[str, bool]]:
+    """
+    Split a streamed request body into (line, valid UTF-8) pairs without
+    buffering more than one partial line
+    """
+    pending = b""
+    async for data in body:
+        pending += data
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield decode_line(line)
+    if pending:
+        yield decode_line(pending)
+
+
+def parse_ndjson_line(line: str, valid: bool = True) -> Any:
+    """A record dict, or an error message for lines that are not a JSON object"""
+    if not valid:
+        return INVALID_UTF8
+    try:
+        record = json.loads(line)
+    except json.JSONDecodeError as e:
+        return f"Invalid JSON: {e.msg}"
+    return record if isinstance(record, dict) else "Expected a JSON object"
+
+
+async def aiter_csv_rows(lines: AsyncIterator[Tuple[str, bool]]) -> AsyncIterator[Union[List[str], str]]:
+    """
+    Group lines into CSV records, so quoted fields may span lines, and yield
+    each record's values, or an error message for records that are not valid
+    UTF-8 or whose quotes never close. Blank lines between records are skipped.
+    """
+    pending: List[str] = []
+    valid = True
+    quotes = 0
+    async for line, line_valid in lines:
+        if not pending and not line.strip():
+            continue
+        pending.append(line + "\n")
+        valid = valid and line_valid
+        quotes += line.count('"')
+        # An odd number of quotes so far means a quoted field is still open
+        if quotes % 2 and len(pending) < MAX_CSV_RECORD_LINES:
+            continue
+        if not valid:
+            yield INVALID_UTF8
+        elif quotes % 2:
+            yield f"Quoted field not closed within {MAX_CSV_RECORD_LINES} lines"
+        else:
+            yield next(csv.reader(pending))
+        pending, valid, quotes = [], True, 0
+    if pending:
+        yield INVALID_UTF8 if not valid else "Quoted field not closed at end of body"
+
+
+def parse_csv_header(values: List[str]) -> List[str]:
+    return [column.strip() for column in values]
+
+
+def parse_csv_row(header: List[str], values: List[str]) -> Any:
+    """A record dict with empty cells as missing values, or an error message"""
+    if len(values) != len(header):
+        return f"Expected {len(header)} columns, got {len(values)}"
+    return {column: value for column, value in zip(header, values) if value != ""}
+
+
+def missing_loan_columns(header: Sequence[str]) -> List[str]:
+    """Required LoanDto fields absent from a file's columns"""
+    return [
+        name for name, field in LoanDto.model_fields.items()
+        if field.is_required() and name not in header
+    ]
+
+
+def format_ndjson(results: List[Dict[str, Any]]) -> str:
+    return "".join(json.dumps(result) + "\n" for result in results)
+
+
+def format_csv(results: List[Dict[str, Any]], header: bool = False, fields: Sequence[str] = RESULT_FIELDS) -> str:
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=fields, lineterminator="\n")
+    if header:
+        writer.writeheader()
+    writer.writerows(results)
+    return out.getvalue()
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Check that every CreditAssessment query the API runs is served by an index.
+
+Seeds a local Postgres (DATABASE_URL, with the schema applied through
+`prisma db push`) with synthetic users and assessments, runs EXPLAIN on the
+queries behind the scoring and dashboard endpoints, and fails when any plan
+reads the table with a sequential scan. Never point it at a real database:
+--seed deletes and recreates the seed-*@example.com users and their rows.
+
+    python check_query_plans.py --seed --rows 1000000
+    python check_query_plans.py --analyze
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import uuid
+from typing import Any, Dict, Iterator, List, Tuple
+
+from prisma import Prisma
+
+from pagination import DEFAULT_PAGE_SIZE
+from routers.dashboard import DASHBOARD_STATS_QUERY
+
+TABLE = '"CreditAssessment"'
+SEED_EMAIL = "seed-%@example.com"
+
+# The lists are paginated newest first (pagination.py): a page is the next
+# limit + 1 rows after the cursor, the (createdAt, id) of the previous page's
+# last row
+PAGE = f'ORDER BY "createdAt" DESC, id DESC LIMIT {DEFAULT_PAGE_SIZE + 1}'
+AFTER_CURSOR = '("createdAt" < {created_at} OR ("createdAt" = {created_at} AND id < {assessment}))'
+
+# (endpoint, query), with {user} replaced by a seeded user id. Statuses follow
+# a realistic mix: most assessments are decided, a few percent are pending.
+QUERIES: List[Tuple[str, str]] = [
+    ("/scoring/my-scores", f'SELECT * FROM {TABLE} WHERE "scorerId" = {{user}} {PAGE}'),
+    ("/scoring/my-scores (next page)",
+     f'SELECT * FROM {TABLE} WHERE "scorerId" = {{user}} AND {AFTER_CURSOR} {PAGE}'),
+    ("/scoring/scores-on-me", f'SELECT * FROM {TABLE} WHERE "scoreduserId" = {{user}} {PAGE}'),
+    ("/scoring/pending", f'SELECT * FROM {TABLE} WHERE "decisionStatus" = \'PENDING\' {PAGE}'),
+    ("/scoring/completed",
+     f'SELECT * FROM {TABLE} WHERE ("decisionStatus" = \'AWARDED\' OR "decisionStatus" = \'DECLINED\') {PAGE}'),
+    ("/scoring/{scoreId}", f"SELECT * FROM {TABLE} WHERE id = {{assessment}}"),
+    # One statement for the counts and the recent scores
+    ("/dashboard/stats", DASHBOARD_STATS_QUERY.replace("$1", "{user}")),
+]
+
+# Seed user g gets the id md5('seed-user-g') as a UUID, so assessments can
+# pick random users without looking them up
+SEED_USER_ID = "md5('seed-user-' || {number})::uuid::text"
+
+SEED_USERS = f"""
+INSERT INTO "User" (id, email, password, "createdAt", "updatedAt")
+SELECT {SEED_USER_ID.format(number="g")}, 'seed-' || g || '@example.com', 'seed', now(), now()
+FROM generate_series(1, {{users}}) AS g
+"""
+
+SEED_ASSESSMENTS = f"""
+WITH draws AS (
+    SELECT random() AS status, random() AS outcome
+    FROM generate_series(1, {{rows}})
+)
+INSERT INTO {TABLE} (
+    id, "scoreduserId", "scorerId", amount, term, gender, "maritalStatus", dependents, education,
+    "employmentStatus", income, "coApplicantIncome", "creditHistory", "propertyArea", score, eligible,
+    "decisionStatus", "outcomeStatus", "createdAt", "updatedAt"
+)
+SELECT
+    gen_random_uuid()::text,
+    {SEED_USER_ID.format(number="(1 + floor(random() * {users})::int)")},
+    {SEED_USER_ID.format(number="(1 + floor(random() * {users})::int)")},
+    round((random() * 1000)::numeric, 2), 360, 'MALE', 'SINGLE', 0, 'GRADUATE', 'EMPLOYED',
+    round((random() * 5000)::numeric, 2), 0, true, 'URBAN', random(), random() < 0.5,
+    (CASE WHEN status < 0.05 THEN 'PENDING' WHEN status < 0.5 THEN 'AWARDED'
+          WHEN status < 0.95 THEN 'DECLINED' ELSE 'AWARDED_AND_TAKEN' END)::"DecisionStatus",
+    (CASE WHEN outcome < 0.6 THEN 'IN_PROGRESS' WHEN outcome < 0.9 THEN 'PAID' ELSE 'DEFAULTED' END)::"LoanOutcome",
+    now() - random() * interval '730 days',
+    now()
+FROM draws
+"""
+
+
+async def seed(db: Prisma, rows: int, users: int, batch: int = 100_000) -> None:
+    await db.execute_raw(
+        f'DELETE FROM {TABLE} WHERE "scorerId" IN (SELECT id FROM "User" WHERE email LIKE \'{SEED_EMAIL}\') '
+        f'OR "scoreduserId" IN (SELECT id FROM "User" WHERE email LIKE \'{SEED_EMAIL}\')'
+    )
+    await db.execute_raw(f"DELETE FROM \"User\" WHERE email LIKE '{SEED_EMAIL}'")
+    await db.execute_raw(SEED_USERS.format(users=users))
+    for start in range(0, rows, batch):
+        await db.execute_raw(SEED_ASSESSMENTS.format(rows=min(batch, rows - start), users=users))
+        print(f"seeded {min(start + batch, rows)}/{rows} assessments", file=sys.stderr)
+
+
+def plan_nodes(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def quoted_id(value: str) -> str:
+    # Ids are inlined so EXPLAIN plans for the actual value; they must be UUIDs
+    return f"'{uuid.UUID(value)}'"
+
+
+async def check(db: Prisma, analyze: bool) -> bool:
+    await db.execute_raw(f"ANALYZE {TABLE}")
+    total = (await db.query_raw(f"SELECT COUNT(*) AS n FROM {TABLE}"))[0]["n"]
+    # A busy scorer: the case most likely to tip the planner into a sequential scan
+    sample = (await db.query_raw(
+        f'SELECT "scorerId" AS scorer, MAX(id) AS assessment FROM {TABLE} '
+        f'WHERE "scorerId" IS NOT NULL GROUP BY "scorerId" ORDER BY COUNT(*) DESC LIMIT 1'
+    ))[0]
+    assessment = quoted_id(sample["assessment"])
+    # The sample assessment doubles as the cursor for the next-page query
+    created_at = (await db.query_raw(
+        f'SELECT "createdAt"::text AS created_at FROM {TABLE} WHERE id = {assessment}'
+    ))[0]["created_at"]
+    values = {
+        "user": quoted_id(sample["scorer"]),
+        "assessment": assessment,
+        "created_at": f"'{created_at}'::timestamp",
+    }
+
+    print(f"{TABLE}: {total} rows")
+    print(f"{'endpoint':<34} {'access':<40} {'ok':>4}")
+    ok = True
+    explain = "EXPLAIN (ANALYZE, FORMAT JSON)" if analyze else "EXPLAIN (FORMAT JSON)"
+    for endpoint, query in QUERIES:
+        result = await db.query_raw(f"{explain} {query.format(**values)}")
+        plan = result[0]["QUERY PLAN"]
+        plan = (json.loads(plan) if isinstance(plan, str) else plan)[0]["Plan"]
+        scans = [
+            f"{node['Node Type']} {node.get('Index Name', '')}".strip()
+            for node in plan_nodes(plan)
+            if "Scan" in node["Node Type"] and node.get("Relation Name") == TABLE.strip('"')
+        ]
+        # Joined tables (User, Profile) are looked up for a handful of rows
+        # and may be small enough in a seeded database to scan
+        indexed = bool(scans) and not any(scan.startswith("Seq Scan") for scan in scans)
+        ok &= indexed
+        print(f"{endpoint:<34} {', '.join(scans):<40} {'yes' if indexed else 'NO':>4}")
+    return ok
+
+
+async def run(args) -> bool:
+    db = Prisma()
+    await db.connect()
+    try:
+        if args.seed:
+            await seed(db, args.rows, args.users)
+        return await check(db, args.analyze)
+    finally:
+        await db.disconnect()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--seed", action="store_true", help="(re)create the synthetic rows first")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--users", type=int, default=20_000)
+    parser.add_argument("--analyze", action="store_true", help="EXPLAIN ANALYZE, i.e. actually run the queries")
+    args = parser.parse_args()
+
+    if not asyncio.run(run(args)):
+        print("Some queries are not served by an index")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
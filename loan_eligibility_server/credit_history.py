@@ -0,0 +1,135 @@
+"""
+Table-driven credit history assessment.
+
+Every combination of bank transaction frequency, lending frequency and loan
+purpose is scored once, up front, from a weight spec. Assessing an applicant
+is then a single table lookup, and whole columns of applicants can be
+assessed with one fancy-indexing operation. The single-applicant path is
+plain Python, so the profile routes can use it without importing NumPy;
+the column path imports it on first use.
+"""
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Enum levels in prisma/schema.prisma order; a level's position is its code
+TRANSACTION_FREQUENCIES = ('NONE', 'LESS_THAN_5', 'OVER_5')
+LENDING_FREQUENCIES = ('NONE', 'LESS_THAN_5', 'OVER_5')
+LOAN_PURPOSES = (
+    'BUSINESS_INVESTMENT', 'RENTS_AND_BILLS', 'CAR_PURCHASE', 'BUILDING_PURCHASE',
+    'EDUCATION', 'MEDICAL_EMERGENCY', 'OTHER',
+)
+
+# Code used for a missing answer; missing answers always assess as False
+MISSING = -1
+
+DEFAULT_WEIGHTS: Dict[str, Any] = {
+    # Bank transactions scoring (0-40 points)
+    'bankTransactions': {
+        'NONE': 0,  # No banking activity is concerning
+        'LESS_THAN_5': 20,  # Some banking activity is positive
+        'OVER_5': 40,  # High banking activity suggests financial engagement
+    },
+    # Lending history scoring (0-35 points)
+    'lendingHistory': {
+        'NONE': 0,  # No lending history means no track record
+        'LESS_THAN_5': 35,  # Moderate lending suggests responsible borrowing
+        'OVER_5': 15,  # Too much lending might indicate financial stress
+    },
+    # Loan purpose scoring (0-25 points)
+    'loanPurpose': {
+        'BUSINESS_INVESTMENT': 25,  # Investment loans suggest financial planning
+        'RENTS_AND_BILLS': 10,  # Bills might indicate financial stress but shows responsibility
+        'CAR_PURCHASE': 15,  # Asset purchase is reasonable
+        'BUILDING_PURCHASE': 18,  # Real estate investment is positive
+        'EDUCATION': 20,  # Education loans are generally positive
+        'MEDICAL_EMERGENCY': 8,  # Emergency loans are necessary but indicate vulnerability
+        'OTHER': 5,  # Unknown purpose is less favorable
+    },
+    # Credit history is considered good if the score reaches this (out of 100)
+    'passScore': 60,
+}
+
+
+def _level(value) -> Optional[str]:
+    # Accept prisma enum members as well as their raw string values
+    return getattr(value, 'value', value)
+
+
+def encode_levels(values: Sequence, levels: Sequence[str]) -> 'np.ndarray':
+    """Map enum members or strings to their codes, with MISSING for None or unknown values"""
+    import numpy as np
+    codes = {level: code for code, level in enumerate(levels)}
+    return np.fromiter(
+        (codes.get(_level(value), MISSING) for value in values), dtype=np.intp, count=len(values))
+
+
+class CreditHistoryAssessor:
+    """
+    Precomputed 3 x 3 x 7 table of credit history outcomes, indexed by
+    (bankTransactions, lendingHistory, loanPurpose) codes.
+    """
+
+    def __init__(self, weights: Dict[str, Any] = DEFAULT_WEIGHTS):
+        pass_score = weights['passScore']
+        # Nested lists, indexed [bank][lending][purpose]
+        self._outcomes = [
+            [
+                [bank + lending + purpose >= pass_score
+                 for purpose in (weights['loanPurpose'][level] for level in LOAN_PURPOSES)]
+                for lending in (weights['lendingHistory'][level] for level in LENDING_FREQUENCIES)
+            ]
+            for bank in (weights['bankTransactions'][level] for level in TRANSACTION_FREQUENCIES)
+        ]
+        self._table: Optional['np.ndarray'] = None
+        self._bank_codes = {level: code for code, level in enumerate(TRANSACTION_FREQUENCIES)}
+        self._lending_codes = {level: code for code, level in enumerate(LENDING_FREQUENCIES)}
+        self._purpose_codes = {level: code for code, level in enumerate(LOAN_PURPOSES)}
+
+    def __call__(self, bank_transactions, lending_history, loan_purpose) -> bool:
+        """
+        Assess one applicant. Returns True if they likely have good credit
+        history; any missing answer defaults to False for safety.
+        """
+        bank = self._bank_codes.get(_level(bank_transactions))
+        lending = self._lending_codes.get(_level(lending_history))
+        purpose = self._purpose_codes.get(_level(loan_purpose))
+        if bank is None or lending is None or purpose is None:
+            return False
+        return self._outcomes[bank][lending][purpose]
+
+    @property
+    def table(self) -> 'np.ndarray':
+        """The outcomes as a boolean array, built on first vectorized use"""
+        if self._table is None:
+            import numpy as np
+            self._table = np.array(self._outcomes, dtype=bool)
+        return self._table
+
+    def assess_codes(
+        self, bank_codes: 'np.ndarray', lending_codes: 'np.ndarray', purpose_codes: 'np.ndarray'
+    ) -> 'np.ndarray':
+        """Vectorized assessment of code columns; rows with any MISSING code assess as False"""
+        import numpy as np
+        complete = (bank_codes >= 0) & (lending_codes >= 0) & (purpose_codes >= 0)
+        return complete & self.table[
+            np.where(complete, bank_codes, 0),
+            np.where(complete, lending_codes, 0),
+            np.where(complete, purpose_codes, 0),
+        ]
+
+    def assess_many(
+        self, bank_transactions: Sequence, lending_history: Sequence, loan_purposes: Sequence
+    ) -> 'np.ndarray':
+        """Vectorized assessment of columns of enum members or strings"""
+        return self.assess_codes(
+            encode_levels(bank_transactions, TRANSACTION_FREQUENCIES),
+            encode_levels(lending_history, LENDING_FREQUENCIES),
+            encode_levels(loan_purposes, LOAN_PURPOSES),
+        )
+
+
+# Credit history is derived from banking behavior and loan patterns through a
+# precomputed lookup table; see DEFAULT_WEIGHTS for the scoring
+assess_credit_history = CreditHistoryAssessor()
@@ -0,0 +1,160 @@
+"""
+Shared Prisma client.
+
+Connecting a Prisma client starts and handshakes a query engine, so each
+worker process keeps one connected client for its lifetime instead of
+connecting per request. The engine holds a pool of database connections,
+sized with DB_CONNECTION_LIMIT (Prisma's default is 2 * CPUs + 1) and
+DB_POOL_TIMEOUT seconds to wait for a free connection. The client uses
+Prisma's asyncio interface, so a request waiting on Postgres holds no
+thread. A background task runs `SELECT 1` every DB_HEALTH_INTERVAL seconds
+and reconnects when the engine or database stopped answering.
+
+Set DB_SHARED_CLIENT=0 to connect per request as before, e.g. to compare
+the two with benchmark_db_pool.py.
+"""
+import asyncio
+import os
+import time
+from datetime import timedelta
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from prisma import Prisma
+
+DB_SHARED_CLIENT = os.getenv("DB_SHARED_CLIENT", "1") == "1"
+
+
+def pooled_url(url: str, connection_limit: Optional[int], pool_timeout: Optional[float]) -> str:
+    """DATABASE_URL with Prisma's pool parameters set, keeping any others"""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    if connection_limit is not None:
+        query["connection_limit"] = str(connection_limit)
+    if pool_timeout is not None:
+        query["pool_timeout"] = f"{pool_timeout:g}"
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class Database:
+    """
+    One Prisma client shared by every request in this process.
+
+    `get_client()` returns the connected client, connecting it first if
+    needed. `ping()` checks it with a trivial query and reconnects once on
+    failure. Everything runs on the event loop the app serves requests on.
+    """
+
+    def __init__(
+        self,
+        connection_limit: Optional[int] = None,
+        pool_timeout: Optional[float] = None,
+        connect_timeout: float = 10.0,
+        health_interval: float = 30.0,
+    ):
+        self.connection_limit = connection_limit
+        self.pool_timeout = pool_timeout
+        self.connect_timeout = connect_timeout
+        self.health_interval = health_interval
+        self._client: Optional[Prisma] = None
+        self._lock = asyncio.Lock()
+        self._probe_task: Optional[asyncio.Task] = None
+        self.connects = 0
+        self.reconnects = 0
+        self.last_probe_ms: Optional[float] = None
+        self.last_error: Optional[str] = None
+
+    def _new_client(self) -> Prisma:
+        url = os.getenv("DATABASE_URL")
+        if url and (self.connection_limit is not None or self.pool_timeout is not None):
+            return Prisma(datasource={"url": pooled_url(url, self.connection_limit, self.pool_timeout)})
+        return Prisma()
+
+    async def connect(self) -> Prisma:
+        async with self._lock:
+            if self._client is None or not self._client.is_connected():
+                client = self._new_client()
+                await client.connect(timeout=timedelta(seconds=self.connect_timeout))
+                self._client = client
+                self.connects += 1
+            return self._client
+
+    async def disconnect(self) -> None:
+        async with self._lock:
+            client, self._client = self._client, None
+        if client is not None and client.is_connected():
+            try:
+                await client.disconnect()
+            except Exception as e:
+                print(f"Database disconnect error: {e}")
+
+    async def reconnect(self) -> Prisma:
+        await self.disconnect()
+        self.reconnects += 1
+        return await self.connect()
+
+    async def get_client(self) -> Prisma:
+        client = self._client
+        if client is not None and client.is_connected():
+            return client
+        return await self.connect()
+
+    async def ping(self) -> bool:
+        """Run SELECT 1, reconnecting and retrying once if it fails"""
+        for attempt in range(2):
+            try:
+                started = time.perf_counter()
+                client = await (self.get_client() if attempt == 0 else self.reconnect())
+                await client.query_raw("SELECT 1")
+                self.last_probe_ms = (time.perf_counter() - started) * 1000
+                self.last_error = None
+                return True
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"Database health probe failed: {e}")
+        return False
+
+    async def start(self) -> None:
+        """Connect and start probing; a failed first connect is retried by the probe"""
+        try:
+            await self.connect()
+        except Exception as e:
+            self.last_error = str(e)
+            print(f"Database connect error: {e}")
+        if self.health_interval > 0 and self._probe_task is None:
+            self._probe_task = asyncio.create_task(self._probe(), name="db-health")
+
+    async def stop(self) -> None:
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
+        await self.disconnect()
+
+    async def _probe(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            await self.ping()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "shared_client": DB_SHARED_CLIENT,
+            "connected": self._client is not None and self._client.is_connected(),
+            "connection_limit": self.connection_limit,
+            "pool_timeout": self.pool_timeout,
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "last_probe_ms": self.last_probe_ms,
+            "last_error": self.last_error,
+        }
+
+
+database = Database(
+    connection_limit=int(os.getenv("DB_CONNECTION_LIMIT", "0")) or None,
+    pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "0")) or None,
+    connect_timeout=float(os.getenv("DB_CONNECT_TIMEOUT", "10")),
+    health_interval=float(os.getenv("DB_HEALTH_INTERVAL", "30")),
+)
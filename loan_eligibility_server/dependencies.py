@@ -0,0 +1,109 @@
+"""Database and authentication dependencies shared by the routers"""
+from typing import Optional
+from fastapi import Depends, HTTPException, Query, status
+from fastapi.security import OAuth2PasswordBearer
+from prisma import Prisma
+from datetime import datetime, timedelta
+import jwt  # PyJWT for JWT operations
+from passlib.context import CryptContext
+from database import DB_SHARED_CLIENT, database
+from loanModel import TokenData
+from pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, Page, decode_cursor
+from thresholds import DecisionThreshold, decision_thresholds
+
+# Security utilities
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
+# In production, use environment variable
+SECRET_KEY = "THIS IS THE KEY FOR THE FINAL YEAR PROJECT VERSION1.000 WITH SOME ADDITIONAL 12-3492840-23"
+ALGORITHM = "HS256"
+ACCESS_TOKEN_EXPIRE_MINUTES = 60*24  # 24 hours
+
+# Database connection helper
+
+
+async def get_db():
+    if DB_SHARED_CLIENT:
+        # The process-wide client opened at startup; reconnects if it was dropped
+        try:
+            db = await database.get_client()
+        except Exception as e:
+            raise HTTPException(status_code=503, detail=f"Database unavailable: {e}")
+        yield db
+        return
+
+    db = Prisma()
+    try:
+        await db.connect()
+        yield db
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        try:
+            await db.disconnect()
+        except Exception as disconnect_error:
+            print(f"Database disconnect error: {disconnect_error}")
+
+
+def get_threshold(threshold: Optional[str] = None) -> DecisionThreshold:
+    """Resolve the ?threshold= query parameter to a named decision threshold"""
+    resolved = decision_thresholds.get(threshold)
+    if resolved is None:
+        # Configured names include scorers' user ids, so they are not listed back to callers
+        raise HTTPException(status_code=400, detail="Unknown decision threshold")
+    return resolved
+
+
+def get_page(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None
+) -> Page:
+    """Resolve ?limit= and ?cursor= (a previous page's nextCursor) to a page of a list"""
+    if cursor is None:
+        return Page(limit)
+    try:
+        return Page(limit, decode_cursor(cursor))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+# Authentication utilities
+
+
+def verify_password(plain_password, hashed_password):
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def get_password_hash(password):
+    return pwd_context.hash(password)
+
+
+def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
+    to_encode = data.copy()
+    if expires_delta:
+        expire = datetime.utcnow() + expires_delta
+    else:
+        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    to_encode.update({"exp": expire})
+    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return encoded_jwt
+
+
+async def get_current_user(token: str = Depends(oauth2_scheme), db: Prisma = Depends(get_db)):
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        user_id: str = payload.get("sub")
+        print(payload, 'trying to decode token')
+        if user_id is None:
+            raise credentials_exception
+        token_data = TokenData(id=user_id, email=payload.get("email"))
+    except Exception:
+        raise credentials_exception
+    user = await db.user.find_unique(where={"id": token_data.id})
+    if user is None:
+        raise credentials_exception
+    return user
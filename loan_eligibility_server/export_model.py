@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Export a pickled linear model to the pickle-free JSON artifact format.
+
+The exported file is read with NumPy only, so a server loading it never
+imports sklearn or joblib. Export next to the pickle with a name the model
+registry picks up, e.g.
+
+    python export_model.py loan_elig_predictor_new loan_elig_predictor_new.json
+"""
+
+import argparse
+
+import numpy as np
+
+from scoring import LinearScorer, artifact_version, load_model, smoke_rows
+
+
+def export(source: str, destination: str) -> LinearScorer:
+    scorer = load_model(source)
+    if not isinstance(scorer, LinearScorer):
+        raise SystemExit(f"{source} holds a {type(scorer).__name__}; only linear models can be exported")
+    scorer.save(destination, source_version=artifact_version(source))
+
+    # The JSON floats must round-trip exactly
+    exported = LinearScorer.load(destination)
+    rows = smoke_rows()
+    if not np.array_equal(exported.predict_proba(rows), scorer.predict_proba(rows)):
+        raise SystemExit(f"{destination} does not reproduce {source}")
+    return exported
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("source", help="pickled model, e.g. loan_elig_predictor_new")
+    parser.add_argument("destination", help="JSON artifact to write")
+    args = parser.parse_args()
+
+    export(args.source, args.destination)
+    print(f"Exported {args.source} ({artifact_version(args.source)}) "
+          f"to {args.destination} ({artifact_version(args.destination)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, EmailStr, Field, validator
-from typing import Optional, List
+from typing import Annotated, Optional, List
 from enum import Enum
 from datetime import datetime
 from prisma.enums import (
@@ -140,6 +140,8 @@ class CreditAssessmentResponse(BaseModel):
     propertyArea: PropertyArea
     score: Optional[float] = None
     eligible: Optional[bool] = None
+    eligibilityThreshold: Optional[float] = None  # Probability cut-off eligible was decided with
+    thresholdName: Optional[str] = None
     decisionStatus: Optional[DecisionStatus] = DecisionStatus.PENDING
     awardedAmount: Optional[float] = None
     dueDate: Optional[datetime] = None
@@ -152,6 +154,16 @@ class CreditAssessmentResponse(BaseModel):
     class Config:
         from_attributes = True
 
+
+class ScorerThresholdResponse(BaseModel):
+    threshold: float  # Probability an applicant must reach to be eligible
+    thresholdName: str
+
+
+class CreditAssessmentPage(BaseModel):
+    items: List[CreditAssessmentResponse]
+    nextCursor: Optional[str] = None  # Pass as ?cursor= for the next page; None on the last page
+
 # Keep legacy models for backward compatibility
 class LoanApplicationCreate(LoanDto):
     pass
@@ -163,6 +175,12 @@ class LoanApplicationResponse(CreditAssessmentResponse):
     pass
 
 
+class FeatureContribution(BaseModel):
+    feature: str
+    value: float  # Encoded value the model saw
+    contribution: float  # Effect on the log-odds of approval
+
+
 class LoanPredictionResponse(BaseModel):
     eligible: bool
     originalScore: float
@@ -170,6 +188,76 @@ class LoanPredictionResponse(BaseModel):
     maxEligibleAmount: float
     requestedAmount: float
     explanation: str
+    threshold: Optional[float] = None  # Probability cut-off eligible was decided with
+    thresholdName: Optional[str] = None
+    contributions: Optional[List[FeatureContribution]] = None  # Ranked by impact, only when requested
+    modelVersion: Optional[str] = None  # Artifact version that produced this prediction
+
+
+class LoanCurveRequest(BaseModel):
+    loan: LoanDto
+    minAmount: float = Field(0, ge=0)
+    maxAmount: Optional[float] = Field(None, gt=0)  # Defaults to the requested amount plus the search span
+    points: int = Field(101, ge=2, le=1000)
+    terms: Optional[List[Annotated[int, Field(gt=0)]]] = Field(None, min_length=1, max_length=24)  # Defaults to loanTerm
+
+
+class LoanCurveResponse(BaseModel):
+    amounts: List[float]
+    terms: List[int]
+    probabilities: List[List[float]]  # probabilities[i][j] is for terms[i] and amounts[j]
+    threshold: float
+    thresholdName: Optional[str] = None
+    modelVersion: Optional[str] = None
+
+
+class LoanFrontierRequest(BaseModel):
+    loan: LoanDto
+    terms: Optional[List[Annotated[int, Field(gt=0)]]] = Field(None, min_length=1, max_length=48)  # Defaults to the standard term set
+
+
+class FrontierPoint(BaseModel):
+    term: int
+    maxEligibleAmount: float
+
+
+class LoanFrontierResponse(BaseModel):
+    requestedAmount: float
+    frontier: List[FrontierPoint]
+    modelVersion: Optional[str] = None
+
+
+class LoanCounterfactualRequest(BaseModel):
+    loan: LoanDto
+    maxResults: int = Field(5, ge=1, le=20)
+
+
+class CounterfactualChange(BaseModel):
+    field: str  # LoanDto field: coApplicantIncome, loanTerm, loanAmount or dependents
+    fromValue: float
+    toValue: float
+
+
+class Counterfactual(BaseModel):
+    changes: List[CounterfactualChange]
+    score: float
+    loan: LoanDto  # The applicant with the changes applied
+
+
+class LoanCounterfactualResponse(BaseModel):
+    eligible: bool  # Already eligible as submitted; counterfactuals is then empty
+    originalScore: float
+    threshold: float
+    thresholdName: Optional[str] = None
+    candidatesEvaluated: int
+    counterfactuals: List[Counterfactual]
+    modelVersion: Optional[str] = None
+
+
+class LoanBatchPredictionItem(BaseModel):
+    index: int  # Position of the applicant in the submitted list
+    prediction: Optional[LoanPredictionResponse] = None
+    errors: Optional[List[dict]] = None  # Validation errors when the applicant was rejected
 
 
 class RecentScore(BaseModel):
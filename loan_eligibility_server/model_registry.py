@@ -0,0 +1,166 @@
+"""
+Versioned model registry with hot reload.
+
+The registry watches a directory for model artifacts. When the newest one
+changes it is loaded, validated and warmed off the request path, and only
+then swapped in as the active model. Handlers take a reference to the
+ActiveModel once per request, so requests already in flight finish on the
+model they started with.
+"""
+import glob
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from scoring import LOAN_AMOUNT, artifact_version, load_model, score_matrix, smoke_rows
+
+
+def newest_artifact(model_dir: str, pattern: str) -> Optional[str]:
+    """The most recently modified file matching `pattern` in `model_dir`, the one the registry serves"""
+    candidates = [
+        path for path in glob.glob(os.path.join(model_dir, pattern))
+        if os.path.isfile(path)
+    ]
+    return max(candidates, key=os.path.getmtime) if candidates else None
+
+
+@dataclass
+class ActiveModel:
+    model: Any
+    version: str
+    path: str
+    loaded_at: datetime
+    # Backend-specific resources tied to this model, e.g. a process pool
+    resources: Dict[str, Any] = field(default_factory=dict)
+
+
+class ModelRegistry:
+    """
+    Loads the newest artifact matching `pattern` in `model_dir`.
+
+    `prepare` runs on a validated candidate before it goes live (e.g. to start
+    worker processes for it); `retire` runs on the previous model after the
+    swap; `on_swap` runs with the new model once it is live.
+    """
+
+    def __init__(
+        self,
+        model_dir: str = ".",
+        pattern: str = "loan_elig_predictor*",
+        backend: str = "numpy",
+        poll_interval: float = 10.0,
+        prepare: Optional[Callable[[ActiveModel], None]] = None,
+        retire: Optional[Callable[[ActiveModel], None]] = None,
+        on_swap: Optional[Callable[[ActiveModel], None]] = None,
+    ):
+        self.model_dir = model_dir
+        self.pattern = pattern
+        self.backend = backend
+        self.poll_interval = poll_interval
+        self.prepare = prepare
+        self.retire = retire
+        self.on_swap = on_swap
+        self._active: Optional[ActiveModel] = None
+        self._signature: Optional[Tuple[str, float, int]] = None
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_error: Optional[str] = None
+        self.history: List[str] = []
+
+    @property
+    def active(self) -> Optional[ActiveModel]:
+        return self._active
+
+    def _newest_artifact(self) -> Optional[str]:
+        return newest_artifact(self.model_dir, self.pattern)
+
+    def reload(self) -> bool:
+        """
+        Load the newest artifact if it changed since the last attempt.
+        Returns True if a new model went live. A candidate that fails to load,
+        validate or warm up leaves the current model in place.
+        """
+        with self._reload_lock:
+            path = self._newest_artifact()
+            if path is None:
+                self.last_error = f"No model artifact matching {self.pattern} in {self.model_dir}"
+                return False
+            stat = os.stat(path)
+            signature = (path, stat.st_mtime, stat.st_size)
+            if signature == self._signature:
+                return False
+            self._signature = signature
+
+            try:
+                candidate = ActiveModel(
+                    model=load_model(path, self.backend),
+                    version=artifact_version(path),
+                    path=path,
+                    loaded_at=datetime.utcnow(),
+                )
+                if self._active is not None and candidate.version == self._active.version:
+                    return False
+                self._warm_up(candidate)
+                if self.prepare is not None:
+                    self.prepare(candidate)
+            except Exception as e:
+                self.last_error = f"{os.path.basename(path)}: {e}"
+                print(f"Error loading model: {self.last_error}")
+                return False
+
+            previous, self._active = self._active, candidate
+            self.last_error = None
+            self.history.append(candidate.version)
+            print(f"Model {candidate.version} loaded from {path} ({type(candidate.model).__name__})")
+
+        if self.on_swap is not None:
+            self.on_swap(candidate)
+        if previous is not None and self.retire is not None:
+            self.retire(previous)
+        return True
+
+    @staticmethod
+    def _warm_up(candidate: ActiveModel) -> None:
+        """Dummy predictions through the real scoring path; rejects models producing invalid scores"""
+        rows = smoke_rows()
+        scores, _, amounts = score_matrix(candidate.model, rows, np.expm1(rows[:, LOAN_AMOUNT]))
+        if not (np.all(np.isfinite(scores)) and np.all((scores >= 0) & (scores <= 1))):
+            raise ValueError("Model produced probabilities outside [0, 1]")
+        if not np.all(np.isfinite(amounts)):
+            raise ValueError("Model produced non-finite max eligible amounts")
+
+    def start_watching(self) -> None:
+        if self.poll_interval <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._watch, name="model-registry", daemon=True)
+        self._thread.start()
+
+    def stop_watching(self) -> None:
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.reload()
+            except Exception as e:
+                print(f"Model watcher error: {e}")
+
+    def status(self) -> Dict[str, Any]:
+        active = self._active
+        return {
+            "active_version": active.version if active else None,
+            "path": active.path if active else None,
+            "loaded_at": active.loaded_at.isoformat() if active else None,
+            "last_error": self.last_error,
+            "history": self.history[-10:],
+        }
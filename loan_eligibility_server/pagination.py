@@ -0,0 +1,70 @@
+"""
+Keyset pagination for the credit assessment lists.
+
+Lists are ordered newest first by (createdAt, id), which the
+CreditAssessment indexes serve, and a page is the `limit` rows after the
+cursor. The cursor is the (createdAt, id) of the last row of the previous
+page, so fetching any page reads `limit + 1` index entries however deep
+into the list it is, unlike OFFSET. Clients treat it as an opaque string.
+"""
+import base64
+import binascii
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_PAGE_SIZE = int(os.getenv("SCORES_PAGE_SIZE", "50"))
+MAX_PAGE_SIZE = int(os.getenv("SCORES_MAX_PAGE_SIZE", "200"))
+
+# Newest first; id breaks ties between rows created in the same millisecond
+PAGE_ORDER = [{"createdAt": "desc"}, {"id": "desc"}]
+
+
+def encode_cursor(created_at: datetime, last_id: str) -> str:
+    payload = json.dumps([created_at.isoformat(), last_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """(createdAt, id) of a cursor; raises ValueError when it is not one of ours"""
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, last_id = json.loads(payload)
+        return datetime.fromisoformat(created_at), str(last_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+class Page:
+    """A requested page: its size and the position to continue after"""
+
+    def __init__(self, limit: int = DEFAULT_PAGE_SIZE, after: Optional[Tuple[datetime, str]] = None):
+        self.limit = limit
+        self.after = after
+
+    def where(self, where: Dict[str, Any]) -> Dict[str, Any]:
+        """`where` restricted to the rows after the cursor"""
+        if self.after is None:
+            return where
+        created_at, last_id = self.after
+        return {
+            "AND": [
+                where,
+                {"OR": [
+                    {"createdAt": {"lt": created_at}},
+                    {"createdAt": created_at, "id": {"lt": last_id}},
+                ]},
+            ]
+        }
+
+    def find_many_args(self, where: Dict[str, Any]) -> Dict[str, Any]:
+        # One extra row tells whether there is a next page
+        return {"where": self.where(where), "order": PAGE_ORDER, "take": self.limit + 1}
+
+    def split(self, rows: List[Any]) -> Tuple[List[Any], Optional[str]]:
+        """The page's rows and the cursor of the next page, if there is one"""
+        if len(rows) <= self.limit:
+            return rows, None
+        rows = rows[:self.limit]
+        return rows, encode_cursor(rows[-1].createdAt, rows[-1].id)
@@ -0,0 +1,8 @@
+import os
+
+# Routers mounted by this process. API_ROUTERS can narrow it (e.g. to
+# "auth,profiles") so that workers not serving /loans never import the
+# scoring subsystem or load the model.
+ROUTERS = ("auth", "profiles", "loans", "scoring", "dashboard")
+API_ROUTERS = [name.strip() for name in os.getenv("API_ROUTERS", ",".join(ROUTERS)).split(",") if name.strip()]
+SCORING_ENABLED = "loans" in API_ROUTERS
@@ -0,0 +1,58 @@
+"""Registration and login routes"""
+from datetime import timedelta
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.security import OAuth2PasswordRequestForm
+from prisma import Prisma
+from prisma.types import UserCreateInput
+from loanModel import UserCreate, UserResponse, Token
+from dependencies import (
+    ACCESS_TOKEN_EXPIRE_MINUTES, create_access_token, get_db, get_password_hash, verify_password
+)
+
+router = APIRouter()
+
+# Authentication routes
+
+
+@router.post("/auth/register", response_model=UserResponse, tags=["Authentication"])
+async def register_user(user: UserCreate, db: Prisma = Depends(get_db)):
+    print('trying to register user:', user.email)
+    # Check if user already exists
+    db_user = await db.user.find_unique(where={"email": user.email})
+    if db_user:
+        raise HTTPException(status_code=400, detail="Email already registered")
+
+    # bcrypt is deliberately slow; keep it off the event loop
+    hashed_password = await run_in_threadpool(get_password_hash, user.password)
+    user_data: UserCreateInput = {
+        "email": user.email,
+        "password": hashed_password,
+    }
+    created_user = await db.user.create(data=user_data)
+
+    # Convert database object to response model with proper field mapping
+    return UserResponse(
+        id=created_user.id,
+        email=created_user.email,
+        createdAt=created_user.createdAt
+    )
+
+
+@router.post("/auth/token", response_model=Token, tags=["Authentication"])
+async def login_for_access_token(form_data: OAuth2PasswordRequestForm = Depends(), db: Prisma = Depends(get_db)):
+    user = await db.user.find_unique(where={"email": form_data.username})
+    if not user or not await run_in_threadpool(verify_password, form_data.password, user.password):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    accessToken = create_access_token(
+        data={"sub": user.id, "email": user.email},
+        expires_delta=access_token_expires
+    )
+
+    return {"accessToken": accessToken, "tokenType": "bearer"}
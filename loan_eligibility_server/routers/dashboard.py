@@ -0,0 +1,81 @@
+"""Dashboard statistics route"""
+from fastapi import APIRouter, Depends
+from prisma import Prisma
+from prisma.models import User
+from loanModel import DashboardStats, RecentScore
+from dependencies import get_current_user, get_db
+
+router = APIRouter()
+
+# Every count comes from one pass over the user's assessments (the rows they
+# scored or were scored in), and the last 5 assessments they initiated are
+# joined onto that single row, so the dashboard costs one round trip. The
+# counts and the recent scores also come from the same snapshot.
+DASHBOARD_STATS_QUERY = """
+WITH stats AS (
+    SELECT
+        COUNT(*) FILTER (WHERE "scorerId" = $1) AS "totalScoresPerformed",
+        COUNT(*) FILTER (WHERE "scoreduserId" = $1) AS "totalScoresReceived",
+        COUNT(*) FILTER (WHERE "decisionStatus" = 'AWARDED') AS "totalLoansTracked",
+        COUNT(*) FILTER (WHERE "outcomeStatus" = 'PAID') AS "successfulRepayments",
+        COUNT(*) FILTER (WHERE "decisionStatus" = 'PENDING') AS "pendingLoans"
+    FROM "CreditAssessment"
+    WHERE "scorerId" = $1 OR "scoreduserId" = $1
+), recent AS (
+    SELECT a.id, a.score, a."createdAt", a."decisionStatus", p."fullName", u.email
+    FROM "CreditAssessment" AS a
+    LEFT JOIN "User" AS u ON u.id = a."scoreduserId"
+    LEFT JOIN "Profile" AS p ON p."userId" = u.id
+    WHERE a."scorerId" = $1
+    ORDER BY a."createdAt" DESC
+    LIMIT 5
+)
+SELECT stats.*, recent.*
+FROM stats LEFT JOIN recent ON true
+ORDER BY recent."createdAt" DESC
+"""
+
+# Dashboard statistics endpoint
+
+
+@router.get("/dashboard/stats", response_model=DashboardStats, tags=["Dashboard"])
+async def get_dashboard_stats(
+    current_user: User = Depends(get_current_user),
+    db: Prisma = Depends(get_db)
+):
+    """Get dashboard statistics for the current user"""
+
+    # One row per recent score (or a single row with no recent score), each
+    # carrying the same counts
+    rows = await db.query_raw(DASHBOARD_STATS_QUERY, current_user.id)
+    stats = rows[0]
+
+    # Convert to recent scores format
+    recent_scores = []
+    for row in rows:
+        if row["id"] is None:
+            continue
+        # Get scored user name from profile or email
+        scored_user_name = "Unknown User"
+        if row["fullName"]:
+            scored_user_name = row["fullName"]
+        elif row["email"]:
+            scored_user_name = row["email"].split('@')[0]
+
+        recent_scores.append(RecentScore(
+            id=row["id"],
+            scoredUserName=scored_user_name,
+            score=row["score"] or 0.0,
+            # Raw queries return timestamps as ISO strings, not datetimes
+            date=row["createdAt"],
+            decisionStatus=row["decisionStatus"]
+        ))
+
+    return DashboardStats(
+        totalScoresPerformed=stats["totalScoresPerformed"],
+        totalScoresReceived=stats["totalScoresReceived"],
+        totalLoansTracked=stats["totalLoansTracked"],
+        successfulRepayments=stats["successfulRepayments"],
+        pendingLoans=stats["pendingLoans"],
+        recentScores=recent_scores
+    )
@@ -0,0 +1,378 @@
+"""Loan eligibility prediction routes"""
+import os
+from typing import Any, List, Optional
+import numpy as np
+from fastapi import APIRouter, Body, Depends, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
+from loanModel import (
+    LoanDto, LoanPredictionResponse, LoanBatchPredictionItem, LoanCurveRequest, LoanCurveResponse,
+    LoanFrontierRequest, LoanFrontierResponse, FrontierPoint, LoanCounterfactualRequest,
+    LoanCounterfactualResponse
+)
+from bulk_scoring import (
+    CSV_MEDIA_TYPE, NDJSON_MEDIA_TYPE, aiter_csv_rows, aiter_lines, format_csv, format_ndjson,
+    missing_loan_columns, parse_csv_header, parse_csv_row, parse_ndjson_line
+)
+from dependencies import get_threshold
+from scoring import (
+    FRONTIER_TERMS, MAX_AMOUNT_SEARCH_SPAN, decide, eligibility_frontier, find_counterfactuals, model_proba,
+    probability_surface
+)
+from scoring_service import (
+    build_counterfactuals, build_prediction_response, chunked_loan_scorer, explain_loan_matrix, feature_encoder, find_maximum_eligible_amount,
+    prediction_cache, prediction_cache_key, process_loan_data_for_prediction, require_model,
+    score_loan_matrix, shadow_score_loan
+)
+from thresholds import DecisionThreshold
+
+router = APIRouter()
+
+# Larger /loans/predict-batch bodies are rejected with 413; /loans/predict/stream has no limit
+MAX_BATCH_SIZE = int(os.getenv("PREDICT_BATCH_MAX_SIZE", "1000"))
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse for bodies generated while the request body is still
+    being read. The base class listens for client disconnects on receive(),
+    which would race the handler's request.stream() for the body; here a
+    disconnect surfaces through request.stream() instead.
+    """
+
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+
+# Loan prediction and application routes
+
+
+@router.post("/loans/predict", response_model=LoanPredictionResponse, tags=["Loans"])
+def predict_loan_eligibility(
+    loan: LoanDto,
+    explain: bool = False,
+    threshold: DecisionThreshold = Depends(get_threshold)
+):
+    active = require_model()
+
+    cache_key = prediction_cache_key(loan, active.version, threshold.name, explain)
+    cached = prediction_cache.get(cache_key)
+    if cached is not None:
+        shadow_score_loan(loan, cached.originalScore, threshold)
+        return cached
+
+    # Score the requested amount and find the maximum eligible amount in one pass
+    max_eligible_amount, orig_score, eligible = find_maximum_eligible_amount(loan, loan.loanAmount, active, threshold)
+    contributions = explain_loan_matrix(active.model, process_loan_data_for_prediction(loan))[0] if explain else None
+    response = build_prediction_response(
+        loan, orig_score, eligible, max_eligible_amount, threshold, contributions, active.version)
+    prediction_cache.put(cache_key, response)
+    shadow_score_loan(loan, orig_score, threshold)
+    return response
+
+
+@router.post("/loans/predict/curve", response_model=LoanCurveResponse, tags=["Loans"])
+def predict_eligibility_curve(curve: LoanCurveRequest, threshold: DecisionThreshold = Depends(get_threshold)):
+    """
+    Approval probability over an evenly spaced grid of amounts (and optionally
+    several terms) for one applicant, so clients can interpolate locally
+    instead of calling /loans/predict for every amount.
+    """
+    active = require_model()
+
+    loan = curve.loan
+    max_amount = curve.maxAmount if curve.maxAmount is not None else loan.loanAmount + MAX_AMOUNT_SEARCH_SPAN
+    if max_amount <= curve.minAmount:
+        raise HTTPException(status_code=400, detail="maxAmount must be greater than minAmount")
+    terms = curve.terms or [loan.loanTerm]
+
+    amounts = np.linspace(curve.minAmount, max_amount, curve.points)
+    loan_data = process_loan_data_for_prediction(loan)
+    probabilities = probability_surface(model_proba(active.model), loan_data[0], amounts, terms)
+
+    return LoanCurveResponse(
+        amounts=np.round(amounts, 2).tolist(),
+        terms=terms,
+        probabilities=probabilities.tolist(),
+        threshold=threshold.probability,
+        thresholdName=threshold.name,
+        modelVersion=active.version
+    )
+
+
+@router.post("/loans/predict/frontier", response_model=LoanFrontierResponse, tags=["Loans"])
+def predict_eligibility_frontier(frontier: LoanFrontierRequest, threshold: DecisionThreshold = Depends(get_threshold)):
+    """Maximum eligible amount for each loan term, e.g. "X over 12 months or Y over 36 months" """
+    active = require_model()
+
+    loan = frontier.loan
+    terms = sorted(set(frontier.terms or FRONTIER_TERMS))
+    loan_data = process_loan_data_for_prediction(loan)
+    max_amounts, _ = eligibility_frontier(active.model, loan_data[0], terms, loan.loanAmount, threshold.cutoff)
+
+    return LoanFrontierResponse(
+        requestedAmount=loan.loanAmount,
+        frontier=[
+            FrontierPoint(term=term, maxEligibleAmount=float(amount))
+            for term, amount in zip(terms, max_amounts)
+        ],
+        modelVersion=active.version
+    )
+
+
+@router.post("/loans/predict/counterfactuals", response_model=LoanCounterfactualResponse, tags=["Loans"])
+def predict_counterfactuals(
+    request: LoanCounterfactualRequest,
+    threshold: DecisionThreshold = Depends(get_threshold)
+):
+    """
+    Smallest changes to co-applicant income, term, amount and dependents that
+    would make a declined applicant eligible. Every candidate combination is
+    scored in a single model call.
+    """
+    active = require_model()
+
+    loan = request.loan
+    loan_data = process_loan_data_for_prediction(loan)
+    scores, decisions = decide(active.model, loan_data, threshold.cutoff)
+    orig_score, eligible = float(scores[0]), bool(decisions[0])
+    counterfactuals, evaluated = [], 0
+    if not eligible:
+        values, scores, evaluated = find_counterfactuals(
+            active.model, loan_data[0], request.maxResults, threshold.cutoff)
+        counterfactuals = build_counterfactuals(loan, values, scores)
+
+    return LoanCounterfactualResponse(
+        eligible=eligible,
+        originalScore=orig_score,
+        threshold=threshold.probability,
+        thresholdName=threshold.name,
+        candidatesEvaluated=evaluated,
+        counterfactuals=counterfactuals,
+        modelVersion=active.version
+    )
+
+
+@router.post("/loans/predict-batch", response_model=List[LoanBatchPredictionItem], tags=["Loans"])
+def predict_loan_eligibility_batch(
+    loans: List[Any] = Body(...),
+    explain: bool = False,
+    threshold: DecisionThreshold = Depends(get_threshold)
+):
+    """
+    Score a list of up to MAX_BATCH_SIZE applicants in one model call. Results
+    keep the input order; applicants that fail validation get their errors
+    instead of a prediction. Use /loans/predict/stream for larger files.
+    """
+    # Checked here rather than with Body(max_length=...), whose 422 echoes the whole body back
+    if len(loans) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {MAX_BATCH_SIZE} loans per batch; use /loans/predict/stream for larger files")
+    active = require_model()
+
+    results: List[Optional[LoanBatchPredictionItem]] = [None] * len(loans)
+    valid_loans: List[LoanDto] = []
+    valid_indexes: List[int] = []
+    for index, item in enumerate(loans):
+        try:
+            valid_loans.append(LoanDto.model_validate(item))
+            valid_indexes.append(index)
+        except ValidationError as e:
+            results[index] = LoanBatchPredictionItem(
+                index=index, errors=e.errors(include_url=False, include_context=False))
+
+    if valid_loans:
+        loan_data = feature_encoder.encode_many(valid_loans)
+        scores, eligible, max_amounts = score_loan_matrix(
+            active, loan_data, [loan.loanAmount for loan in valid_loans], threshold.cutoff)
+        contributions = explain_loan_matrix(active.model, loan_data) if explain else [None] * len(valid_loans)
+        for index, loan, score, loan_eligible, max_amount, loan_contributions in zip(
+                valid_indexes, valid_loans, scores, eligible, max_amounts, contributions):
+            results[index] = LoanBatchPredictionItem(
+                index=index,
+                prediction=build_prediction_response(
+                    loan, float(score), bool(loan_eligible), float(max_amount), threshold,
+                    loan_contributions, active.version)
+            )
+
+    return results
+
+
+@router.post("/loans/predict/stream", tags=["Loans"])
+async def predict_loan_eligibility_stream(request: Request, threshold: DecisionThreshold = Depends(get_threshold)):
+    """
+    Score an NDJSON (application/x-ndjson) or CSV (text/csv, with a header row
+    of LoanDto field names) body of applicants, streaming results back in the
+    same format as each chunk is scored. Results carry the applicant's index
+    among the non-blank input records; rejected records get an error instead
+    of a score. Results start arriving before the upload finishes, so clients
+    must read the response while sending (e.g. curl -T file.ndjson).
+    """
+    active = require_model()
+
+    media_type = request.headers.get("content-type", NDJSON_MEDIA_TYPE).split(";")[0].strip()
+    if media_type not in (NDJSON_MEDIA_TYPE, CSV_MEDIA_TYPE):
+        raise HTTPException(status_code=415, detail=f"Expected {NDJSON_MEDIA_TYPE} or {CSV_MEDIA_TYPE}")
+
+    lines = aiter_lines(request.stream())
+    header = None
+    if media_type == CSV_MEDIA_TYPE:
+        rows = aiter_csv_rows(lines)
+        first_row = await anext(rows, None)
+        if first_row is None:
+            raise HTTPException(status_code=400, detail="CSV body is missing its header row")
+        if isinstance(first_row, str):
+            raise HTTPException(status_code=400, detail=f"Invalid CSV header row: {first_row}")
+        header = parse_csv_header(first_row)
+        missing = missing_loan_columns(header)
+        if missing:
+            raise HTTPException(status_code=400, detail=f"CSV header is missing columns: {', '.join(missing)}")
+
+    scorer = chunked_loan_scorer(active, threshold)
+
+    def score_chunk(chunk):
+        results = scorer.score_chunk(chunk)
+        return format_csv(results) if header else format_ndjson(results)
+
+    async def records():
+        # Non-blank input records, each a dict of LoanDto fields or an error message
+        if header:
+            async for row in rows:
+                yield row if isinstance(row, str) else parse_csv_row(header, row)
+        else:
+            async for line, valid in lines:
+                if line.strip():
+                    yield parse_ndjson_line(line, valid)
+
+    async def stream_results():
+        if header:
+            yield format_csv([], header=True)
+        chunk, index = [], 0
+        async for record in records():
+            chunk.append((index, record))
+            index += 1
+            if len(chunk) == scorer.chunk_size:
+                # Off the event loop: encoding and scoring a chunk is CPU-bound
+                yield await run_in_threadpool(score_chunk, chunk)
+                chunk = []
+        if chunk:
+            yield await run_in_threadpool(score_chunk, chunk)
+
+    return DuplexStreamingResponse(
+        stream_results(),
+        media_type=media_type,
+        headers={"X-Model-Version": active.version, "X-Decision-Threshold": threshold.name}
+    )
+
+# LEGACY LOAN ENDPOINTS - COMMENTED OUT FOR CREDIT SCORING MIGRATION
+# These endpoints should be removed or updated to use the new CreditAssessment model
+
+# @router.post("/loans/apply", response_model=LoanApplicationResponse, tags=["Loans"])
+# def create_loan_application(
+#     loan: LoanApplicationCreate,
+#     current_user: User = Depends(get_current_user),
+#     db: Prisma = Depends(get_db)
+# ):
+#     # First, get the prediction from the model
+#     prediction_response = predict_loan_eligibility(loan)
+
+#     # Create loan application record
+#     loan_data: LoanApplicationCreateInput = {
+#         "scoreduserId": current_user.id,
+#         "amount": loan.loanAmount,
+#         "term": loan.loanTerm,
+#         "gender": loan.gender,
+#         "maritalStatus": loan.maritalStatus,
+#         "dependents": loan.dependents,
+#         "education": loan.education,
+#         "employmentStatus": loan.employmentStatus,
+#         "income": loan.income,
+#         "coApplicantIncome": loan.coApplicantIncome,
+#         "creditHistory": loan.creditHistory,
+#         "propertyArea": loan.propertyArea,
+#         "score": prediction_response.score,
+#         "eligible": prediction_response.eligible,
+#         "decisionStatus": DecisionStatus.PENDING,
+#     }
+
+#     created_application = db.loanapplication.create(data=loan_data)
+#     return created_application
+
+# @router.get("/loans/applications", response_model=List[LoanApplicationResponse], tags=["Loans"])
+# def get_user_loan_applications(
+#     current_user: User = Depends(get_current_user),
+#     db: Prisma = Depends(get_db)
+# ):
+#     # Get all applications initiated by the user
+#     applications = db.loanapplication.find_many(
+#         where={"scoreduserId": current_user.id}
+#     )
+#     return applications
+
+# @router.get("/loans/scoring", response_model=List[LoanApplicationResponse], tags=["Loans"])
+# def get_pending_loan_applications(
+#     current_user: User = Depends(get_current_user),
+#     db: Prisma = Depends(get_db)
+# ):
+#     # Get all applications that need scoring (pending decision)
+#     applications = db.loanapplication.find_many(
+#         where={"decisionStatus": DecisionStatus.PENDING}
+#     )
+#     return applications
+
+# @router.get("/loans/scored", response_model=List[LoanApplicationResponse], tags=["Loans"])
+# def get_scored_loan_applications(
+#     current_user: User = Depends(get_current_user),
+#     db: Prisma = Depends(get_db)
+# ):
+#     # Get all applications scored by the current user
+#     applications = db.loanapplication.find_many(
+#         where={"scorerId": current_user.id}
+#     )
+#     return applications
+
+# @router.put("/loans/{loan_id}", response_model=LoanApplicationResponse, tags=["Loans"])
+# def update_loan_application(
+#     loan_id: str,
+#     loan_update: LoanApplicationUpdate,
+#     current_user: User = Depends(get_current_user),
+#     db: Prisma = Depends(get_db)
+# ):
+#     # Check if loan application exists
+#     loan_application = db.loanapplication.find_unique(where={"id": loan_id})
+#     if not loan_application:
+#         raise HTTPException(status_code=404, detail="Loan application not found")
+
+#     # If this is a decision update, set the scorer
+#     update_data = loan_update.model_dump(exclude_unset=True)
+#     if "decisionStatus" in update_data and loan_application.scorerId is None:
+#         update_data["scorerId"] = current_user.id
+
+#     # Cast to LoanApplicationUpdateInput type
+#     update_data_typed: LoanApplicationUpdateInput = update_data #type: ignore
+
+
+#     # Update the application
+#     updated_application = db.loanapplication.update(
+#         where={"id": loan_id},
+#         data=update_data_typed
+#     )
+#     return updated_application
+
+# @router.get("/loans/{loan_id}", response_model=LoanApplicationResponse, tags=["Loans"])
+# def get_loan_application(
+#     loan_id: str,
+#     current_user: User = Depends(get_current_user),
+#     db: Prisma = Depends(get_db)
+# ):
+#     loan_application = db.loanapplication.find_unique(where={"id": loan_id})
+#     if not loan_application:
+#         raise HTTPException(status_code=404, detail="Loan application not found")
+
+#     # Check if user has permission to view this application
+#     if (loan_application.scoreduserId != current_user.id and
+#         loan_application.scorerId != current_user.id):
+#         raise HTTPException(status_code=403, detail="Not authorized to view this application")
+
+#     return loan_application
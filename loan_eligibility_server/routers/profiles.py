@@ -0,0 +1,201 @@
+"""Current user, user search and profile routes"""
+import asyncio
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException
+from prisma import Prisma
+from prisma.models import User
+from prisma.types import ProfileCreateInput, ProfileUpdateInput
+from loanModel import (
+    UserResponse, ProfileCreate, ProfileResponse, UserSearchResult, ProfileSummary
+)
+from dependencies import get_current_user, get_db
+from credit_history import assess_credit_history
+
+router = APIRouter()
+
+# User profile routes
+
+
+@router.get("/users/me", response_model=UserResponse, tags=["Users"])
+async def read_users_me(current_user: User = Depends(get_current_user)):
+    return UserResponse(
+        id=current_user.id,
+        email=current_user.email,
+        createdAt=current_user.createdAt
+    )
+
+
+@router.get("/users/search", response_model=List[UserSearchResult], tags=["Users"])
+async def search_users(
+    q: str,
+    current_user: User = Depends(get_current_user),
+    db: Prisma = Depends(get_db)
+):
+    """Search for users by email or full name"""
+    # if not q or len(q.strip()) < 2:
+    #     raise HTTPException(status_code=400, detail="Search query must be at least 2 characters long")
+
+    search_term = q.strip().lower()
+
+    # Search users by email or profile full name, running both queries concurrently
+    users_by_email, users_by_name = await asyncio.gather(
+        # Users whose email contains the search term
+        db.user.find_many(
+            where={
+                "email": {
+                    "contains": search_term,
+                    "mode": "insensitive"
+                }
+            },
+            include={"profile": True}
+        ),
+        # Users whose profile full name contains the search term
+        db.user.find_many(
+            where={
+                "profile": {
+                    "is": {
+                        "fullName": {
+                            "contains": search_term,
+                            "mode": "insensitive"
+                        }
+                    }
+                }
+            },
+            include={"profile": True}
+        ),
+    )
+
+    # Combine results and remove duplicates
+    user_dict = {}
+    for user in users_by_email + users_by_name:
+        user_dict[user.id] = user
+
+    del user_dict[current_user.id]  # Exclude current user from search results
+
+    # Convert to response format
+    search_results = []
+    for user in user_dict.values():
+        profile_summary = None
+        if user.profile:
+            profile_summary = ProfileSummary(
+                gender=user.profile.gender,
+                maritalStatus=user.profile.maritalStatus,
+                dependents=user.profile.dependents,
+                education=user.profile.education,
+                employmentStatus=user.profile.employmentStatus,
+                income=user.profile.income,
+                creditHistory=user.profile.creditHistory,
+                propertyArea=user.profile.propertyArea,
+                bankTransactions=user.profile.bankTransactions,
+                lendingHistory=user.profile.lendingHistory,
+                loanPurpose=user.profile.loanPurpose
+            )
+
+        user_result = UserSearchResult(
+            id=user.id,
+            email=user.email,
+            createdAt=user.createdAt,
+            fullName=user.profile.fullName if user.profile else None,
+            profile=profile_summary
+        )
+        search_results.append(user_result)
+
+    # Limit results to 10 to avoid overwhelming the UI
+    return search_results[:10]
+
+
+@router.post("/users/profile", response_model=ProfileResponse, tags=["Profiles"])
+async def create_profile(
+    profile: ProfileCreate,
+    current_user: User = Depends(get_current_user),
+    db: Prisma = Depends(get_db)
+):
+    # Check if profile already exists
+    existing_profile = await db.profile.find_unique(
+        where={"userId": current_user.id})
+    if existing_profile:
+        raise HTTPException(status_code=400, detail="Profile already exists")
+
+    # Automatically assess credit history based on new fields
+    assessed_credit_history = assess_credit_history(
+        profile.bankTransactions,
+        profile.lendingHistory,
+        profile.loanPurpose
+    )
+
+    # Create new profile for the user
+    profile_data: ProfileCreateInput = {
+        "userId": current_user.id,
+        "fullName": profile.fullName,
+        "nationalId": profile.nationalId,
+        "gender": profile.gender,
+        "maritalStatus": profile.maritalStatus,
+        "dependents": profile.dependents,
+        "education": profile.education,
+        "employmentStatus": profile.employmentStatus,
+        "income": profile.income,
+        "coApplicantIncome": profile.coApplicantIncome,
+        "creditHistory": assessed_credit_history,  # Use assessed value
+        "bankTransactions": profile.bankTransactions,
+        "lendingHistory": profile.lendingHistory,
+        "loanPurpose": profile.loanPurpose,
+        "propertyArea": profile.propertyArea,
+    }
+
+    created_profile = await db.profile.create(data=profile_data)
+    return created_profile
+
+
+@router.put("/users/profile", response_model=ProfileResponse, tags=["Profiles"])
+async def update_profile(
+    profile: ProfileCreate,
+    current_user: User = Depends(get_current_user),
+    db: Prisma = Depends(get_db)
+):
+    # Check if profile exists
+    existing_profile = await db.profile.find_unique(
+        where={"userId": current_user.id})
+    if not existing_profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+
+    # Automatically assess credit history based on new fields
+    assessed_credit_history = assess_credit_history(
+        profile.bankTransactions,
+        profile.lendingHistory,
+        profile.loanPurpose
+    )
+
+    # Update profile
+    profile_data: ProfileUpdateInput = {
+        "fullName": profile.fullName,
+        "nationalId": profile.nationalId,
+        "gender": profile.gender,
+        "maritalStatus": profile.maritalStatus,
+        "dependents": profile.dependents,
+        "education": profile.education,
+        "employmentStatus": profile.employmentStatus,
+        "income": profile.income,
+        "coApplicantIncome": profile.coApplicantIncome,
+        "creditHistory": assessed_credit_history,  # Use assessed value
+        "bankTransactions": profile.bankTransactions,
+        "lendingHistory": profile.lendingHistory,
+        "loanPurpose": profile.loanPurpose,
+        "propertyArea": profile.propertyArea,
+    }
+
+    updated_profile = await db.profile.update(
+        where={"userId": current_user.id},
+        data=profile_data
+    )
+    return updated_profile
+
+
+@router.get("/users/profile", response_model=ProfileResponse, tags=["Profiles"])
+async def get_profile(
+    current_user: User = Depends(get_current_user),
+    db: Prisma = Depends(get_db)
+):
+    profile = await db.profile.find_unique(where={"userId": current_user.id})
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile
@@ -0,0 +1,283 @@
+"""Credit assessment routes"""
+import os
+from fastapi import APIRouter, Depends, HTTPException
+from prisma import Prisma
+from prisma.models import CreditAssessment, User
+from prisma.types import CreditAssessmentCreateInput, CreditAssessmentUpdateInput
+from loanModel import (
+    CreditAssessmentCreate, CreditAssessmentUpdate, CreditAssessmentResponse, CreditAssessmentPage, DecisionStatus,
+    ScorerThresholdResponse
+)
+from dependencies import get_current_user, get_db, get_page
+from pagination import Page
+from routers import SCORING_ENABLED
+from thresholds import decision_thresholds
+
+router = APIRouter()
+
+# Shadow scoring compares against the live model, which only workers serving
+# /loans load; elsewhere saves skip it without importing the scoring subsystem
+SHADOW_SCORING = SCORING_ENABLED and bool(os.getenv("SHADOW_MODEL_PATH"))
+
+
+def assessment_response(assessment: CreditAssessment) -> CreditAssessmentResponse:
+    return CreditAssessmentResponse(
+        id=assessment.id,
+        scoreduserId=assessment.scoreduserId,
+        scorerId=assessment.scorerId,
+        amount=assessment.amount,
+        term=assessment.term,
+        gender=assessment.gender,
+        maritalStatus=assessment.maritalStatus,
+        dependents=assessment.dependents,
+        education=assessment.education,
+        employmentStatus=assessment.employmentStatus,
+        income=assessment.income,
+        coApplicantIncome=assessment.coApplicantIncome,
+        creditHistory=assessment.creditHistory,
+        propertyArea=assessment.propertyArea,
+        score=assessment.score,
+        eligible=assessment.eligible,
+        eligibilityThreshold=assessment.eligibilityThreshold,
+        thresholdName=assessment.thresholdName,
+        decisionStatus=assessment.decisionStatus,
+        awardedAmount=assessment.awardedAmount,
+        dueDate=assessment.dueDate,
+        outcomeStatus=assessment.outcomeStatus,
+        notes=assessment.notes,
+        createdAt=assessment.createdAt,
+        updatedAt=assessment.updatedAt,
+        scoreData={
+            "eligible": assessment.eligible,
+            "score": assessment.score,
+            "explanation": f"Credit score: {assessment.score:.2%}" if assessment.score else "No score available"
+        }
+    )
+
+
+# Credit Scoring Endpoints
+@router.post("/scoring/save", response_model=CreditAssessmentResponse, tags=["Credit Scoring"])
+async def save_credit_score(
+    credit_assessment: CreditAssessmentCreate,
+    current_user: User = Depends(get_current_user),
+    db: Prisma = Depends(get_db)
+):
+    """Save a credit assessment result"""
+    print(credit_assessment, "this is the credit assessment data")
+    # First, get the prediction from the model
+    # prediction_response = predict_loan_eligibility(credit_assessment)
+
+    # Decide eligibility against the requested threshold, else the scorer's own, else the default
+    threshold = decision_thresholds.for_scorer(current_user.id, credit_assessment.thresholdName)
+    if threshold is None:
+        raise HTTPException(status_code=400, detail="Unknown decision threshold")
+    eligible = threshold.admits(credit_assessment.score) if credit_assessment.score is not None else credit_assessment.eligible
+
+    # Create credit assessment record
+    assessment_data: CreditAssessmentCreateInput = {
+        "scorerId": current_user.id,
+        "scoreduserId": credit_assessment.scoreduserId,
+        "amount": credit_assessment.amount,
+        "term": credit_assessment.term,
+        "gender": credit_assessment.gender,
+        "maritalStatus": credit_assessment.maritalStatus,
+        "dependents": credit_assessment.dependents,
+        "education": credit_assessment.education,
+        "employmentStatus": credit_assessment.employmentStatus,
+        "income": credit_assessment.income,
+        "coApplicantIncome": credit_assessment.coApplicantIncome,
+        "creditHistory": credit_assessment.creditHistory,
+        "propertyArea": credit_assessment.propertyArea,
+        "score": credit_assessment.score,
+        "eligible": eligible,
+        "eligibilityThreshold": threshold.probability,
+        "thresholdName": threshold.name,
+        # "decisionStatus": DecisionStatus.PENDING,
+        "decisionStatus": credit_assessment.decisionStatus,
+        "awardedAmount": credit_assessment.awardedAmount,
+        "dueDate": credit_assessment.dueDate,
+        "notes": credit_assessment.notes
+    }
+
+    created_assessment = await db.creditassessment.create(data=assessment_data)
+
+    if SHADOW_SCORING:
+        from scoring_service import shadow_score_assessment
+        shadow_score_assessment(credit_assessment, threshold)
+
+    return assessment_response(created_assessment)
+
+
+@router.get("/scoring/threshold", response_model=ScorerThresholdResponse, tags=["Credit Scoring"])
+async def get_scorer_threshold(current_user: User = Depends(get_current_user)):
+    """
+    The decision threshold the current user scores with: their own if one is
+    configured, else the default. Pass its name as ?threshold= to /loans/predict
+    and as thresholdName to /scoring/save, so the saved decision matches the one shown.
+    """
+    threshold = decision_thresholds.for_scorer(current_user.id)
+    return ScorerThresholdResponse(threshold=threshold.probability, thresholdName=threshold.name)
+
+
+@router.get("/scoring/my-scores", response_model=CreditAssessmentPage, tags=["Credit Scoring"])
+async def get_my_scores(
+    current_user: User = Depends(get_current_user),
+    page: Page = Depends(get_page),
+    db: Prisma = Depends(get_db)
+):
+    """Get the credit assessments initiated by the current user, newest first, a page at a time"""
+    assessments = await db.creditassessment.find_many(
+        **page.find_many_args({"scorerId": current_user.id})
+    )
+
+    items, next_cursor = page.split(assessments)
+    return CreditAssessmentPage(
+        items=[assessment_response(assessment) for assessment in items],
+        nextCursor=next_cursor
+    )
+
+
+@router.get("/scoring/scores-on-me", response_model=CreditAssessmentPage, tags=["Credit Scoring"])
+async def get_scores_on_me(
+    current_user: User = Depends(get_current_user),
+    page: Page = Depends(get_page),
+    db: Prisma = Depends(get_db)
+):
+    """Get the credit assessments performed on the current user (scores where current user was scored by others), newest first, a page at a time"""
+    # Note: In current schema, there's no explicit "scoredUserId" field
+    # This endpoint will return assessments where the current user is the scorer for now
+    assessments = await db.creditassessment.find_many(
+        **page.find_many_args({"scoreduserId": current_user.id})
+    )
+
+    items, next_cursor = page.split(assessments)
+    return CreditAssessmentPage(
+        items=[assessment_response(assessment) for assessment in items],
+        nextCursor=next_cursor
+    )
+
+
+@router.put("/scoring/{scoreId}/status", response_model=CreditAssessmentResponse, tags=["Credit Scoring"])
+async def update_score_status(
+    scoreId: str,
+    score_update: CreditAssessmentUpdate,
+    current_user: User = Depends(get_current_user),
+    db: Prisma = Depends(get_db)
+):
+    """Update the status of a credit assessment"""
+    # Check if assessment exists
+    assessment = await db.creditassessment.find_unique(where={"id": scoreId})
+    if not assessment:
+        raise HTTPException(
+            status_code=404, detail="Credit assessment not found")
+
+    # Check permissions - only scoreduser can update for now
+    if assessment.scorerId != current_user.id and assessment.scoreduserId != current_user.id:
+        raise HTTPException(
+            status_code=403, detail="Not authorized to update this assessment")
+
+    # Prepare update data
+    update_data = score_update.model_dump(exclude_unset=True)
+
+    # If this is a decision update, set the scorer
+    if "decisionStatus" in update_data and assessment.scorerId is None:
+        update_data["scorerId"] = current_user.id
+
+    update_data_typed: CreditAssessmentUpdateInput = update_data  # type: ignore
+    # Update the assessment
+    updated_assessment = await db.creditassessment.update(
+        where={"id": scoreId},
+        data=update_data_typed
+    )
+
+    if not updated_assessment:
+        raise HTTPException(
+            status_code=500, detail="Failed to update credit assessment")
+
+    return assessment_response(updated_assessment)
+
+
+@router.get("/scoring/pending", response_model=CreditAssessmentPage, tags=["Credit Scoring"])
+async def get_pending_scores(
+    current_user: User = Depends(get_current_user),
+    page: Page = Depends(get_page),
+    db: Prisma = Depends(get_db)
+):
+    """Get the pending credit assessments, newest first, a page at a time"""
+    assessments = await db.creditassessment.find_many(
+        **page.find_many_args({"decisionStatus": DecisionStatus.PENDING})
+    )
+
+    items, next_cursor = page.split(assessments)
+    return CreditAssessmentPage(
+        items=[assessment_response(assessment) for assessment in items],
+        nextCursor=next_cursor
+    )
+
+
+@router.get("/scoring/completed", response_model=CreditAssessmentPage, tags=["Credit Scoring"])
+async def get_completed_scores(
+    current_user: User = Depends(get_current_user),
+    page: Page = Depends(get_page),
+    db: Prisma = Depends(get_db)
+):
+    """Get the completed credit assessments, newest first, a page at a time"""
+    assessments = await db.creditassessment.find_many(
+        **page.find_many_args({
+            "OR": [
+                {"decisionStatus": DecisionStatus.AWARDED},
+                {"decisionStatus": DecisionStatus.DECLINED}
+            ]
+        })
+    )
+
+    items, next_cursor = page.split(assessments)
+    return CreditAssessmentPage(
+        items=[assessment_response(assessment) for assessment in items],
+        nextCursor=next_cursor
+    )
+
+
+@router.get("/scoring/{scoreId}", response_model=CreditAssessmentResponse, tags=["Credit Scoring"])
+async def get_score_by_id(
+    scoreId: str,
+    current_user: User = Depends(get_current_user),
+    db: Prisma = Depends(get_db)
+):
+    """Get a specific credit assessment by ID"""
+    assessment = await db.creditassessment.find_unique(where={"id": scoreId})
+
+    if not assessment:
+        raise HTTPException(
+            status_code=404, detail="Credit assessment not found")
+
+    # Check if user has permission to view this assessment
+    if (assessment.scoreduserId != current_user.id and
+            assessment.scorerId != current_user.id):
+        raise HTTPException(
+            status_code=403, detail="Not authorized to view this assessment")
+
+    return assessment_response(assessment)
+
+
+@router.delete("/scoring/{scoreId}", tags=["Credit Scoring"])
+async def delete_score(
+    scoreId: str,
+    current_user: User = Depends(get_current_user),
+    db: Prisma = Depends(get_db)
+):
+    """Delete a credit assessment"""
+    # Check if assessment exists
+    assessment = await db.creditassessment.find_unique(where={"id": scoreId})
+    if not assessment:
+        raise HTTPException(
+            status_code=404, detail="Credit assessment not found")
+
+    # Check if user has permission to delete - only scoreduser can delete
+    if assessment.scoreduserId != current_user.id:
+        raise HTTPException(
+            status_code=403, detail="Not authorized to delete this assessment")
+      # Delete the assessment
+    await db.creditassessment.delete(where={"id": scoreId})
+
+    return {"message": "Credit assessment deleted successfully"}
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Score a CSV or Parquet file of applicants offline, without the HTTP API.
+
+The file is read in chunks, chunks are encoded and scored in worker
+processes (the same encoding and model as /loans/predict), and results are
+written in input order as they complete, so memory is bounded by the chunk
+size and the number of chunks in flight. Input columns are LoanDto field
+names; Parquet needs pyarrow.
+
+    python score_file.py portfolio.csv scores.csv
+    python score_file.py portfolio.parquet scores.parquet --id-column applicantId --threshold microloan
+"""
+
+import argparse
+import csv
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from bulk_scoring import DEFAULT_CHUNK_SIZE, RESULT_FIELDS, ChunkedLoanScorer, format_csv, missing_loan_columns
+from credit_history import assess_credit_history
+from model_registry import newest_artifact
+from scoring import FeatureEncoder, artifact_version, load_model, score_matrix
+from thresholds import decision_thresholds
+
+# Scorer built by _init_worker in each worker process
+_worker_scorer: Optional[ChunkedLoanScorer] = None
+
+
+def _init_worker(model_path: str, backend: str, cutoff: float, chunk_size: int) -> None:
+    global _worker_scorer
+    model = load_model(model_path, backend)
+    _worker_scorer = ChunkedLoanScorer(
+        FeatureEncoder(assess_credit_history),
+        lambda loan_data, amounts: score_matrix(model, loan_data, amounts, cutoff),
+        chunk_size,
+    )
+
+
+def _score_chunk(records: List[Tuple[int, Any]]) -> List[Dict[str, Any]]:
+    return _worker_scorer.score_chunk(records)
+
+
+def is_parquet(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in (".parquet", ".pq")
+
+
+def read_chunks(path: str, chunk_size: int) -> Iterator[List[Tuple[int, Dict[str, Any]]]]:
+    """(row index, record) lists of at most chunk_size, with empty cells left out of the records"""
+    index = 0
+    if is_parquet(path):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            records = [{k: v for k, v in row.items() if v is not None} for row in batch.to_pylist()]
+            yield [(index + i, record) for i, record in enumerate(records)]
+            index += len(records)
+        return
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        # Cells stay text, as in /loans/predict/stream; LoanDto does the conversion
+        reader = csv.DictReader(f)
+        while True:
+            records = [
+                {k: v for k, v in row.items() if k is not None and v not in ("", None)}
+                for row in islice(reader, chunk_size)
+            ]
+            if not records:
+                return
+            yield [(index + i, record) for i, record in enumerate(records)]
+            index += len(records)
+
+
+def columns_of(path: str) -> List[str]:
+    if is_parquet(path):
+        import pyarrow.parquet as pq
+        return pq.ParquetFile(path).schema_arrow.names
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return [column.strip() for column in next(csv.reader(f), [])]
+
+
+class ResultWriter:
+    """Appends result rows to a CSV or Parquet file as chunks complete"""
+
+    def __init__(self, path: str, fields: List[str]):
+        self.fields = fields
+        if is_parquet(path):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            types = {
+                "index": pa.int64(), "eligible": pa.bool_(), "originalScore": pa.float64(),
+                "eligibilityPercentage": pa.float64(), "maxEligibleAmount": pa.float64(),
+                "requestedAmount": pa.float64(), "error": pa.string(),
+            }
+            self._schema = pa.schema([(field, types.get(field, pa.string())) for field in fields])
+            self._parquet = pq.ParquetWriter(path, self._schema)
+            self._csv = None
+        else:
+            self._parquet = None
+            self._csv = open(path, "w", newline="")
+            self._csv.write(format_csv([], header=True, fields=fields))
+
+    def write(self, results: List[Dict[str, Any]]) -> None:
+        if self._parquet is not None:
+            import pyarrow as pa
+            self._parquet.write_table(pa.Table.from_pylist(results, schema=self._schema))
+        else:
+            self._csv.write(format_csv(results, fields=self.fields))
+
+    def close(self) -> None:
+        if self._parquet is not None:
+            self._parquet.close()
+        else:
+            self._csv.close()
+
+
+def score_file(
+    source: str,
+    destination: str,
+    model_path: str,
+    cutoff: float = 0.0,
+    backend: str = "numpy",
+    workers: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    id_column: Optional[str] = None,
+) -> Dict[str, int]:
+    """Score `source` into `destination`; returns row, error and eligible counts"""
+    columns = columns_of(source)
+    missing = missing_loan_columns(columns)
+    if missing:
+        raise SystemExit(f"{source} is missing columns: {', '.join(missing)}")
+    if id_column is not None and id_column not in columns:
+        raise SystemExit(f"{source} has no {id_column} column")
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    fields = ([id_column] if id_column else []) + list(RESULT_FIELDS)
+    writer = ResultWriter(destination, fields)
+    counts = {"rows": 0, "errors": 0, "eligible": 0}
+
+    def write(chunk, results):
+        if id_column:
+            for (_, record), result in zip(chunk, results):
+                value = record.get(id_column)
+                result[id_column] = None if value is None else str(value)
+        writer.write(results)
+        counts["rows"] += len(results)
+        counts["errors"] += sum(result["error"] is not None for result in results)
+        counts["eligible"] += sum(bool(result["eligible"]) for result in results)
+
+    try:
+        if workers == 0:
+            # In-process, e.g. for profiling
+            _init_worker(model_path, backend, cutoff, chunk_size)
+            for chunk in read_chunks(source, chunk_size):
+                write(chunk, _score_chunk(chunk))
+            return counts
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(model_path, backend, cutoff, chunk_size),
+        ) as executor:
+            # A bounded window of chunks in flight keeps reading from running
+            # ahead of scoring, and results are written in input order
+            in_flight = deque()
+            for chunk in read_chunks(source, chunk_size):
+                in_flight.append((chunk, executor.submit(_score_chunk, chunk)))
+                if len(in_flight) >= workers * 2:
+                    done_chunk, future = in_flight.popleft()
+                    write(done_chunk, future.result())
+            while in_flight:
+                done_chunk, future = in_flight.popleft()
+                write(done_chunk, future.result())
+        return counts
+    finally:
+        writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("source", help="CSV or Parquet file of applicants")
+    parser.add_argument("destination", help="CSV or Parquet file to write results to")
+    parser.add_argument("--model", help="model artifact (default: the one the API serves from MODEL_DIR)")
+    parser.add_argument("--backend", default=os.getenv("SCORER_BACKEND", "numpy"))
+    parser.add_argument("--threshold", help="named decision threshold from DECISION_THRESHOLDS")
+    parser.add_argument("--workers", type=int, help="worker processes (default: CPU count, 0: in-process)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--id-column", help="input column to copy into the results, e.g. an applicant id")
+    args = parser.parse_args()
+
+    model_path = args.model or newest_artifact(
+        os.getenv("MODEL_DIR", "."), os.getenv("MODEL_PATTERN", "loan_elig_predictor*"))
+    if model_path is None:
+        raise SystemExit("No model artifact found; pass --model")
+    threshold = decision_thresholds.get(args.threshold)
+    if threshold is None:
+        raise SystemExit(f"Unknown threshold {args.threshold!r}, expected one of: {', '.join(decision_thresholds.names())}")
+
+    started = time.perf_counter()
+    counts = score_file(
+        args.source, args.destination, model_path, threshold.cutoff, args.backend,
+        args.workers, args.chunk_size, args.id_column,
+    )
+    seconds = time.perf_counter() - started
+    print(f"Scored {counts['rows']} rows of {args.source} with model {artifact_version(model_path)} "
+          f"at threshold {threshold.name} ({threshold.probability}) in {seconds:.1f}s "
+          f"({counts['rows'] / seconds:.0f} rows/s): {counts['eligible']} eligible, "
+          f"{counts['errors']} rejected -> {args.destination}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,623 @@
+"""
+Scoring helpers for the loan eligibility model.
+
+Loan amounts are expressed in thousands of XAF, exactly as they arrive in
+LoanDto.loanAmount. The model sees them in log1p space.
+"""
+import hashlib
+import json
+import sys
+import warnings
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Probability of the positive class at which an applicant becomes eligible,
+# unless a named decision threshold (see thresholds.py) applies
+ELIGIBILITY_THRESHOLD = 0.5
+
+# The max-amount search never looks further than this above the requested amount
+MAX_AMOUNT_SEARCH_SPAN = 100.0  # in thousands (₣100,000)
+
+# Defaults for the numeric search used when the model has no closed form
+SEARCH_PRECISION = 0.01  # in thousands (₣10)
+SEARCH_MAX_EVALUATIONS = 256
+SEARCH_GRID_SIZE = 64
+SEARCH_REFINE_POINTS = 15
+
+# Loan terms (in months) offered by the amount x term frontier unless the caller picks its own
+FRONTIER_TERMS = (6, 12, 18, 24, 36, 48, 60, 120, 180, 240, 360)
+
+# Candidate grid for counterfactuals: co-applicant income added as a fraction of
+# the applicant's income, loan amount cut as a fraction of the requested amount,
+# any FRONTIER_TERMS term, and 0 up to this many dependents
+COUNTERFACTUAL_COAPPLICANT_STEPS = (0.0, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.0)
+COUNTERFACTUAL_AMOUNT_CUTS = (0.0, 0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9)
+COUNTERFACTUAL_MAX_DEPENDENTS = 3
+
+# Column layout of an encoded row, identical to the model's feature_names_in_
+FEATURE_NAMES = (
+    'Gender', 'Married', 'Dependents', 'Education', 'Self_Employed',
+    'ApplicantIncome', 'CoapplicantIncome', 'LoanAmount', 'Loan_Amount_Term',
+    'Credit_History', 'Property_Area',
+)
+(
+    GENDER, MARRIED, DEPENDENTS, EDUCATION, SELF_EMPLOYED,
+    APPLICANT_INCOME, COAPPLICANT_INCOME, LOAN_AMOUNT, LOAN_AMOUNT_TERM,
+    CREDIT_HISTORY, PROPERTY_AREA,
+) = range(len(FEATURE_NAMES))
+N_FEATURES = len(FEATURE_NAMES)
+
+# The monetary and term columns are contiguous and all scaled with log1p
+LOG1P_COLUMNS = slice(APPLICANT_INCOME, LOAN_AMOUNT_TERM + 1)
+
+# Pickle-free linear artifacts (see LinearScorer.save) are JSON files with this suffix
+LINEAR_ARTIFACT_FORMAT = "linear-logistic/v1"
+LINEAR_ARTIFACT_SUFFIX = ".json"
+
+
+def artifact_version(path: str) -> str:
+    """Short content hash identifying a model artifact"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+def smoke_rows(n_rows: int = 32, seed: int = 0) -> np.ndarray:
+    """Deterministic encoded rows spanning realistic inputs, for validating and warming models"""
+    rng = np.random.default_rng(seed)
+    rows = rng.integers(0, 2, size=(n_rows, N_FEATURES)).astype(np.float64)
+    rows[:, DEPENDENTS] = rng.integers(0, 4, size=n_rows)
+    rows[:, PROPERTY_AREA] = rng.integers(0, 3, size=n_rows)
+    rows[:, LOG1P_COLUMNS] = np.log1p(rng.uniform(0, 10000, size=(n_rows, 4)))
+    return rows
+
+
+def load_model(path: str, backend: str = "numpy"):
+    """
+    Load a model artifact and check its feature layout. Linear models are
+    converted to a LinearScorer unless `backend` is "sklearn", after checking
+    that the scorer reproduces the estimator's probabilities on smoke_rows.
+
+    JSON artifacts written by LinearScorer.save are loaded with NumPy only and
+    always score with the LinearScorer, whatever the backend.
+    """
+    if path.endswith(LINEAR_ARTIFACT_SUFFIX):
+        return LinearScorer.load(path)
+
+    # joblib and sklearn are only imported for pickled artifacts
+    import joblib
+    model = joblib.load(path)
+    check_feature_names(model)
+    if backend == "sklearn":
+        return model
+    # Linear models are scored directly with NumPy; anything else stays as loaded
+    scorer = LinearScorer.from_sklearn(model)
+    if scorer is None:
+        return model
+    rows = smoke_rows()
+    if not np.allclose(scorer.predict_proba(rows)[:, 1], positive_proba(model, rows), rtol=0, atol=1e-9):
+        raise ValueError("LinearScorer does not reproduce the model's probabilities")
+    return scorer
+
+
+def check_feature_names(model) -> None:
+    """Raise ValueError if the model was fitted on a different column layout than FEATURE_NAMES"""
+    names = getattr(model, 'feature_names_in_', None)
+    if names is not None and tuple(names) != FEATURE_NAMES:
+        raise ValueError(
+            f"Model features {list(names)} do not match encoder layout {list(FEATURE_NAMES)}")
+
+
+class FeatureEncoder:
+    """
+    Encodes LoanDto-like objects straight into float64 rows laid out in
+    FEATURE_NAMES order, applying log1p to LOG1P_COLUMNS in one pass.
+
+    `credit_history` is a credit_history.CreditHistoryAssessor (or anything
+    with the same __call__/assess_many interface) deriving the Credit_History
+    flag from the loan's bankTransactions, lendingHistory and loanPurpose.
+    """
+
+    def __init__(self, credit_history):
+        self.credit_history = credit_history
+
+    def _write_raw(self, loan, out: np.ndarray) -> None:
+        # Writes every column except Credit_History, which callers fill in.
+        # Categorical codes follow the training data: Male: 1, Married: 1,
+        # Graduate: 1, Self employed: 1, Rural: 0 / Urban: 1 / Semiurban: 2
+        out[GENDER] = 1.0 if loan.gender == 'MALE' else 0.0
+        out[MARRIED] = 1.0 if loan.maritalStatus == 'MARRIED' else 0.0
+        out[DEPENDENTS] = loan.dependents
+        out[EDUCATION] = 1.0 if loan.education == 'GRADUATE' else 0.0
+        out[SELF_EMPLOYED] = 1.0 if loan.employmentStatus == 'SELF_EMPLOYED' else 0.0
+        out[APPLICANT_INCOME] = loan.income
+        out[COAPPLICANT_INCOME] = loan.coApplicantIncome
+        out[LOAN_AMOUNT] = loan.loanAmount
+        out[LOAN_AMOUNT_TERM] = loan.loanTerm
+        out[PROPERTY_AREA] = (
+            0.0 if loan.propertyArea == 'RURAL' else 1.0 if loan.propertyArea == 'URBAN' else 2.0)
+
+    def encode_into(self, loan, out: np.ndarray) -> np.ndarray:
+        """Encode one loan into the preallocated (N_FEATURES,) row `out`"""
+        self._write_raw(loan, out)
+        out[CREDIT_HISTORY] = 1.0 if self.credit_history(
+            loan.bankTransactions, loan.lendingHistory, loan.loanPurpose) else 0.0
+        np.log1p(out[LOG1P_COLUMNS], out=out[LOG1P_COLUMNS])
+        return out
+
+    def encode(self, loan) -> np.ndarray:
+        """Encode one loan as a (1, N_FEATURES) matrix ready for predict_proba"""
+        out = np.empty((1, N_FEATURES), dtype=np.float64)
+        self.encode_into(loan, out[0])
+        return out
+
+    def encode_many(self, loans: Sequence, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Encode N loans into an (N, N_FEATURES) matrix, reusing `out` when given"""
+        if out is None:
+            out = np.empty((len(loans), N_FEATURES), dtype=np.float64)
+        for i, loan in enumerate(loans):
+            self._write_raw(loan, out[i])
+        out[:, CREDIT_HISTORY] = self.credit_history.assess_many(
+            [loan.bankTransactions for loan in loans],
+            [loan.lendingHistory for loan in loans],
+            [loan.loanPurpose for loan in loans],
+        )
+        np.log1p(out[:, LOG1P_COLUMNS], out=out[:, LOG1P_COLUMNS])
+        return out
+
+
+class LinearScorer:
+    """
+    Minimal stand-in for a fitted binary LogisticRegression that computes
+    sigmoid(X @ weights + bias) directly, skipping sklearn's per-call input
+    validation. Exposes the predict_proba/predict/decision_function subset of
+    the estimator API used by the server.
+    """
+
+    def __init__(self, weights: np.ndarray, bias: float, feature_names: Sequence[str] = FEATURE_NAMES):
+        self.weights = np.ascontiguousarray(weights, dtype=np.float64)
+        self.bias = float(bias)
+        self.feature_names_in_ = np.asarray(feature_names, dtype=object)
+        self.classes_ = np.array([0, 1])
+
+    @classmethod
+    def from_sklearn(cls, model) -> Optional['LinearScorer']:
+        """Extract a scorer from a binary LogisticRegression, or None for any other model"""
+        if 'sklearn' not in sys.modules:
+            # Nothing loaded so far can be an sklearn estimator
+            return None
+        from sklearn.linear_model import LogisticRegression
+        if not isinstance(model, LogisticRegression) or len(model.classes_) != 2:
+            return None
+        weights = np.asarray(model.coef_, dtype=np.float64)[0]
+        bias = float(np.asarray(model.intercept_, dtype=np.float64)[0])
+        if getattr(model, 'multi_class', None) == "multinomial":
+            # Binary multinomial models apply softmax to [-z, z], i.e. sigmoid(2z)
+            weights, bias = 2 * weights, 2 * bias
+        names = getattr(model, 'feature_names_in_', FEATURE_NAMES)
+        return cls(weights, bias, names)
+
+    def _parameters(self) -> dict:
+        return {
+            "feature_names": [str(name) for name in self.feature_names_in_],
+            "coef": self.weights.tolist(),
+            "intercept": self.bias,
+            "transforms": {"log1p": list(FEATURE_NAMES[LOG1P_COLUMNS])},
+        }
+
+    @staticmethod
+    def _checksum(parameters: dict) -> str:
+        canonical = json.dumps(parameters, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def save(self, path: str, source_version: Optional[str] = None) -> None:
+        """
+        Write the scorer as a small JSON artifact: coefficients, intercept,
+        feature order, the log1p columns the encoder applies and a checksum of
+        all of them. Floats round-trip exactly through JSON.
+        """
+        parameters = self._parameters()
+        artifact = {
+            "format": LINEAR_ARTIFACT_FORMAT,
+            **parameters,
+            "sha256": self._checksum(parameters),
+            "source_version": source_version,
+        }
+        with open(path, "w") as f:
+            json.dump(artifact, f, indent=2)
+
+    @classmethod
+    def load(cls, path: str) -> 'LinearScorer':
+        """Read a JSON artifact written by save, raising ValueError if it does not fit this server"""
+        with open(path) as f:
+            artifact = json.load(f)
+        if artifact.get("format") != LINEAR_ARTIFACT_FORMAT:
+            raise ValueError(f"Unsupported model artifact format {artifact.get('format')!r}")
+        scorer = cls(artifact["coef"], artifact["intercept"], artifact["feature_names"])
+        parameters = scorer._parameters()
+        if artifact.get("transforms") != parameters["transforms"]:
+            raise ValueError(
+                f"Artifact transforms {artifact.get('transforms')} do not match the encoder's "
+                f"{parameters['transforms']}")
+        if artifact.get("sha256") != cls._checksum(parameters):
+            raise ValueError("Model artifact checksum mismatch")
+        check_feature_names(scorer)
+        if scorer.weights.shape != (N_FEATURES,):
+            raise ValueError(f"Expected {N_FEATURES} coefficients, got {scorer.weights.shape}")
+        return scorer
+
+    def decision_function(self, X: np.ndarray) -> np.ndarray:
+        return X @ self.weights + self.bias
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        proba = np.empty((len(X), 2), dtype=np.float64)
+        proba[:, 1] = sigmoid(self.decision_function(X))
+        proba[:, 0] = 1.0 - proba[:, 1]
+        return proba
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        return self.classes_[(self.decision_function(X) > 0).astype(np.intp)]
+
+
+def sigmoid(z: np.ndarray) -> np.ndarray:
+    """Numerically stable logistic function"""
+    out = np.empty_like(z, dtype=np.float64)
+    positive = z >= 0
+    out[positive] = 1.0 / (1.0 + np.exp(-z[positive]))
+    exp_z = np.exp(z[~positive])
+    out[~positive] = exp_z / (1.0 + exp_z)
+    return out
+
+
+def logit(p: np.ndarray) -> np.ndarray:
+    """Inverse of sigmoid, clipped so that probabilities of exactly 0 or 1 stay finite"""
+    p = np.clip(p, 1e-15, 1 - 1e-15)
+    return np.log(p) - np.log1p(-p)
+
+
+def decide(model, rows: np.ndarray, cutoffs=0.0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Positive-class scores and eligibility of encoded applicants: (scores, eligible).
+
+    `cutoffs` are decision thresholds in logit space, one per row or shared.
+    For linear models eligibility is the raw linear score compared with the
+    cutoff; other models compare probabilities with sigmoid(cutoffs).
+    """
+    params = linear_parameters(model)
+    if params is None:
+        scores = positive_proba(model, rows)
+        return scores, scores >= sigmoid(np.asarray(cutoffs, dtype=np.float64))
+    weights, bias = params
+    margins = rows @ weights + bias
+    return sigmoid(margins), margins >= cutoffs
+
+
+def linear_parameters(model) -> Optional[Tuple[np.ndarray, float]]:
+    """
+    Return (weights, bias) when the model's positive-class probability is
+    sigmoid(X @ weights + bias), otherwise None.
+    """
+    if not isinstance(model, LinearScorer):
+        model = LinearScorer.from_sklearn(model)
+        if model is None:
+            return None
+    return model.weights, model.bias
+
+
+def floor_amounts(amounts: np.ndarray, uppers: np.ndarray) -> np.ndarray:
+    """
+    Clamp eligible amounts to `uppers` and round them to 2 decimals, rounding
+    down so they stay on the eligible side of the boundary.
+    """
+    return np.where(amounts >= uppers, np.round(uppers, 2), np.floor(amounts * 100) / 100)
+
+
+def solve_max_eligible_amounts(
+    weights: np.ndarray,
+    bias: float,
+    rows: np.ndarray,
+    amount_index: int,
+    uppers: np.ndarray,
+    cutoffs=0.0,
+) -> np.ndarray:
+    """
+    Closed-form maximum eligible amounts for a linear model.
+
+    `rows` is an encoded (N, n_features) matrix; its LoanAmount column is
+    ignored. The decision boundary is where the logit reaches the row's
+    cutoff (0 for the 0.5 threshold), so for each row we solve
+    bias + sum(w_j * x_j, j != amount) + w_amount * log1p(amount) = cutoff
+    for the amount and clamp the result to (0, upper].
+    """
+    w_amount = float(weights[amount_index])
+    rest = bias + rows @ weights - w_amount * rows[:, amount_index] - cutoffs
+    capped = np.round(uppers, 2)
+
+    if w_amount == 0.0:
+        # The amount has no influence, eligibility is the same everywhere
+        return np.where(rest >= 0, capped, 0.0)
+
+    boundary = -rest / w_amount
+    if w_amount > 0:
+        # Larger loans only get more likely, so the cap is the answer if it clears the boundary
+        return np.where(np.log1p(uppers) >= boundary, capped, 0.0)
+
+    # Eligible for every amount up to expm1(boundary)
+    max_amounts = np.expm1(np.minimum(boundary, 700.0))
+    return np.where(boundary <= 0, 0.0, floor_amounts(max_amounts, uppers))
+
+
+def search_max_eligible_amounts(
+    proba_fn: Callable[[np.ndarray], np.ndarray],
+    rows: np.ndarray,
+    amount_index: int,
+    uppers: np.ndarray,
+    lower: float = 0.0,
+    precision: float = SEARCH_PRECISION,
+    max_evaluations: int = SEARCH_MAX_EVALUATIONS,
+    grid_size: int = SEARCH_GRID_SIZE,
+    refine_points: int = SEARCH_REFINE_POINTS,
+    cutoffs=0.0,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bracket-and-bisect search for models without a closed form.
+
+    `proba_fn` maps an encoded (n, n_features) matrix to positive-class
+    probabilities; a row is eligible where they reach sigmoid of its logit
+    cutoff. For every row a coarse grid over [lower, upper] is scored
+    to find the highest eligible grid point followed by an ineligible one;
+    the brackets are then narrowed by scoring `refine_points` interior amounts
+    per row until they are narrower than `precision` or `max_evaluations`
+    amounts have been scored for that row. All rows share each model call.
+
+    Returns (amounts, evaluations), one entry per row.
+    """
+    n_rows = len(rows)
+    uppers = np.broadcast_to(np.asarray(uppers, dtype=np.float64), (n_rows,))
+    amounts = np.zeros(n_rows)
+    evaluations = np.zeros(n_rows, dtype=np.int64)
+    if n_rows == 0:
+        return amounts, evaluations
+    thresholds = np.broadcast_to(sigmoid(np.atleast_1d(np.asarray(cutoffs, dtype=np.float64))), (n_rows,))
+
+    def eligible_at(indexes: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        # candidates holds one row of amounts per entry in indexes
+        matrix = np.repeat(rows[indexes], candidates.shape[1], axis=0)
+        matrix[:, amount_index] = np.log1p(candidates.ravel())
+        evaluations[indexes] += candidates.shape[1]
+        return (proba_fn(matrix).reshape(candidates.shape) >= thresholds[indexes, np.newaxis])
+
+    steps = np.linspace(0.0, 1.0, max(2, min(grid_size, max_evaluations)))
+    grid = lower + (uppers[:, np.newaxis] - lower) * steps
+    eligible = eligible_at(np.arange(n_rows), grid)
+
+    # Rows eligible at the cap are done; rows eligible nowhere stay at 0
+    amounts[eligible[:, -1]] = np.round(uppers[eligible[:, -1]], 2)
+    active = np.flatnonzero(eligible.any(axis=1) & ~eligible[:, -1])
+
+    # grid[last] is eligible and grid[last + 1] is not
+    last = grid.shape[1] - 1 - np.argmax(eligible[active, ::-1], axis=1)
+    lo = grid[active, last]
+    hi = grid[active, last + 1]
+
+    while len(active):
+        open_ = (hi - lo > precision) & (evaluations[active] < max_evaluations)
+        finished = active[~open_]
+        amounts[finished] = floor_amounts(lo[~open_], uppers[finished])
+        active, lo, hi = active[open_], lo[open_], hi[open_]
+        if not len(active):
+            break
+
+        n_points = int(min(refine_points, max_evaluations - evaluations[active].max()))
+        fractions = np.linspace(0.0, 1.0, n_points + 2)[1:-1]
+        points = lo[:, np.newaxis] + (hi - lo)[:, np.newaxis] * fractions
+        eligible = eligible_at(active, points)
+
+        # Narrow each bracket to the last eligible point and its right neighbour
+        found = eligible.any(axis=1)
+        last = n_points - 1 - np.argmax(eligible[:, ::-1], axis=1)
+        has_right = last + 1 < n_points
+        right = points[np.arange(len(active)), np.minimum(last + 1, n_points - 1)]
+        lo = np.where(found, points[np.arange(len(active)), last], lo)
+        hi = np.where(found, np.where(has_right, right, hi), points[:, 0])
+
+    return amounts, evaluations
+
+
+def positive_proba(model, rows: np.ndarray) -> np.ndarray:
+    """Positive-class probabilities of encoded rows"""
+    if isinstance(model, LinearScorer):
+        return model.predict_proba(rows)[:, 1]
+    # Rows are plain arrays in FEATURE_NAMES order, which check_feature_names
+    # verified against the model when it was loaded
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="X does not have valid feature names")
+        return model.predict_proba(rows)[:, 1]
+
+
+def model_proba(model) -> Callable[[np.ndarray], np.ndarray]:
+    """Positive-class probability function over encoded matrices"""
+    def proba(matrix: np.ndarray) -> np.ndarray:
+        return positive_proba(model, matrix)
+    return proba
+
+
+def probability_surface(
+    proba_fn: Callable[[np.ndarray], np.ndarray],
+    row: np.ndarray,
+    amounts: np.ndarray,
+    terms: np.ndarray,
+) -> np.ndarray:
+    """
+    Approval probability of one encoded applicant for every (term, amount)
+    pair, scored in a single call. Returns a (len(terms), len(amounts)) array.
+    """
+    amounts = np.asarray(amounts, dtype=np.float64)
+    terms = np.asarray(terms, dtype=np.float64)
+    matrix = np.repeat(row[np.newaxis, :], len(terms) * len(amounts), axis=0)
+    grid = matrix.reshape(len(terms), len(amounts), N_FEATURES)
+    grid[:, :, LOAN_AMOUNT] = np.log1p(amounts)[np.newaxis, :]
+    grid[:, :, LOAN_AMOUNT_TERM] = np.log1p(terms)[:, np.newaxis]
+    return proba_fn(matrix).reshape(len(terms), len(amounts))
+
+
+def feature_contributions(model, rows: np.ndarray) -> np.ndarray:
+    """
+    Per-feature contributions to the log-odds of approval for encoded rows,
+    as an (N, n_features) array.
+
+    Linear models get the exact weight * value terms. Other models are
+    approximated by occlusion: the drop in log-odds when a feature is set to
+    0, the same reference the linear terms use. All N * n_features occluded
+    variants are scored in one call.
+    """
+    params = linear_parameters(model)
+    if params is not None:
+        weights, _ = params
+        return rows * weights
+
+    n_rows, n_features = rows.shape
+    occluded = np.repeat(rows, n_features, axis=0).reshape(n_rows, n_features, n_features)
+    occluded[:, np.arange(n_features), np.arange(n_features)] = 0.0
+    logits = logit(positive_proba(model, np.vstack([rows, occluded.reshape(-1, n_features)])))
+    return logits[:n_rows, np.newaxis] - logits[n_rows:].reshape(n_rows, n_features)
+
+
+def rank_contributions(rows: np.ndarray, contributions: np.ndarray) -> List[List[Tuple[str, float, float]]]:
+    """(feature, encoded value, contribution) per row, largest absolute impact first"""
+    order = np.argsort(-np.abs(contributions), axis=1, kind="stable")
+    values = np.take_along_axis(rows, order, axis=1).tolist()
+    impacts = np.take_along_axis(contributions, order, axis=1).tolist()
+    return [
+        [(FEATURE_NAMES[j], value, impact) for j, value, impact in zip(row_order, row_values, row_impacts)]
+        for row_order, row_values, row_impacts in zip(order.tolist(), values, impacts)
+    ]
+
+
+def max_eligible_amounts(
+    model, rows: np.ndarray, orig_amounts: np.ndarray, cutoffs=0.0, **search_options
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Maximum eligible amounts for a block of encoded applicants, each judged
+    against its logit cutoff (one per row or shared).
+
+    Linear models are solved exactly without scoring any rows; anything else
+    goes through search_max_eligible_amounts with `search_options`.
+    Returns (amounts, evaluations), one entry per row.
+    """
+    uppers = np.asarray(orig_amounts, dtype=np.float64) + MAX_AMOUNT_SEARCH_SPAN
+    params = linear_parameters(model)
+    if params is None:
+        return search_max_eligible_amounts(
+            model_proba(model), rows, LOAN_AMOUNT, uppers, cutoffs=cutoffs, **search_options)
+
+    weights, bias = params
+    amounts = solve_max_eligible_amounts(weights, bias, rows, LOAN_AMOUNT, uppers, cutoffs)
+    return amounts, np.zeros(len(rows), dtype=np.int64)
+
+
+def eligibility_frontier(
+    model, row: np.ndarray, terms: Sequence[int], orig_amount: float, cutoff: float = 0.0, **search_options
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Maximum eligible amount of one encoded applicant for each loan term, at the logit `cutoff`.
+
+    The base row is copied once per term and all terms are solved together
+    through max_eligible_amounts. Returns (amounts, evaluations), one entry per term.
+    """
+    rows = np.repeat(row[np.newaxis, :], len(terms), axis=0)
+    rows[:, LOAN_AMOUNT_TERM] = np.log1p(np.asarray(terms, dtype=np.float64))
+    return max_eligible_amounts(
+        model, rows, np.full(len(terms), orig_amount), cutoff, **search_options)
+
+
+# Columns a counterfactual may change, in the order of its value vectors
+COUNTERFACTUAL_COLUMNS = (COAPPLICANT_INCOME, LOAN_AMOUNT_TERM, LOAN_AMOUNT, DEPENDENTS)
+
+
+def counterfactual_grid(
+    row: np.ndarray,
+    coapplicant_steps: Sequence[float] = COUNTERFACTUAL_COAPPLICANT_STEPS,
+    amount_cuts: Sequence[float] = COUNTERFACTUAL_AMOUNT_CUTS,
+    terms: Sequence[int] = FRONTIER_TERMS,
+    max_dependents: int = COUNTERFACTUAL_MAX_DEPENDENTS,
+) -> np.ndarray:
+    """
+    Raw (not log1p) values of COUNTERFACTUAL_COLUMNS for every combination of
+    candidate changes to one encoded applicant, as an (n, 4) matrix. The
+    applicant's current values are always part of the grid.
+    """
+    income = np.expm1(row[APPLICANT_INCOME])
+    coapplicant_incomes = np.expm1(row[COAPPLICANT_INCOME]) + income * np.asarray(coapplicant_steps)
+    loan_terms = np.union1d(terms, [np.expm1(row[LOAN_AMOUNT_TERM])])
+    amounts = np.expm1(row[LOAN_AMOUNT]) * (1 - np.asarray(amount_cuts))
+    dependents = np.union1d(np.arange(max_dependents + 1), [row[DEPENDENTS]])
+    grid = np.meshgrid(coapplicant_incomes, loan_terms, amounts, dependents, indexing='ij')
+    return np.stack(grid, axis=-1).reshape(-1, len(COUNTERFACTUAL_COLUMNS))
+
+
+def find_counterfactuals(
+    model, row: np.ndarray, max_results: int = 5, cutoff: float = 0.0, **grid_options
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Smallest changes to COUNTERFACTUAL_COLUMNS that make one encoded applicant
+    eligible at the logit `cutoff`. The whole counterfactual_grid is scored as
+    a single matrix.
+
+    A change's size is measured per column: co-applicant income relative to
+    the applicant's income, term and amount relative to their current values,
+    dependents in units of COUNTERFACTUAL_MAX_DEPENDENTS. Only minimal
+    candidates are kept: one is dropped when another eligible candidate makes
+    a subset of its changes, each in the same direction and no larger. The
+    rest are ordered by number of changed columns, then total size.
+
+    Returns (values, scores, evaluated): raw column values (k, 4) and scores
+    of at most `max_results` counterfactuals, and the grid size.
+    """
+    grid = counterfactual_grid(row, **grid_options)
+    rows = np.repeat(row[np.newaxis, :], len(grid), axis=0)
+    rows[:, COUNTERFACTUAL_COLUMNS] = grid
+    rows[:, [COAPPLICANT_INCOME, LOAN_AMOUNT_TERM, LOAN_AMOUNT]] = np.log1p(grid[:, :3])
+    scores, eligible = decide(model, rows, cutoff)
+
+    current = np.array([
+        np.expm1(row[COAPPLICANT_INCOME]), np.expm1(row[LOAN_AMOUNT_TERM]),
+        np.expm1(row[LOAN_AMOUNT]), row[DEPENDENTS],
+    ])
+    scale = np.maximum([
+        np.expm1(row[APPLICANT_INCOME]), current[1], current[2], COUNTERFACTUAL_MAX_DEPENDENTS,
+    ], 1e-9)
+    deltas = (grid - current) / scale
+    # Float noise from the expm1/log1p round trip is not a change
+    deltas[np.abs(deltas) < 1e-9] = 0.0
+
+    eligible = np.flatnonzero(eligible)
+    sizes = np.abs(deltas[eligible])
+    order = eligible[np.lexsort((sizes.sum(axis=1), (sizes > 0).sum(axis=1)))]
+
+    # A candidate's dominators sort before it, so one greedy pass keeps exactly the minimal ones
+    kept: List[int] = []
+    for i in order:
+        if len(kept) == max_results:
+            break
+        d = deltas[i]
+        k = deltas[kept]
+        dominated = ((k == 0) | ((np.sign(k) == np.sign(d)) & (np.abs(k) <= np.abs(d)))).all(axis=1)
+        if not dominated.any():
+            kept.append(i)
+    return grid[kept], scores[kept], len(grid)
+
+
+def score_matrix(
+    model, rows: np.ndarray, orig_amounts: Sequence[float], cutoffs=0.0, **search_options
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Scores, eligibility and max eligible amounts for encoded applicants at
+    their logit cutoffs: (scores, eligible, amounts)
+    """
+    scores, eligible = decide(model, rows, cutoffs)
+    amounts, _ = max_eligible_amounts(model, rows, orig_amounts, cutoffs, **search_options)
+    return scores, eligible, amounts
@@ -0,0 +1,100 @@
+"""
+Process-pool scoring backend.
+
+Each worker process loads the model artifact once when it starts and then
+scores encoded NumPy blocks sent to it, so CPU-heavy models no longer hold
+the API process's GIL. Callers get backpressure (a bound on requests in
+flight) and a per-call timeout.
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
+
+from scoring import load_model, score_matrix
+
+# Model loaded by _init_worker in each worker process
+_worker_model = None
+
+
+class ScoringPoolBusy(Exception):
+    """Raised when too many scoring calls are already waiting on the pool"""
+
+
+class ScoringPoolTimeout(Exception):
+    """Raised when a worker does not answer within the configured timeout"""
+
+
+def _init_worker(model_path: str, backend: str) -> None:
+    global _worker_model
+    _worker_model = load_model(model_path, backend)
+
+
+def _score_in_worker(
+    rows: np.ndarray, orig_amounts: Sequence[float], cutoffs
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    return score_matrix(_worker_model, rows, orig_amounts, cutoffs)
+
+
+def _warm_up() -> int:
+    return os.getpid()
+
+
+class ProcessPoolScorer:
+    """
+    Scores encoded applicant blocks in a pool of `workers` processes.
+
+    At most `max_pending` calls may be in flight; a caller that cannot get a
+    slot within `timeout` seconds gets ScoringPoolBusy, and a call whose
+    result does not arrive within `timeout` seconds gets ScoringPoolTimeout.
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        backend: str = "numpy",
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        timeout: float = 5.0,
+    ):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.workers * 4
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        # spawn keeps workers independent of the threads running in the API process
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(model_path, backend),
+        )
+
+    def warm_up(self) -> None:
+        """Start every worker (and load its model) before the first request"""
+        futures = [self._executor.submit(_warm_up) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+
+    def score(
+        self, rows: np.ndarray, orig_amounts: Sequence[float], cutoffs=0.0
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Same contract as scoring.score_matrix, evaluated in a worker process"""
+        if not self._slots.acquire(timeout=self.timeout):
+            raise ScoringPoolBusy(f"{self.max_pending} scoring calls already pending")
+        try:
+            future = self._executor.submit(_score_in_worker, rows, list(orig_amounts), cutoffs)
+            try:
+                return future.result(timeout=self.timeout)
+            except FutureTimeoutError:
+                future.cancel()
+                raise ScoringPoolTimeout(f"Scoring did not finish within {self.timeout}s")
+        finally:
+            self._slots.release()
+
+    def shutdown(self, cancel_pending: bool = True) -> None:
+        """Stop the workers; with cancel_pending=False queued calls are still answered first"""
+        self._executor.shutdown(wait=True, cancel_futures=cancel_pending)
@@ -0,0 +1,334 @@
+"""
+Scoring subsystem behind the /loans routes: the model registry, feature
+encoding, prediction cache, micro-batcher and optional process pool.
+
+NumPy and the scoring modules are imported here and nowhere else in the API;
+sklearn and joblib are only imported when a pickled artifact is loaded, and
+the process pool only when SCORING_EXECUTOR=process.
+"""
+import os
+import math
+import hashlib
+import threading
+import numpy as np
+from typing import List, Optional
+from fastapi import HTTPException
+from loanModel import LoanDto, LoanPredictionResponse, FeatureContribution, Counterfactual, CounterfactualChange
+from batching import MicroBatcher
+from bulk_scoring import DEFAULT_CHUNK_SIZE, ChunkedLoanScorer
+from credit_history import assess_credit_history
+from model_registry import ActiveModel, ModelRegistry
+from prediction_cache import PredictionCache
+from shadow_scoring import ShadowScorer
+from thresholds import DecisionThreshold, decision_thresholds
+from scoring import (
+    LOAN_AMOUNT, FeatureEncoder, feature_contributions,
+    rank_contributions, score_matrix
+)
+
+# Set SCORER_BACKEND=sklearn to score with the raw estimator instead of the
+# NumPy LinearScorer extracted from it
+SCORER_BACKEND = os.getenv("SCORER_BACKEND", "numpy")
+# Set SCORING_EXECUTOR=process to score /loans/predict and batches in worker
+# processes that each hold their own copy of the model
+SCORING_EXECUTOR = os.getenv("SCORING_EXECUTOR", "thread")
+
+# Identical /loans/predict payloads are answered from memory for a while
+prediction_cache = PredictionCache(
+    maxsize=int(os.getenv("PREDICTION_CACHE_SIZE", "1024")),
+    ttl=float(os.getenv("PREDICTION_CACHE_TTL", "300")),
+)
+
+
+def prepare_model(candidate: ActiveModel):
+    """Start the resources a model needs before it goes live"""
+    if SCORING_EXECUTOR == "process":
+        from scoring_pool import ProcessPoolScorer
+        pool = ProcessPoolScorer(
+            candidate.path,
+            backend=SCORER_BACKEND,
+            workers=int(os.getenv("SCORING_WORKERS", "0")) or None,
+            max_pending=int(os.getenv("SCORING_MAX_PENDING", "0")) or None,
+            timeout=float(os.getenv("SCORING_TIMEOUT", "5")),
+        )
+        pool.warm_up()
+        candidate.resources["pool"] = pool
+        print(f"Scoring pool started with {pool.workers} workers")
+
+
+def retire_model(previous: ActiveModel):
+    """Release a replaced model's resources once requests still using it are done"""
+    pool = previous.resources.get("pool")
+    if pool is not None:
+        threading.Thread(target=pool.shutdown, kwargs={"cancel_pending": False}, daemon=True).start()
+
+
+def on_model_swap(active: ActiveModel):
+    # Cached responses belong to the previous model
+    prediction_cache.clear()
+
+
+# The newest artifact matching MODEL_PATTERN in MODEL_DIR is served; the
+# directory is polled every MODEL_POLL_INTERVAL seconds (0 disables watching)
+model_registry = ModelRegistry(
+    model_dir=os.getenv("MODEL_DIR", "."),
+    pattern=os.getenv("MODEL_PATTERN", "loan_elig_predictor*"),
+    backend=SCORER_BACKEND,
+    poll_interval=float(os.getenv("MODEL_POLL_INTERVAL", "10")),
+    prepare=prepare_model,
+    retire=retire_model,
+    on_swap=on_model_swap,
+)
+
+
+def start():
+    """Load the model and start the background workers; called on app startup"""
+    model_registry.reload()
+    model_registry.start_watching()
+    if MICRO_BATCHING:
+        micro_batcher.start()
+    if shadow_scorer is not None:
+        try:
+            shadow_scorer.start()
+        except Exception as e:
+            # A broken challenger must not keep the live model from serving
+            print(f"Error starting shadow scoring: {e}")
+
+
+def stop():
+    """Stop the background workers; called on app shutdown"""
+    model_registry.stop_watching()
+    micro_batcher.stop()
+    if shadow_scorer is not None:
+        shadow_scorer.stop()
+    active = model_registry.active
+    if active is not None and "pool" in active.resources:
+        active.resources["pool"].shutdown()
+
+
+def require_model() -> ActiveModel:
+    """The live model for this request, or 503 while none is loaded"""
+    active = model_registry.active
+    if active is None:
+        raise HTTPException(status_code=503, detail="Model not available")
+    return active
+
+
+feature_encoder = FeatureEncoder(assess_credit_history)
+
+
+def process_loan_data_for_prediction(loan: LoanDto):
+    """Process loan data into the (1, 11) float64 matrix expected by the model"""
+    return feature_encoder.encode(loan)
+
+
+def find_maximum_eligible_amount(
+    loan: LoanDto,
+    orig_amount: float,
+    active: Optional[ActiveModel] = None,
+    threshold: DecisionThreshold = decision_thresholds.default
+):
+    """
+    Find the maximum eligible loan amount (in thousands), the score at the requested
+    amount and whether it clears `threshold`. For the logistic model the boundary
+    is solved in closed form in logit space; other models fall back to the batched
+    bracket-and-bisect search in scoring.py.
+    Returns (max_eligible_amount, original_score, eligible)
+    """
+    active = active or model_registry.active
+    if active is None:
+        return 0.0, 0.0, False
+    # Encode the applicant once, at the requested amount
+    loan_data = process_loan_data_for_prediction(loan)
+    loan_data[0, LOAN_AMOUNT] = math.log1p(orig_amount)
+    if micro_batcher.running:
+        # Scored together with whatever other requests arrive in the same window
+        proba, eligible, max_amount = micro_batcher.submit(
+            (active, loan_data[0], orig_amount, threshold.cutoff)).result()
+        return max_amount, proba, eligible
+    scores, eligible, max_amounts = score_loan_matrix(active, loan_data, [orig_amount], threshold.cutoff)
+    return float(max_amounts[0]), float(scores[0]), bool(eligible[0])
+
+
+def score_loan_matrix(active: ActiveModel, loan_data, requested_amounts, cutoffs=0.0):
+    """
+    Score encoded applicants against their logit cutoffs and find their max
+    eligible amounts: (scores, eligible, max_amounts)
+    """
+    pool = active.resources.get("pool")
+    if pool is None:
+        return score_matrix(active.model, loan_data, requested_amounts, cutoffs)
+    from scoring_pool import ScoringPoolBusy, ScoringPoolTimeout
+    try:
+        return pool.score(loan_data, requested_amounts, cutoffs)
+    except ScoringPoolBusy:
+        raise HTTPException(status_code=503, detail="Scoring is busy, please retry shortly")
+    except ScoringPoolTimeout:
+        raise HTTPException(status_code=504, detail="Scoring timed out")
+
+
+def score_loan_rows(items):
+    """
+    MicroBatcher callback: [(active model, encoded row, requested amount, cutoff)] ->
+    [(score, eligible, max eligible amount)]. Rows are scored by the model their
+    request started with, so a batch spanning a hot reload is split per model.
+    """
+    results = [None] * len(items)
+    by_model = {}
+    for i, (active, _, _, _) in enumerate(items):
+        by_model.setdefault(id(active), (active, []))[1].append(i)
+    for active, indexes in by_model.values():
+        scores, eligible, max_amounts = score_loan_matrix(
+            active,
+            np.stack([items[i][1] for i in indexes]),
+            [items[i][2] for i in indexes],
+            np.array([items[i][3] for i in indexes]),
+        )
+        for i, score, row_eligible, max_amount in zip(
+                indexes, scores.tolist(), eligible.tolist(), max_amounts.tolist()):
+            results[i] = (score, row_eligible, max_amount)
+    return results
+
+
+# Set MICRO_BATCHING=1 to coalesce concurrent /loans/predict calls into one model call
+MICRO_BATCHING = os.getenv("MICRO_BATCHING", "0") == "1"
+micro_batcher = MicroBatcher(
+    score_loan_rows,
+    max_batch_size=int(os.getenv("MICRO_BATCH_MAX_SIZE", "32")),
+    max_wait=float(os.getenv("MICRO_BATCH_MAX_WAIT_MS", "2")) / 1000,
+)
+
+
+# Rows per model call for /loans/predict/stream; bounds its memory per request
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", str(DEFAULT_CHUNK_SIZE)))
+
+
+def chunked_loan_scorer(active: ActiveModel, threshold: DecisionThreshold) -> ChunkedLoanScorer:
+    """A per-request chunk scorer pinned to one model and threshold"""
+    return ChunkedLoanScorer(
+        feature_encoder,
+        lambda loan_data, amounts: score_loan_matrix(active, loan_data, amounts, threshold.cutoff),
+        STREAM_CHUNK_SIZE,
+    )
+
+
+# Set SHADOW_MODEL_PATH to score a sample of /loans/predict and /scoring/save
+# traffic with a challenger model in the background. Keep the challenger out of
+# MODEL_DIR/MODEL_PATTERN, or the registry will serve it.
+SHADOW_MODEL_PATH = os.getenv("SHADOW_MODEL_PATH")
+shadow_scorer = ShadowScorer(
+    SHADOW_MODEL_PATH,
+    champion=lambda: model_registry.active,
+    encoder=feature_encoder,
+    backend=SCORER_BACKEND,
+    sample_rate=float(os.getenv("SHADOW_SAMPLE_RATE", "0.1")),
+    store_path=os.getenv("SHADOW_STORE_PATH", "shadow_scores.sqlite3"),
+    queue_size=int(os.getenv("SHADOW_QUEUE_SIZE", "10000")),
+    flush_size=int(os.getenv("SHADOW_FLUSH_SIZE", "256")),
+    flush_interval=float(os.getenv("SHADOW_FLUSH_INTERVAL", "5")),
+) if SHADOW_MODEL_PATH else None
+
+
+def shadow_score_loan(loan: LoanDto, served_score: float, threshold: DecisionThreshold):
+    if shadow_scorer is not None:
+        shadow_scorer.offer("loans/predict", loan, served_score, threshold.cutoff)
+
+
+def shadow_score_assessment(assessment, threshold: DecisionThreshold):
+    """
+    Queue a saved credit assessment for shadow scoring at the threshold it
+    was decided with, using its stored credit history flag
+    """
+    if shadow_scorer is None or not shadow_scorer.should_sample():
+        return
+    loan = LoanDto.model_construct(
+        gender=assessment.gender,
+        maritalStatus=assessment.maritalStatus,
+        dependents=assessment.dependents,
+        education=assessment.education,
+        employmentStatus=assessment.employmentStatus,
+        income=assessment.income,
+        coApplicantIncome=assessment.coApplicantIncome,
+        loanAmount=assessment.amount,
+        loanTerm=assessment.term,
+        creditHistory=assessment.creditHistory,
+        propertyArea=assessment.propertyArea,
+        bankTransactions=None,
+        lendingHistory=None,
+        loanPurpose=None,
+    )
+    shadow_scorer.submit("scoring/save", loan, assessment.creditHistory, assessment.score, threshold.cutoff)
+
+
+def prediction_cache_key(loan: LoanDto, model_version: str, threshold_name: str, explain: bool = False):
+    """Canonical cache key for a loan: the model version and threshold plus a digest of every field"""
+    digest = hashlib.blake2b(loan.model_dump_json().encode(), digest_size=16).hexdigest()
+    return model_version, threshold_name, digest, explain
+
+
+def explain_loan_matrix(model, loan_data) -> List[List[FeatureContribution]]:
+    """Ranked per-feature contributions for every encoded applicant, computed in one pass"""
+    ranked = rank_contributions(loan_data, feature_contributions(model, loan_data))
+    return [
+        [FeatureContribution(feature=feature, value=value, contribution=impact)
+         for feature, value, impact in row]
+        for row in ranked
+    ]
+
+
+def build_prediction_response(
+    loan: LoanDto,
+    orig_score: float,
+    eligible: bool,
+    max_amount: float,
+    threshold: DecisionThreshold,
+    contributions: Optional[List[FeatureContribution]] = None,
+    model_version: Optional[str] = None
+) -> LoanPredictionResponse:
+    """Turn a decision and max eligible amount into the API response with its explanation"""
+
+    # Explanation logic
+    if eligible:
+        if max_amount > loan.loanAmount:
+            explanation = f"Congratulations! You are eligible for the requested loan of XAF {loan.loanAmount*1000:,.0f}. You are also eligible for loans up to XAF {max_amount*1000:,.0f}."
+        else:
+            explanation = f"Congratulations! You are eligible for the requested loan of XAF {loan.loanAmount*1000:,.0f}."
+    elif max_amount > 0:
+        explanation = f"You are {orig_score*100:.2f}% eligible for the requested loan of XAF {loan.loanAmount*1000:,.0f}. However, you are 100% eligible for loans up to XAF {max_amount*1000:,.0f}."
+    else:
+        explanation = f"Unfortunately, you are not eligible for the requested loan of XAF {loan.loanAmount*1000:,.0f} based on the current criteria. Please consider improving your financial profile or applying for a smaller amount."
+
+    return LoanPredictionResponse(
+        eligible=eligible,
+        originalScore=float(orig_score),
+        eligibilityPercentage=round(orig_score*100, 2),
+        maxEligibleAmount=max_amount,
+        requestedAmount=loan.loanAmount,
+        explanation=explanation,
+        threshold=threshold.probability,
+        thresholdName=threshold.name,
+        contributions=contributions,
+        modelVersion=model_version
+    )
+
+
+def build_counterfactuals(loan: LoanDto, values, scores) -> List[Counterfactual]:
+    """
+    Turn find_counterfactuals output into API models. Co-applicant income is
+    rounded up and amounts down to 2 decimals so the loans stay eligible.
+    """
+    counterfactuals = []
+    for (coapplicant_income, term, amount, dependents), score in zip(values.tolist(), scores.tolist()):
+        proposed = {
+            "coApplicantIncome": math.ceil(round(coapplicant_income * 100, 6)) / 100,
+            "loanTerm": int(round(term)),
+            "loanAmount": math.floor(round(amount * 100, 6)) / 100,
+            "dependents": int(round(dependents)),
+        }
+        changes = [
+            CounterfactualChange(field=field, fromValue=getattr(loan, field), toValue=value)
+            for field, value in proposed.items() if value != getattr(loan, field)
+        ]
+        counterfactuals.append(Counterfactual(
+            changes=changes, score=score, loan=loan.model_copy(update=proposed)))
+    return counterfactuals
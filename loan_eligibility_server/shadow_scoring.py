@@ -0,0 +1,217 @@
+"""
+Champion/challenger shadow scoring.
+
+A sample of live traffic is handed to a ShadowScorer, which scores it with
+both the live (champion) model and a challenger model on a background
+thread and flushes the score pairs in bulk to a local SQLite store for
+comparison. The request path only pays for a random draw and a non-blocking
+queue put; when the queue is full the sample is dropped.
+"""
+import queue
+import random
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from scoring import CREDIT_HISTORY, FeatureEncoder, artifact_version, load_model, score_matrix
+
+CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS shadow_scores (
+    scored_at TEXT NOT NULL,
+    source TEXT NOT NULL,
+    champion_version TEXT,
+    challenger_version TEXT NOT NULL,
+    requested_amount REAL NOT NULL,
+    served_score REAL,
+    champion_score REAL,
+    challenger_score REAL NOT NULL,
+    champion_max_amount REAL,
+    challenger_max_amount REAL NOT NULL
+)
+"""
+
+INSERT = "INSERT INTO shadow_scores VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+# (source, loan, credit history override, score served to the caller, logit cutoff it was served at)
+ShadowItem = Tuple[str, Any, Optional[bool], Optional[float], float]
+
+
+class ShadowScorer:
+    """
+    Scores sampled loans with `champion()` (the live ActiveModel, or None)
+    and the challenger artifact at `challenger_path`.
+
+    `sample_rate` is the fraction of offered loans that get shadow scored.
+    The worker scores up to `flush_size` queued loans per batch and writes
+    them to `store_path` in one transaction, at least every `flush_interval`
+    seconds while traffic is arriving.
+    """
+
+    def __init__(
+        self,
+        challenger_path: str,
+        champion: Callable[[], Any],
+        encoder: FeatureEncoder,
+        backend: str = "numpy",
+        sample_rate: float = 0.1,
+        store_path: str = "shadow_scores.sqlite3",
+        queue_size: int = 10000,
+        flush_size: int = 256,
+        flush_interval: float = 5.0,
+    ):
+        self.challenger_path = challenger_path
+        self.champion = champion
+        self.encoder = encoder
+        self.backend = backend
+        self.sample_rate = sample_rate
+        self.store_path = store_path
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.challenger = None
+        self.challenger_version: Optional[str] = None
+        self._queue: "queue.Queue[Optional[ShadowItem]]" = queue.Queue(maxsize=queue_size)
+        self._thread: Optional[threading.Thread] = None
+        # offered, sampled and dropped are bumped from concurrent request threads
+        self._counts_lock = threading.Lock()
+        self.offered = 0
+        self.sampled = 0
+        self.dropped = 0
+        self.scored = 0
+        self.stored = 0
+        self.disagreements = 0
+        self.last_error: Optional[str] = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Load the challenger and start the worker; raises if the challenger cannot be loaded"""
+        if self.running:
+            return
+        self.challenger = load_model(self.challenger_path, self.backend)
+        self.challenger_version = artifact_version(self.challenger_path)
+        with sqlite3.connect(self.store_path) as store:
+            store.execute(CREATE_TABLE)
+        self._thread = threading.Thread(target=self._run, name="shadow-scorer", daemon=True)
+        self._thread.start()
+        print(f"Shadow scoring challenger {self.challenger_version} on {self.sample_rate:.0%} of traffic")
+
+    def stop(self) -> None:
+        """Stop the worker after scoring and storing everything already queued"""
+        if not self.running:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def should_sample(self) -> bool:
+        with self._counts_lock:
+            self.offered += 1
+        return self.running and random.random() < self.sample_rate
+
+    def submit(
+        self, source: str, loan: Any, credit_history: Optional[bool] = None, served_score: Optional[float] = None,
+        cutoff: float = 0.0,
+    ) -> None:
+        """
+        Queue one loan without blocking. `credit_history` overrides the flag
+        the encoder would derive, for records that store it directly; `cutoff`
+        is the logit cutoff of the threshold the caller was served at, which
+        both models are judged against.
+        """
+        try:
+            self._queue.put_nowait((source, loan, credit_history, served_score, cutoff))
+        except queue.Full:
+            with self._counts_lock:
+                self.dropped += 1
+            return
+        with self._counts_lock:
+            self.sampled += 1
+
+    def offer(self, source: str, loan: Any, served_score: Optional[float] = None, cutoff: float = 0.0) -> None:
+        """Queue a loan for shadow scoring with probability sample_rate"""
+        if self.should_sample():
+            self.submit(source, loan, served_score=served_score, cutoff=cutoff)
+
+    def _run(self) -> None:
+        store = sqlite3.connect(self.store_path)
+        try:
+            stopping = False
+            while not stopping:
+                batch: List[ShadowItem] = []
+                deadline = time.monotonic() + self.flush_interval
+                while len(batch) < self.flush_size:
+                    try:
+                        item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+                if batch:
+                    try:
+                        self._store(store, self._score(batch))
+                    except Exception as e:
+                        self.last_error = str(e)
+                        print(f"Shadow scoring error: {e}")
+        finally:
+            store.close()
+
+    def _score(self, batch: List[ShadowItem]) -> List[tuple]:
+        loans = [loan for _, loan, _, _, _ in batch]
+        rows = self.encoder.encode_many(loans)
+        for i, (_, _, credit_history, _, _) in enumerate(batch):
+            if credit_history is not None:
+                rows[i, CREDIT_HISTORY] = 1.0 if credit_history else 0.0
+        amounts = [loan.loanAmount for loan in loans]
+        cutoffs = np.array([cutoff for *_, cutoff in batch], dtype=np.float64)
+
+        challenger_scores, challenger_eligible, challenger_amounts = score_matrix(
+            self.challenger, rows, amounts, cutoffs)
+        champion = self.champion()
+        if champion is not None:
+            champion_scores, champion_eligible, champion_amounts = score_matrix(champion.model, rows, amounts, cutoffs)
+            self.disagreements += int(np.sum(champion_eligible != challenger_eligible))
+        else:
+            champion_scores = champion_amounts = [None] * len(batch)
+        self.scored += len(batch)
+
+        scored_at = datetime.utcnow().isoformat()
+        return [
+            (scored_at, source, champion.version if champion else None, self.challenger_version,
+             amount, served_score, _optional_float(champion_score), float(challenger_score),
+             _optional_float(champion_amount), float(challenger_amount))
+            for (source, _, _, served_score, _), amount, champion_score, challenger_score, champion_amount,
+            challenger_amount in zip(
+                batch, amounts, champion_scores, challenger_scores, champion_amounts, challenger_amounts)
+        ]
+
+    def _store(self, store: sqlite3.Connection, records: List[tuple]) -> None:
+        with store:
+            store.executemany(INSERT, records)
+        self.stored += len(records)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "challenger_version": self.challenger_version,
+            "sample_rate": self.sample_rate,
+            "offered": self.offered,
+            "sampled": self.sampled,
+            "dropped": self.dropped,
+            "pending": self._queue.qsize(),
+            "scored": self.scored,
+            "stored": self.stored,
+            "decision_disagreements": self.disagreements,
+            "last_error": self.last_error,
+        }
+
+
+def _optional_float(value) -> Optional[float]:
+    return None if value is None else float(value)
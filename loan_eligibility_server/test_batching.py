@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the /loans/predict micro-batcher
+"""
+
+import time
+
+import pytest
+
+from batching import MicroBatcher
+
+
+class RecordingScorer:
+    """score_batch that doubles its items and remembers every batch it saw"""
+
+    def __init__(self, fail_on=None):
+        self.batches = []
+        self.fail_on = fail_on
+
+    def __call__(self, items):
+        self.batches.append(list(items))
+        if self.fail_on is not None and self.fail_on in items:
+            raise ValueError(f"cannot score {self.fail_on}")
+        return [item * 2 for item in items]
+
+
+@pytest.fixture
+def make_batcher():
+    batchers = []
+
+    def make(score_batch, **options):
+        batcher = MicroBatcher(score_batch, **options)
+        batcher.start()
+        batchers.append(batcher)
+        return batcher
+
+    yield make
+    for batcher in batchers:
+        batcher.stop()
+
+
+def test_full_batch_is_flushed_without_waiting(make_batcher):
+    scorer = RecordingScorer()
+    # The window is far longer than the test may take, so only a full batch can flush it
+    batcher = make_batcher(scorer, max_batch_size=4, max_wait=30.0)
+    started = time.perf_counter()
+
+    futures = [batcher.submit(item) for item in range(4)]
+
+    assert [future.result(timeout=5) for future in futures] == [0, 2, 4, 6]
+    assert time.perf_counter() - started < 5
+    assert scorer.batches == [[0, 1, 2, 3]]
+
+
+def test_partial_batch_is_flushed_after_max_wait(make_batcher):
+    scorer = RecordingScorer()
+    batcher = make_batcher(scorer, max_batch_size=100, max_wait=0.05)
+    started = time.perf_counter()
+
+    futures = [batcher.submit(item) for item in range(3)]
+
+    assert [future.result(timeout=5) for future in futures] == [0, 2, 4]
+    assert time.perf_counter() - started >= 0.05
+    assert scorer.batches == [[0, 1, 2]]
+    assert batcher.stats()["batches"] == 1
+    assert batcher.stats()["items"] == 3
+
+
+def test_scoring_errors_reach_every_future_in_the_batch(make_batcher):
+    scorer = RecordingScorer(fail_on=1)
+    batcher = make_batcher(scorer, max_batch_size=3, max_wait=30.0)
+
+    futures = [batcher.submit(item) for item in range(3)]
+
+    for future in futures:
+        with pytest.raises(ValueError, match="cannot score 1"):
+            future.result(timeout=5)
+    # The worker survives and scores the next batch
+    futures = [batcher.submit(item) for item in range(5, 8)]
+    assert [future.result(timeout=5) for future in futures] == [10, 12, 14]
+
+
+def test_stop_scores_queued_items():
+    scorer = RecordingScorer()
+    batcher = MicroBatcher(scorer, max_batch_size=100, max_wait=30.0)
+    batcher.start()
+    futures = [batcher.submit(item) for item in range(3)]
+
+    batcher.stop()
+
+    assert [future.result(timeout=0) for future in futures] == [0, 2, 4]
+    assert not batcher.running
+
+
+def test_submit_requires_a_running_batcher():
+    with pytest.raises(RuntimeError):
+        MicroBatcher(RecordingScorer()).submit(1)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Tests for parsing streamed NDJSON and CSV bodies
+"""
+
+import asyncio
+
+import pytest
+
+# bulk_scoring validates records as LoanDto, which imports the generated client's enums
+pytest.importorskip("prisma.models")
+
+from bulk_scoring import (  # noqa: E402
+    INVALID_UTF8, MAX_CSV_RECORD_LINES, aiter_csv_rows, aiter_lines, parse_csv_row, parse_ndjson_line,
+)
+
+
+async def body(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+def collect(iterator):
+    async def run():
+        return [item async for item in iterator]
+    return asyncio.run(run())
+
+
+def test_lines_split_across_chunks():
+    lines = collect(aiter_lines(body(b'\xef\xbb\xbf{"a": 1}\r\n{"b"', b': 2}\n', b'{"c": 3}')))
+
+    assert lines == [('{"a": 1}', True), ('{"b": 2}', True), ('{"c": 3}', True)]
+
+
+def test_undecodable_line_is_an_error_row():
+    # The second line is Latin-1, and its bytes are split across chunks
+    lines = collect(aiter_lines(body(b'{"a": 1}\n{"name": "Am\xe9', b'lie"}\n{"c": 3}\n')))
+
+    assert [valid for _, valid in lines] == [True, False, True]
+    assert [parse_ndjson_line(line, valid) for line, valid in lines] == [{"a": 1}, INVALID_UTF8, {"c": 3}]
+
+
+def test_quoted_newlines_stay_in_one_csv_record():
+    csv_body = b'income,notes\n4000,"first line\r\nsecond ""quoted"" line"\n\n5000,plain\n'
+    rows = collect(aiter_csv_rows(aiter_lines(body(csv_body))))
+
+    assert rows == [["income", "notes"], ["4000", 'first line\nsecond "quoted" line'], ["5000", "plain"]]
+    assert parse_csv_row(rows[0], rows[2]) == {"income": "5000", "notes": "plain"}
+
+
+def test_bad_csv_records_are_error_rows():
+    csv_body = b'income,notes\n4000,caf\xe9\n5000,ok\n6000,"never closed\n7000,x\n'
+    rows = collect(aiter_csv_rows(aiter_lines(body(csv_body))))
+
+    assert rows[:3] == [["income", "notes"], INVALID_UTF8, ["5000", "ok"]]
+    assert rows[3] == "Quoted field not closed at end of body"
+    assert len(rows) == 4
+
+
+def test_unclosed_quote_is_bounded():
+    lines = [b'1,"open'] + [b'more'] * (MAX_CSV_RECORD_LINES + 5) + [b'2,next']
+    rows = collect(aiter_csv_rows(aiter_lines(body(b"\n".join(lines)))))
+
+    assert rows[0] == f"Quoted field not closed within {MAX_CSV_RECORD_LINES} lines"
+    assert rows[-1] == ["2", "next"]
+
+
+def test_csv_row_column_count_is_checked():
+    assert parse_csv_row(["a", "b"], ["1"]) == "Expected 2 columns, got 1"
+    assert parse_csv_row(["a", "b"], ["1", ""]) == {"a": "1"}
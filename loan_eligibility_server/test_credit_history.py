@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for the table-driven credit history assessment
+"""
+
+import enum
+import itertools
+import os
+import subprocess
+import sys
+
+from credit_history import LENDING_FREQUENCIES, LOAN_PURPOSES, TRANSACTION_FREQUENCIES, assess_credit_history
+
+
+def test_single_credit_history_assessment_does_not_import_numpy():
+    # The profile routes assess one applicant at a time and must not pull NumPy into auth/profile workers
+    code = (
+        "import sys; from credit_history import assess_credit_history; "
+        "assert assess_credit_history('OVER_5', 'LESS_THAN_5', 'EDUCATION') is True; "
+        "assert assess_credit_history(None, 'LESS_THAN_5', 'EDUCATION') is False; "
+        "assert 'numpy' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(__file__) or ".", check=True)
+
+
+def if_elif_assessment(bank_transactions, lending_history, loan_purpose) -> bool:
+    """The rules assess_credit_history implemented before the lookup table"""
+    if not all([bank_transactions, lending_history, loan_purpose]):
+        return False
+    score = 0
+    if bank_transactions == 'OVER_5':
+        score += 40
+    elif bank_transactions == 'LESS_THAN_5':
+        score += 20
+    if lending_history == 'LESS_THAN_5':
+        score += 35
+    elif lending_history == 'OVER_5':
+        score += 15
+    score += {
+        'BUSINESS_INVESTMENT': 25, 'EDUCATION': 20, 'BUILDING_PURCHASE': 18, 'CAR_PURCHASE': 15,
+        'RENTS_AND_BILLS': 10, 'MEDICAL_EMERGENCY': 8, 'OTHER': 5,
+    }[loan_purpose]
+    return score >= 60
+
+
+# Every combination of levels, plus each answer missing in turn
+COMBINATIONS = list(itertools.product(
+    TRANSACTION_FREQUENCIES + (None,), LENDING_FREQUENCIES + (None,), LOAN_PURPOSES + (None,)))
+
+
+def test_table_matches_if_elif_rules():
+    for bank, lending, purpose in COMBINATIONS:
+        assert assess_credit_history(bank, lending, purpose) is if_elif_assessment(bank, lending, purpose), \
+            (bank, lending, purpose)
+
+
+def test_assess_many_matches_if_elif_rules():
+    bank, lending, purpose = zip(*COMBINATIONS)
+    expected = [if_elif_assessment(*combination) for combination in COMBINATIONS]
+
+    assert assess_credit_history.assess_many(bank, lending, purpose).tolist() == expected
+
+
+def test_unknown_levels_assess_as_false():
+    assert assess_credit_history('OVER_5', 'LESS_THAN_5', 'HOLIDAY') is False
+    assert assess_credit_history.assess_many(['OVER_5'], ['LESS_THAN_5'], ['HOLIDAY']).tolist() == [False]
+
+
+def test_enum_members_assess_like_their_values():
+    # The routes pass prisma enum members, which are str Enums
+    Frequency = enum.Enum('Frequency', {level: level for level in TRANSACTION_FREQUENCIES}, type=str)
+    Purpose = enum.Enum('Purpose', {level: level for level in LOAN_PURPOSES}, type=str)
+    for bank, lending, purpose in itertools.product(Frequency, Frequency, Purpose):
+        assert assess_credit_history(bank, lending, purpose) is if_elif_assessment(bank.value, lending.value, purpose.value)
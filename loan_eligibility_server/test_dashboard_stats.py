@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Tests for /dashboard/stats on rows shaped like the Prisma client's raw query results
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+# The router imports the generated client's models; skip where it was not generated
+pytest.importorskip("prisma.models")
+
+from prisma._raw_query import deserialize_raw_results  # noqa: E402
+
+from routers.dashboard import get_dashboard_stats  # noqa: E402
+
+COLUMNS = [
+    "totalScoresPerformed", "totalScoresReceived", "totalLoansTracked", "successfulRepayments", "pendingLoans",
+    "id", "score", "createdAt", "decisionStatus", "fullName", "email",
+]
+TYPES = ["bigint"] * 5 + ["string", "double", "datetime", "enum", "string", "string"]
+COUNTS = ["6", "2", "3", "2", "1"]
+
+
+class RawQueryDb:
+    """Answers query_raw the way Prisma does: engine rows through deserialize_raw_results"""
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def query_raw(self, query, *args):
+        return deserialize_raw_results({"columns": COLUMNS, "types": TYPES, "rows": self.rows})
+
+
+def dashboard_stats(rows):
+    return asyncio.run(get_dashboard_stats(SimpleNamespace(id="user-1"), RawQueryDb(rows)))
+
+
+def test_counts_and_recent_scores():
+    stats = dashboard_stats([
+        COUNTS + ["a2", 0.72, "2026-01-02T10:00:00+00:00", "AWARDED", None, "jane@example.com"],
+        COUNTS + ["a1", None, "2026-01-01T09:30:00+00:00", None, "John Doe", "john@example.com"],
+    ])
+
+    assert (stats.totalScoresPerformed, stats.totalScoresReceived, stats.totalLoansTracked,
+            stats.successfulRepayments, stats.pendingLoans) == (6, 2, 3, 2, 1)
+    assert [(s.id, s.scoredUserName, s.score, s.date, s.decisionStatus) for s in stats.recentScores] == [
+        ("a2", "jane", 0.72, "2026-01-02T10:00:00+00:00", "AWARDED"),
+        ("a1", "John Doe", 0.0, "2026-01-01T09:30:00+00:00", None),
+    ]
+
+
+def test_no_recent_scores():
+    stats = dashboard_stats([["0", "1", "0", "1", "0"] + [None] * 6])
+
+    assert stats.totalScoresReceived == 1
+    assert stats.recentScores == []
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Parity tests between scoring.FeatureEncoder and the pandas encoding it replaced
+"""
+
+import enum
+import itertools
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+
+from credit_history import LENDING_FREQUENCIES, LOAN_PURPOSES, TRANSACTION_FREQUENCIES, assess_credit_history
+from scoring import FEATURE_NAMES, FeatureEncoder
+
+
+def str_enum(name: str, levels) -> enum.Enum:
+    # Stand-in for the generated prisma.enums, which are str Enums
+    return enum.Enum(name, {level: level for level in levels}, type=str)
+
+
+# Levels in prisma/schema.prisma order
+Gender = str_enum('Gender', ('MALE', 'FEMALE', 'OTHER'))
+MaritalStatus = str_enum('MaritalStatus', ('SINGLE', 'MARRIED', 'DIVORCED', 'WIDOWED'))
+Education = str_enum('Education', ('GRADUATE', 'NOT_GRADUATE'))
+EmploymentStatus = str_enum('EmploymentStatus', ('EMPLOYED', 'SELF_EMPLOYED', 'UNEMPLOYED', 'STUDENT'))
+PropertyArea = str_enum('PropertyArea', ('URBAN', 'SEMIURBAN', 'RURAL'))
+TransactionFrequency = str_enum('TransactionFrequency', TRANSACTION_FREQUENCIES)
+LendingFrequency = str_enum('LendingFrequency', LENDING_FREQUENCIES)
+LoanPurpose = str_enum('LoanPurpose', LOAN_PURPOSES)
+
+
+def pandas_encoding(loan) -> pd.DataFrame:
+    """process_loan_data_for_prediction as it was before FeatureEncoder"""
+    calculated_credit_history = assess_credit_history(
+        loan.bankTransactions, loan.lendingHistory, loan.loanPurpose)
+    data = {
+        'Gender': 1 if loan.gender == Gender.MALE else 0,
+        'Married': 1 if loan.maritalStatus == MaritalStatus.MARRIED else 0,
+        'Dependents': loan.dependents,
+        'Education': 1 if loan.education == Education.GRADUATE else 0,
+        'Self_Employed': 1 if loan.employmentStatus == EmploymentStatus.SELF_EMPLOYED else 0,
+        'ApplicantIncome': loan.income,
+        'CoapplicantIncome': loan.coApplicantIncome,
+        'LoanAmount': loan.loanAmount,
+        'Loan_Amount_Term': loan.loanTerm,
+        'Credit_History': 1 if calculated_credit_history else 0,
+        'Property_Area': 0 if loan.propertyArea == PropertyArea.RURAL else 1 if loan.propertyArea == PropertyArea.URBAN else 2,
+    }
+    df = pd.DataFrame([data])
+    df['ApplicantIncome'] = np.log1p(df['ApplicantIncome'])
+    df['CoapplicantIncome'] = np.log1p(df['CoapplicantIncome'])
+    df['LoanAmount'] = np.log1p(df['LoanAmount'])
+    df['Loan_Amount_Term'] = np.log1p(df['Loan_Amount_Term'])
+    return df
+
+
+def every_loan():
+    """
+    Every combination of the demographic enums and, separately, of the
+    credit history answers including missing ones, with varied numbers
+    """
+    rng = np.random.default_rng(0)
+    demographics = list(itertools.product(Gender, MaritalStatus, Education, EmploymentStatus, PropertyArea))
+    credit = list(itertools.product(
+        list(TransactionFrequency) + [None], list(LendingFrequency) + [None], list(LoanPurpose) + [None]))
+    combinations = (
+        list(zip(demographics, itertools.cycle(credit))) + list(zip(itertools.cycle(demographics), credit)))
+    for (gender, marital, education, employment, area), (bank, lending, purpose) in combinations:
+        yield SimpleNamespace(
+            gender=gender, maritalStatus=marital, dependents=int(rng.integers(0, 4)), education=education,
+            employmentStatus=employment, income=float(rng.uniform(1, 20000)),
+            coApplicantIncome=float(rng.choice([0.0, rng.uniform(0, 10000)])),
+            loanAmount=float(rng.uniform(1, 700)), loanTerm=int(rng.choice([12, 36, 60, 180, 360])),
+            creditHistory=bool(rng.integers(0, 2)), propertyArea=area,
+            bankTransactions=bank, lendingHistory=lending, loanPurpose=purpose,
+        )
+
+
+def test_encoder_matches_pandas_encoding():
+    loans = list(every_loan())
+    expected = pd.concat([pandas_encoding(loan) for loan in loans], ignore_index=True)
+    encoder = FeatureEncoder(assess_credit_history)
+
+    assert tuple(expected.columns) == FEATURE_NAMES
+    expected = expected.to_numpy(dtype=np.float64)
+    np.testing.assert_array_equal(np.vstack([encoder.encode(loan) for loan in loans]), expected)
+    np.testing.assert_array_equal(encoder.encode_many(loans), expected)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Parity tests between scoring.LinearScorer and sklearn's LogisticRegression
+"""
+
+import json
+import os
+import subprocess
+import sys
+import warnings
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from scoring import (
+    FEATURE_NAMES, N_FEATURES, LinearScorer, decide, linear_parameters, load_model, positive_proba, smoke_rows,
+)
+from thresholds import DecisionThreshold
+
+MODEL_PATH = os.path.join(os.path.dirname(__file__), "loan_elig_predictor_new")
+
+
+def fitted_model(multi_class: str = "deprecated") -> LogisticRegression:
+    X = smoke_rows(500, seed=1)
+    y = (X[:, 5] - X[:, 7] + X[:, 9] > 3).astype(int)
+    model = LogisticRegression(max_iter=1000)
+    if multi_class != "deprecated":
+        model.set_params(multi_class=multi_class)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        return model.fit(X, y)
+
+
+@pytest.mark.parametrize("multi_class", ["deprecated", "ovr", "multinomial"])
+def test_predict_proba_matches_sklearn(multi_class):
+    model = fitted_model(multi_class)
+    scorer = LinearScorer.from_sklearn(model)
+    X = smoke_rows(500)
+
+    np.testing.assert_allclose(scorer.predict_proba(X), model.predict_proba(X), rtol=0, atol=1e-12)
+    np.testing.assert_array_equal(scorer.predict(X), model.predict(X))
+
+
+def test_shipped_model_parity():
+    if not os.path.exists(MODEL_PATH):
+        pytest.skip("model artifact not available")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        model = joblib.load(MODEL_PATH)
+    scorer = LinearScorer.from_sklearn(model)
+    X = smoke_rows(500)
+
+    assert tuple(scorer.feature_names_in_) == FEATURE_NAMES
+    np.testing.assert_allclose(scorer.predict_proba(X)[:, 1], positive_proba(model, X), rtol=0, atol=1e-12)
+
+
+def test_importing_scoring_leaves_warning_filters_alone():
+    # The feature-name warning is only silenced around sklearn calls, not process-wide
+    code = (
+        "import warnings, numpy; before = list(warnings.filters); import scoring; "
+        "assert warnings.filters == before"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=os.path.dirname(__file__) or ".", check=True)
+
+
+def test_extreme_logits_do_not_overflow():
+    scorer = LinearScorer(np.ones(N_FEATURES), 0.0)
+    X = np.full((2, N_FEATURES), 1e3)
+    X[1] *= -1
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        proba = scorer.predict_proba(X)
+    np.testing.assert_array_equal(proba[:, 1], [1.0, 0.0])
+
+
+def test_non_linear_models_are_not_extracted():
+    assert LinearScorer.from_sklearn(object()) is None
+    assert linear_parameters(object()) is None
+
+
+def test_json_artifact_round_trip(tmp_path):
+    scorer = LinearScorer.from_sklearn(fitted_model("multinomial"))
+    path = str(tmp_path / "model.json")
+    scorer.save(path, source_version="abc")
+    loaded = load_model(path)
+    X = smoke_rows(500)
+
+    assert isinstance(loaded, LinearScorer)
+    assert tuple(loaded.feature_names_in_) == FEATURE_NAMES
+    np.testing.assert_array_equal(loaded.predict_proba(X), scorer.predict_proba(X))
+
+
+def test_json_artifact_rejects_tampering(tmp_path):
+    path = tmp_path / "model.json"
+    LinearScorer(np.ones(N_FEATURES), 0.0).save(str(path))
+    artifact = json.loads(path.read_text())
+    artifact["intercept"] = 1.0
+    path.write_text(json.dumps(artifact))
+
+    with pytest.raises(ValueError, match="checksum"):
+        LinearScorer.load(str(path))
+
+
+def test_json_artifact_loads_without_sklearn(tmp_path):
+    path = str(tmp_path / "model.json")
+    LinearScorer(np.ones(N_FEATURES), 0.0).save(path)
+    code = (
+        "import sys; from scoring import load_model; load_model(sys.argv[1]); "
+        "assert 'sklearn' not in sys.modules and 'joblib' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code, path], cwd=os.path.dirname(__file__) or ".", check=True)
+
+
+@pytest.mark.parametrize("probability", [0.3, 0.5, 0.8])
+def test_logit_cutoff_matches_probability_threshold(probability):
+    model = fitted_model()
+    X = smoke_rows(500, seed=4)
+    threshold = DecisionThreshold.from_probability("test", probability)
+    # The logit shortcut and the sklearn probability path agree with a plain comparison
+    for scorer in (LinearScorer.from_sklearn(model), model):
+        scores, eligible = decide(scorer, X, threshold.cutoff)
+        np.testing.assert_array_equal(eligible, model.predict_proba(X)[:, 1] >= probability)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Brute-force checks of the maximum eligible amount solver and search
+"""
+
+import os
+import warnings
+
+import numpy as np
+import pytest
+from sklearn.ensemble import HistGradientBoostingClassifier
+
+from scoring import (
+    LOAN_AMOUNT, MAX_AMOUNT_SEARCH_SPAN, N_FEATURES, SEARCH_MAX_EVALUATIONS, SEARCH_PRECISION, LinearScorer,
+    decide, linear_parameters, load_model, max_eligible_amounts, model_proba, search_max_eligible_amounts,
+    smoke_rows, solve_max_eligible_amounts,
+)
+
+MODEL_PATH = os.path.join(os.path.dirname(__file__), "loan_elig_predictor_new")
+
+
+def shipped_model() -> LinearScorer:
+    if not os.path.exists(MODEL_PATH):
+        pytest.skip("model artifact not available")
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return load_model(MODEL_PATH)
+
+
+def boosted_model() -> HistGradientBoostingClassifier:
+    """A non-linear model whose probability never rises with the loan amount"""
+    rows = smoke_rows(2000, seed=6)
+    rows[:, LOAN_AMOUNT] = np.log1p(np.random.default_rng(6).uniform(0.0, 500.0, size=len(rows)))
+    labels = (rows[:, 5] + 2 * rows[:, 9] - 1.5 * rows[:, LOAN_AMOUNT] + 0.3 * np.sin(3 * rows[:, 6]) > 2.5)
+    monotonic = [0] * N_FEATURES
+    monotonic[LOAN_AMOUNT] = -1
+    return HistGradientBoostingClassifier(max_iter=50, monotonic_cst=monotonic, random_state=0).fit(rows, labels)
+
+
+def eligible_at(model, row: np.ndarray, amounts: np.ndarray, cutoff: float) -> np.ndarray:
+    """Eligibility of one encoded applicant at each of `amounts`, as /loans/* decide it"""
+    matrix = np.repeat(row[np.newaxis], len(amounts), axis=0)
+    matrix[:, LOAN_AMOUNT] = np.log1p(amounts)
+    return decide(model, matrix, cutoff)[1]
+
+
+def brute_force_max_amount(model, row: np.ndarray, upper: float, cutoff: float) -> float:
+    """Highest eligible amount on the 0.01 grid up to `upper`, or 0 when none is"""
+    cents = np.arange(int(round(upper * 100)) + 1) / 100
+    eligible = eligible_at(model, row, cents, cutoff)
+    return float(cents[eligible].max()) if eligible.any() else 0.0
+
+
+@pytest.mark.parametrize("cutoff", [-1.0, 0.0, 1.0])
+def test_solver_matches_brute_force_on_shipped_model(cutoff):
+    model = shipped_model()
+    rows = smoke_rows(64, seed=3)
+    orig_amounts = np.random.default_rng(3).uniform(1.0, 400.0, size=len(rows))
+    uppers = orig_amounts + MAX_AMOUNT_SEARCH_SPAN
+
+    amounts, evaluations = max_eligible_amounts(model, rows, orig_amounts, cutoff)
+
+    assert not evaluations.any()
+    for row, upper, amount in zip(rows, uppers, amounts):
+        assert amount == pytest.approx(brute_force_max_amount(model, row, upper, cutoff), abs=1e-9)
+        if amount > 0:
+            assert eligible_at(model, row, np.array([amount]), cutoff).all()
+        if 0 < amount < round(upper, 2):
+            assert not eligible_at(model, row, np.array([amount + 0.01]), cutoff).any()
+
+
+def test_solver_without_eligible_amount_returns_zero():
+    model = shipped_model()
+    rows = smoke_rows(8)
+    # No applicant reaches a probability of sigmoid(50)
+    amounts, _ = max_eligible_amounts(model, rows, np.full(len(rows), 50.0), 50.0)
+
+    np.testing.assert_array_equal(amounts, 0.0)
+
+
+def test_solver_caps_amounts_at_upper():
+    model = shipped_model()
+    rows = smoke_rows(8)
+    orig_amounts = np.full(len(rows), 12.345)
+    # Every applicant clears a probability of sigmoid(-50) at any amount
+    amounts, _ = max_eligible_amounts(model, rows, orig_amounts, -50.0)
+
+    np.testing.assert_array_equal(amounts, round(12.345 + MAX_AMOUNT_SEARCH_SPAN, 2))
+
+
+@pytest.mark.parametrize("amount_weight", [0.5, 0.0])
+def test_solver_when_amount_does_not_lower_the_score(amount_weight):
+    weights = np.full(N_FEATURES, 0.1)
+    weights[LOAN_AMOUNT] = amount_weight
+    model = LinearScorer(weights, -1.0)
+    rows = smoke_rows(32, seed=5)
+    uppers = np.full(len(rows), 150.0)
+    cutoff = float(np.median(rows @ weights - 1.0))
+
+    amounts = solve_max_eligible_amounts(*linear_parameters(model), rows, LOAN_AMOUNT, uppers, cutoff)
+
+    for row, upper, amount in zip(rows, uppers, amounts):
+        assert amount == brute_force_max_amount(model, row, upper, cutoff)
+
+
+@pytest.mark.parametrize("cutoff", [-1.0, 0.0, 1.0])
+def test_search_matches_brute_force_on_boosted_model(cutoff):
+    model = boosted_model()
+    rows = smoke_rows(16, seed=7)
+    uppers = np.random.default_rng(7).uniform(1.0, 100.0, size=len(rows)) + MAX_AMOUNT_SEARCH_SPAN
+
+    amounts, evaluations = search_max_eligible_amounts(model_proba(model), rows, LOAN_AMOUNT, uppers, cutoffs=cutoff)
+
+    assert (evaluations <= SEARCH_MAX_EVALUATIONS).all()
+    for row, upper, amount in zip(rows, uppers, amounts):
+        expected = brute_force_max_amount(model, row, upper, cutoff)
+        if amount > 0:
+            assert eligible_at(model, row, np.array([amount]), cutoff).all()
+        # The search stops once the boundary is bracketed within SEARCH_PRECISION and rounds down
+        assert 0.0 <= expected - amount <= SEARCH_PRECISION + 1e-9
+
+
+def test_search_honours_max_evaluations():
+    model = boosted_model()
+    rows = smoke_rows(32, seed=8)
+    uppers = np.full(len(rows), 300.0)
+
+    for max_evaluations in (10, 40, 100):
+        amounts, evaluations = search_max_eligible_amounts(
+            model_proba(model), rows, LOAN_AMOUNT, uppers, precision=1e-9, max_evaluations=max_evaluations)
+
+        assert (evaluations <= max_evaluations).all()
+        assert (evaluations == max_evaluations).any()
+        eligible = [eligible_at(model, row, np.array([amount]), 0.0)[0] for row, amount in zip(rows, amounts)]
+        assert all(eligible[i] for i in np.flatnonzero(amounts > 0))
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for keyset pagination of the credit assessment lists
+"""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from pagination import PAGE_ORDER, Page, decode_cursor, encode_cursor
+
+START = datetime(2026, 1, 5, 9, 30, tzinfo=timezone.utc)
+
+
+def matches(row, where) -> bool:
+    """Evaluate the subset of Prisma's where syntax that Page produces"""
+    for key, condition in where.items():
+        if key == "AND":
+            if not all(matches(row, part) for part in condition):
+                return False
+        elif key == "OR":
+            if not any(matches(row, part) for part in condition):
+                return False
+        elif isinstance(condition, dict):
+            if not getattr(row, key) < condition["lt"]:
+                return False
+        elif getattr(row, key) != condition:
+            return False
+    return True
+
+
+def find_many(rows, where, order, take):
+    """The rows the client returns for Page.find_many_args"""
+    assert order == PAGE_ORDER
+    ordered = sorted(rows, key=lambda row: (row.createdAt, row.id), reverse=True)
+    return [row for row in ordered if matches(row, where)][:take]
+
+
+def assessments(n: int):
+    # Several rows share each createdAt, so ids decide their order
+    return [
+        SimpleNamespace(
+            id=f"{i:04x}", createdAt=START + timedelta(milliseconds=i // 3),
+            scorerId="scorer-1" if i % 4 else "scorer-2")
+        for i in range(n)
+    ]
+
+
+def all_pages(rows, where, limit: int):
+    pages, cursor = [], None
+    while True:
+        page = Page(limit, decode_cursor(cursor) if cursor else None)
+        items, cursor = page.split(find_many(rows, **page.find_many_args(where)))
+        pages.append(items)
+        if cursor is None:
+            return pages
+
+
+def test_cursor_round_trip():
+    created_at = START + timedelta(microseconds=123000)
+    cursor = encode_cursor(created_at, "c0ffee")
+
+    assert decode_cursor(cursor) == (created_at, "c0ffee")
+    assert "=" not in cursor
+
+
+@pytest.mark.parametrize("cursor", ["", "not a cursor", encode_cursor(START, "x")[:-3], "WyJ4Il0"])
+def test_invalid_cursors_raise_value_error(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 7, 50])
+def test_pages_cover_every_row_once_in_order(limit):
+    rows = assessments(40)
+    where = {"scorerId": "scorer-1"}
+
+    pages = all_pages(rows, where, limit)
+
+    expected = find_many(rows, where, PAGE_ORDER, len(rows))
+    assert [row.id for page in pages for row in page] == [row.id for row in expected]
+    assert all(len(page) == limit for page in pages[:-1])
+    assert 0 < len(pages[-1]) <= limit
+
+
+def test_created_at_ties_are_broken_by_id():
+    # Three rows created in the same millisecond, split across pages
+    rows = [SimpleNamespace(id=i, createdAt=START) for i in ("a", "b", "c")]
+
+    pages = all_pages(rows, {}, 1)
+
+    assert [[row.id for row in page] for page in pages] == [["c"], ["b"], ["a"]]
+
+
+def test_last_page_has_no_next_cursor():
+    rows = assessments(6)
+    page = Page(6)
+
+    items, next_cursor = page.split(find_many(rows, **page.find_many_args({})))
+
+    assert len(items) == 6
+    assert next_cursor is None
+
+
+def test_invalid_cursor_is_a_400():
+    # dependencies imports the generated client's models; skip where it was not generated
+    pytest.importorskip("prisma.models")
+    from fastapi import HTTPException
+
+    from dependencies import get_page
+
+    with pytest.raises(HTTPException) as excinfo:
+        get_page(limit=10, cursor="not a cursor")
+    assert excinfo.value.status_code == 400
+    assert get_page(limit=10, cursor=encode_cursor(START, "x")).after == (START, "x")
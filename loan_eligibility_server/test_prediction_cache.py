@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the /loans/predict response cache
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+import prediction_cache
+from prediction_cache import PredictionCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """A monotonic clock the test advances by hand"""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(prediction_cache, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = PredictionCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    # Reading "a" makes "b" the least recently used
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats() == {"size": 2, "maxsize": 2, "hits": 3, "misses": 1, "evictions": 1}
+
+
+def test_put_refreshes_an_existing_key():
+    cache = PredictionCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.put("a", 10)
+    cache.put("c", 3)
+
+    assert cache.get("a") == 10
+    assert cache.get("b") is None
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = PredictionCache(maxsize=4, ttl=60.0)
+    cache.put("a", 1)
+    clock.value += 30.0
+    cache.put("b", 2)
+
+    clock.value += 30.0
+    assert cache.get("a") == 1  # exactly at its expiry time
+    clock.value += 0.001
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size"] == 1
+
+
+def test_reading_does_not_extend_ttl(clock):
+    cache = PredictionCache(ttl=10.0)
+    cache.put("a", 1)
+    for _ in range(3):
+        clock.value += 4.0
+        cache.get("a")
+
+    assert cache.get("a") is None
+
+
+def test_zero_maxsize_disables_caching():
+    cache = PredictionCache(maxsize=0)
+    cache.put("a", 1)
+
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_clear_drops_every_entry():
+    cache = PredictionCache()
+    cache.put("a", 1)
+    cache.clear()
+
+    assert cache.get("a") is None
@@ -113,7 +113,7 @@ class APITester:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = response.json()["items"]  # First page
                 print(f"✅ Retrieved {len(data)} credit assessments")
                 for assessment in data[:2]:  # Show first 2
                     print(f"   ID: {assessment['id']}, Score: {assessment.get('score', 'N/A')}")
@@ -155,7 +155,7 @@ class APITester:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = response.json()["items"]  # First page
                 print(f"✅ Retrieved {len(data)} pending assessments")
                 return True
             else:
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Tests for champion/challenger shadow scoring
+"""
+
+import sqlite3
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+
+from credit_history import assess_credit_history
+from scoring import LOAN_AMOUNT, N_FEATURES, FeatureEncoder, LinearScorer, max_eligible_amounts
+from shadow_scoring import ShadowScorer
+
+
+def loan(amount: float) -> SimpleNamespace:
+    return SimpleNamespace(
+        gender='MALE', maritalStatus='MARRIED', dependents=1, education='GRADUATE',
+        employmentStatus='EMPLOYED', income=4000.0, coApplicantIncome=1500.0, loanAmount=amount,
+        loanTerm=360, creditHistory=True, propertyArea='URBAN',
+        bankTransactions='OVER_5', lendingHistory='LESS_THAN_5', loanPurpose='EDUCATION',
+    )
+
+
+def shadow_scorer(tmp_path, **options) -> ShadowScorer:
+    weights = np.full(N_FEATURES, 0.1)
+    weights[LOAN_AMOUNT] = -0.7
+    path = str(tmp_path / "challenger.json")
+    LinearScorer(weights, 1.0).save(path)
+    champion = SimpleNamespace(model=LinearScorer(weights, 1.0), version="champion")
+    return ShadowScorer(
+        path, champion=lambda: champion, encoder=FeatureEncoder(assess_credit_history),
+        store_path=str(tmp_path / "shadow.sqlite3"), flush_interval=0.01, **options)
+
+
+def test_loans_are_judged_at_the_cutoff_they_were_served_at(tmp_path):
+    scorer = shadow_scorer(tmp_path)
+    scorer.start()
+    for cutoff in (-1.0, 0.0, 1.0):
+        scorer.submit("loans/predict", loan(150.0), served_score=0.5, cutoff=cutoff)
+    scorer.stop()
+
+    with sqlite3.connect(scorer.store_path) as store:
+        stored = [row[0] for row in store.execute("SELECT challenger_max_amount FROM shadow_scores ORDER BY rowid")]
+    rows = scorer.encoder.encode_many([loan(150.0)] * 3)
+    expected, _ = max_eligible_amounts(scorer.challenger, rows, [150.0] * 3, np.array([-1.0, 0.0, 1.0]))
+    assert stored == expected.tolist()
+    assert len(set(stored)) == 3
+    assert scorer.last_error is None
+
+
+def test_counters_are_exact_under_concurrent_requests(tmp_path):
+    scorer = shadow_scorer(tmp_path, queue_size=100)
+
+    def request_many():
+        for _ in range(1000):
+            # Counted as offered; never sampled while the worker is not running
+            scorer.offer("loans/predict", loan(100.0))
+            # Queued until the queue holds 100, dropped after that
+            scorer.submit("scoring/save", loan(100.0))
+
+    threads = [threading.Thread(target=request_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert scorer.offered == 8000
+    assert scorer.sampled == 100
+    assert scorer.dropped == 7900
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Tests for named decision thresholds
+"""
+
+import numpy as np
+import pytest
+
+from scoring import N_FEATURES, LinearScorer, decide
+from thresholds import DecisionThreshold, ThresholdRegistry
+
+
+def test_scorer_threshold_resolution():
+    registry = ThresholdRegistry({"scorer-1": 0.7, "microloan": 0.6})
+    # An explicit name wins, then the scorer's own threshold, then the default
+    assert registry.for_scorer("scorer-1", "microloan").name == "microloan"
+    assert registry.for_scorer("scorer-1").probability == 0.7
+    assert registry.for_scorer("scorer-2").name == "default"
+    assert registry.for_scorer("scorer-1", "unknown") is None
+
+
+@pytest.mark.parametrize("probability", [0.3, 0.5, 0.55, 0.8])
+def test_saved_decision_matches_served_decision_at_boundary(probability):
+    threshold = DecisionThreshold.from_probability("test", probability)
+    # Margins straddling the cut-off; /loans/* decides on the margin, /scoring/save on the stored score
+    offsets = np.array([-1e-6, -1e-9, -1e-12, 1e-12, 1e-9, 1e-6])
+    rows = np.zeros((len(offsets), N_FEATURES))
+    rows[:, 0] = offsets
+    weights = np.zeros(N_FEATURES)
+    weights[0] = 1.0
+    scores, eligible = decide(LinearScorer(weights, threshold.cutoff), rows, threshold.cutoff)
+
+    assert eligible.tolist() == [False, False, False, True, True, True]
+    assert [threshold.admits(score) for score in scores.tolist()] == eligible.tolist()
+    # A score exactly at the threshold's probability is eligible
+    assert threshold.admits(probability)
+
+
+def test_admits_degenerate_scores():
+    threshold = DecisionThreshold.from_probability("test", 0.5)
+    assert not threshold.admits(0.0)
+    assert threshold.admits(1.0)
@@ -0,0 +1,93 @@
+"""
+Named decision thresholds for lenders and loan products.
+
+Each threshold is a probability cut-off that is converted once, when the
+configuration is loaded, into a cut-off on the model's logit. Eligibility is
+then a single comparison against the raw linear score (see scoring.decide).
+
+Thresholds come from the DECISION_THRESHOLDS environment variable, a JSON
+object mapping names (a product name or a scorer's user id) to probabilities,
+e.g. {"microloan": 0.6, "3f0c...": 0.55}. "default" is always defined and
+falls back to scoring.ELIGIBILITY_THRESHOLD.
+"""
+import json
+import math
+import os
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+DEFAULT_THRESHOLD_NAME = "default"
+
+# Same value as scoring.ELIGIBILITY_THRESHOLD, kept here so this module stays free of NumPy
+DEFAULT_PROBABILITY = 0.5
+
+
+@dataclass(frozen=True)
+class DecisionThreshold:
+    name: str
+    probability: float
+    # logit(probability): the decision is `raw linear score >= cutoff`
+    cutoff: float
+
+    @classmethod
+    def from_probability(cls, name: str, probability: float) -> 'DecisionThreshold':
+        if not 0.0 < probability < 1.0:
+            raise ValueError(f"Threshold {name!r} must be a probability strictly between 0 and 1, got {probability}")
+        return cls(name, float(probability), _logit(probability))
+
+    def admits(self, score: float) -> bool:
+        """
+        Whether a stored positive-class probability clears this threshold.
+        Decided on the logit scale against `cutoff`, like /loans/* decide on
+        the raw linear score, so a saved decision matches the one served.
+        """
+        if score <= 0.0:
+            return False
+        if score >= 1.0:
+            return True
+        return _logit(score) >= self.cutoff
+
+
+def _logit(p: float) -> float:
+    return math.log(p) - math.log1p(-p)
+
+
+class ThresholdRegistry:
+    """Named DecisionThresholds, precomputed once from a {name: probability} mapping"""
+
+    def __init__(self, probabilities: Optional[Mapping[str, float]] = None):
+        probabilities = {DEFAULT_THRESHOLD_NAME: DEFAULT_PROBABILITY, **(probabilities or {})}
+        self._thresholds: Dict[str, DecisionThreshold] = {
+            name: DecisionThreshold.from_probability(name, probability)
+            for name, probability in probabilities.items()
+        }
+
+    @classmethod
+    def from_env(cls, variable: str = "DECISION_THRESHOLDS") -> 'ThresholdRegistry':
+        spec = os.getenv(variable)
+        if not spec:
+            return cls()
+        probabilities = json.loads(spec)
+        if not isinstance(probabilities, dict):
+            raise ValueError(f"{variable} must be a JSON object of name: probability")
+        return cls({str(name): float(probability) for name, probability in probabilities.items()})
+
+    @property
+    def default(self) -> DecisionThreshold:
+        return self._thresholds[DEFAULT_THRESHOLD_NAME]
+
+    def get(self, name: Optional[str]) -> Optional[DecisionThreshold]:
+        """The named threshold, the default for None, or None for an unknown name"""
+        return self.default if name is None else self._thresholds.get(name)
+
+    def for_scorer(self, scorer_id: str, name: Optional[str] = None) -> Optional[DecisionThreshold]:
+        """`name` if given, else the scorer's own threshold if one is configured, else the default"""
+        if name is None and scorer_id in self._thresholds:
+            name = scorer_id
+        return self.get(name)
+
+    def names(self):
+        return sorted(self._thresholds)
+
+
+decision_thresholds = ThresholdRegistry.from_env()